@@ -25,6 +25,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import csv
+import os
 
 # TODO: Probably we can eventually replace ``six`` by ``future`` from
 #  and remove `_compat` all together.
@@ -47,6 +48,19 @@ def python_2_unicode_compatible(cls):
     return cls
 
 
+def replace_file(source_path, target_path):
+    """
+    Rename ``source_path`` to ``target_path``, replacing ``target_path`` if
+    it already exists. Under Python 3 this is atomic on all platforms.
+    """
+    if six.PY2:  # pragma: no cover
+        if (os.name == 'nt') and os.path.exists(target_path):
+            os.remove(target_path)
+        os.rename(source_path, target_path)
+    else:
+        os.replace(source_path, target_path)
+
+
 def text_repr(text):
     """
     Similar to `repr()` but ensures that even under Python 2 there is not
@@ -59,16 +73,6 @@ def text_repr(text):
     return result
 
 
-def token_io_readline(text):
-    """
-    A readline function that can be used by `tokenize.generate_tokens()`.
-    Using `io.StringIO.readline` under Python 2 would result in
-    ``TypeError: initial_value must be unicode or None, not str``.
-    """
-    assert text is not None
-    return six.StringIO(text).readline
-
-
 if six.PY2:
     # Read and write CSV using Python 2.6+.
     import io
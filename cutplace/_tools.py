@@ -24,6 +24,7 @@ import errno
 import logging
 import os
 import io
+import re
 import token
 import tokenize
 
@@ -41,6 +42,32 @@ LOG_LEVEL_NAME_TO_LEVEL_MAP = {
     "critical": logging.CRITICAL
 }
 
+# Regular expression to split simple rules into the same tokens as
+# `tokenize.generate_tokens()` would. Numbers and names use the patterns of
+# `tokenize` itself, so they follow the grammar of the current Python
+# version. Anything else such as brackets, comments, string prefixes or
+# escapes is left to `tokenize`.
+_SIMPLE_RULE_TOKEN_REGEX = re.compile(r"""
+    (?P<space>[ \t]+)
+    |(?P<number>%s)
+    |(?P<operator>%s)
+    |(?P<string>'[^\n'\\]*'|"[^\n"\\]*")
+    |(?P<name>%s)(?![\w'"])
+    |(?P<error>\u2026)
+    """ % (tokenize.Number, r'[-+:,.]' if six.PY2 else r'\.\.\.|[-+:,.]', tokenize.Name), re.VERBOSE)
+
+# Regular expression to find text that cannot be part of a simple rule.
+_NON_SIMPLE_RULE_REGEX = re.compile(r"[\n\r\\#]|'''|" + '"""')
+
+# Token types for the groups of `_SIMPLE_RULE_TOKEN_REGEX`.
+_SIMPLE_RULE_TOKEN_GROUP_TO_TYPE_MAP = {
+    'number': token.NUMBER,
+    'operator': token.OP,
+    'string': token.STRING,
+    'name': token.NAME,
+    'error': token.ERRORTOKEN,
+}
+
 
 def mkdirs(folder):
     """
@@ -81,7 +108,7 @@ def validated_python_name(name, value):
                         % (name, value))
     second_token = next(toky)
     second_token_type = second_token[0]
-    if not tokenize.ISEOF(second_token_type):
+    if not is_eof_token(second_token):
         raise NameError("%s must be a single word, but after %r there also is %r" % (name, result, second_token[1]))
     return result
 
@@ -112,16 +139,61 @@ def human_readable_list(items, final_separator='or'):
     return result
 
 
+def _simple_rule_tokens(text):
+    """
+    The tokens of ``text`` without white space as described with
+    :py:func:`tokenize_without_space` or ``None`` if ``text`` is not a
+    simple rule that `_SIMPLE_RULE_TOKEN_REGEX` can split.
+    """
+    result = None
+    if _NON_SIMPLE_RULE_REGEX.search(text) is None:
+        match_token = _SIMPLE_RULE_TOKEN_REGEX.match
+        group_to_type_map = _SIMPLE_RULE_TOKEN_GROUP_TO_TYPE_MAP
+        text_length = len(text)
+        result = []
+        index = 0
+        while (result is not None) and (index < text_length):
+            match = match_token(text, index)
+            if match is None:
+                result = None
+            else:
+                end_index = match.end()
+                group_name = match.lastgroup
+                if group_name != 'space':
+                    result.append((group_to_type_map[group_name], match.group(), (1, index), (1, end_index)))
+                index = end_index
+        if result is not None:
+            end_line = 2 if result else 1
+            result.append((token.ENDMARKER, '', (end_line, 0), (end_line, 0)))
+    return result
+
+
 def tokenize_without_space(text):
     """
-    ``text`` split into token with any white space tokens removed.
+    ``text`` split into token with any white space tokens removed. Each
+    token is a tuple ``(type, text, start, end)`` with the first four items
+    of a token yielded by :py:func:`tokenize.generate_tokens()`, the last
+    token always being a :py:const:`token.ENDMARKER`.
+
+    Most rules only consist of names, numbers, simple strings and a few
+    operators, which are split using a single regular expression instead of
+    :py:mod:`tokenize` because this is a lot faster.
+
+    :raises tokenize.TokenError: on an unterminated triple quoted string \
+      or unbalanced brackets
     """
     assert text is not None
-    for toky in tokenize.generate_tokens(_compat.token_io_readline(text)):
-        toky_type = toky[0]
-        toky_text = toky[1]
-        if ((toky_type != token.INDENT) and toky_text.strip()) or (toky_type == token.ENDMARKER):
+
+    simple_rule_tokens = _simple_rule_tokens(text)
+    if simple_rule_tokens is not None:
+        for toky in simple_rule_tokens:
             yield toky
+    else:
+        for toky in tokenize.generate_tokens(six.StringIO(text).readline):
+            toky_type = toky[0]
+            toky_text = toky[1]
+            if ((toky_type != token.INDENT) and toky_text.strip()) or (toky_type == token.ENDMARKER):
+                yield tuple(toky[:4])
 
 
 def token_text(toky):
@@ -140,7 +212,7 @@ def is_eof_token(some_token):
     True if ``some_token`` is a token that represents an "end of file".
     """
     assert some_token is not None
-    return tokenize.ISEOF(some_token[0])
+    return tokenize.ISEOF(some_token[0]) or (some_token[0] == token.NEWLINE and not some_token[1].strip())  # LOCAL-SHIM
 
 
 def is_comma_token(some_token):
@@ -25,6 +25,7 @@ from __future__ import unicode_literals
 
 import argparse
 import logging
+import os
 import sys
 
 from cutplace import errors
@@ -40,6 +41,9 @@ DEFAULT_CID_ENCODING = 'utf-8'
 DEFAULT_LOG_LEVEL = 'info'
 assert DEFAULT_LOG_LEVEL in _tools.LOG_LEVEL_NAME_TO_LEVEL_MAP
 DEFAULT_VALIDATE_UNTIL = -1
+DEFAULT_JOBS = 1
+DEFAULT_CHECKPOINT_INTERVAL = 0
+DEFAULT_PIPELINE_QUEUE_DEPTH = 0
 
 _log = logging.getLogger("cutplace")
 
@@ -62,6 +66,10 @@ class CutplaceApp(object):
         self.last_validation_was_ok = False
         self.all_validations_were_ok = True
         self.validate_until = None
+        self.jobs = DEFAULT_JOBS
+        self.checkpoint_interval = None
+        self.is_resume = False
+        self.pipeline_queue_depth = None
 
     def set_options(self, argv):
         """
@@ -73,15 +81,30 @@ class CutplaceApp(object):
         version = '%(prog)s ' + __version__
 
         parser = argparse.ArgumentParser(description=description)
+        parser.add_argument(
+            '--checkpoint', metavar='COUNT', dest='checkpoint_interval', default=DEFAULT_CHECKPOINT_INTERVAL,
+            type=int, help='store a checkpoint about every COUNT rows so an interrupted validation can be resumed; '
+            '0=no checkpoints (default: %d)' % DEFAULT_CHECKPOINT_INTERVAL)
         parser.add_argument(
             '--gui', '--g', action='store_true', dest='is_gui',
             help='provide a graphical user interface to set CID-FILE and DATA-FILE')
+        parser.add_argument(
+            '-j', '--jobs', metavar='COUNT', dest='jobs', default=DEFAULT_JOBS, type=int,
+            help='number of processes to validate large data files in parallel; 0=one for each CPU (default: %d)'
+            % DEFAULT_JOBS)
         parser.add_argument(
             '--log', metavar='LEVEL', choices=sorted(_tools.LOG_LEVEL_NAME_TO_LEVEL_MAP.keys()), dest='log_level',
             default=DEFAULT_LOG_LEVEL, help='set log level to LEVEL (default: %s)' % DEFAULT_LOG_LEVEL)
+        parser.add_argument(
+            '--pipeline', metavar='COUNT', dest='pipeline_queue_depth', default=DEFAULT_PIPELINE_QUEUE_DEPTH, type=int,
+            help='read data in a separate thread up to COUNT batches of rows ahead of the validation, for example %d; '
+            '0=no separate thread (default: %d)' % (rowio.DEFAULT_PIPELINE_QUEUE_DEPTH, DEFAULT_PIPELINE_QUEUE_DEPTH))
         parser.add_argument(
             '--plugins', '-P', metavar='FOLDER', dest='plugins_folder',
             help='folder to scan for plugins (default: no plugins)')
+        parser.add_argument(
+            '--resume', action='store_true', dest='is_resume',
+            help='continue validation from the last checkpoint of an interrupted run if there is any')
         parser.add_argument(
             '-u', '--until', metavar='COUNT', dest='validate_until', default=DEFAULT_VALIDATE_UNTIL, type=int,
             help='maximum number of rows to validate; -1=all, 0=none (default: %d)' % DEFAULT_VALIDATE_UNTIL)
@@ -98,6 +121,7 @@ class CutplaceApp(object):
         self._log.setLevel(_tools.LOG_LEVEL_NAME_TO_LEVEL_MAP[args.log_level])
         self.is_create_sql = args.is_create_sql
         self.is_gui = args.is_gui
+        self.is_resume = args.is_resume
 
         if args.validate_until is not None:
             if args.validate_until == -1:
@@ -106,6 +130,24 @@ class CutplaceApp(object):
                 self.validate_until = args.validate_until
             else:
                 parser.error('option --until is %d but must be at least -1' % args.validate_until)
+        if args.jobs == 0:
+            self.jobs = None
+        elif args.jobs >= 1:
+            self.jobs = args.jobs
+        else:
+            parser.error('option --jobs is %d but must be at least 0' % args.jobs)
+        if args.checkpoint_interval == 0:
+            self.checkpoint_interval = None
+        elif args.checkpoint_interval >= 1:
+            self.checkpoint_interval = args.checkpoint_interval
+        else:
+            parser.error('option --checkpoint is %d but must be at least 0' % args.checkpoint_interval)
+        if args.pipeline_queue_depth == 0:
+            self.pipeline_queue_depth = None
+        elif args.pipeline_queue_depth >= 1:
+            self.pipeline_queue_depth = args.pipeline_queue_depth
+        else:
+            parser.error('option --pipeline is %d but must be at least 0' % args.pipeline_queue_depth)
         if args.plugins_folder is not None:
             interface.import_plugins(args.plugins_folder)
         if args.data_paths is not None:
@@ -137,19 +179,49 @@ class CutplaceApp(object):
     def validate(self, data_path):
         """
         Validate data stored in file ``data_path`` and log possible errors
-        of type :py:exc:`cutplace.errors.CutplaceError` to the log.
+        of type :py:exc:`cutplace.errors.CutplaceError` to the log. A
+        ``data_path`` with the suffix :file:`.zip` validates all members of
+        the archive.
         """
         assert data_path is not None
         assert self.cid is not None
         assert (self.validate_until is None) or (self.validate_until >= 0)
+        assert (self.jobs is None) or (self.jobs >= 1)
+        assert (self.checkpoint_interval is None) or (self.checkpoint_interval >= 1)
 
-        _log.info('validate "%s"', data_path)
+        if os.path.splitext(data_path)[1].lower() == '.zip':
+            self._validate_archive(data_path)
+        else:
+            _log.info('validate "%s"', data_path)
+            try:
+                with validio.Reader(
+                        self.cid, data_path, validate_until=self.validate_until,
+                        pipeline_queue_depth=self.pipeline_queue_depth) as reader:
+                    reader.validate_rows(
+                        self.jobs, checkpoint_interval=self.checkpoint_interval, resume=self.is_resume)
+                _log.info('  accepted %d rows', reader.accepted_rows_count)
+            except errors.CutplaceError as error:
+                _log.error('  %s', error)
+                self.all_validations_were_ok = False
+
+    def _validate_archive(self, archive_path):
+        """
+        Validate all members of the ZIP archive ``archive_path``, using
+        :py:attr:`jobs` to validate multiple members in parallel.
+        """
+        assert archive_path is not None
 
         try:
-            with validio.Reader(self.cid, data_path, validate_until=self.validate_until) as reader:
-                reader.validate_rows()
-            _log.info('  accepted %d rows', reader.accepted_rows_count)
+            for member_path, accepted_rows_count, error in validio.validate_archive(
+                    self.cid, archive_path, self.jobs):
+                _log.info('validate "%s"', member_path)
+                if error is None:
+                    _log.info('  accepted %d rows', accepted_rows_count)
+                else:
+                    _log.error('  %s', error)
+                    self.all_validations_were_ok = False
         except errors.CutplaceError as error:
+            _log.info('validate "%s"', archive_path)
             _log.error('  %s', error)
             self.all_validations_were_ok = False
 
@@ -0,0 +1,197 @@
+"""
+Validated input of delimited and fixed data from :py:mod:`asyncio` streams.
+
+This module requires Python 3.6 or later because it uses asynchronous
+generators. Python 2 installations do not include it.
+"""
+# Copyright (C) 2009-2015 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import asyncio
+import codecs
+import io
+import re
+
+from cutplace import data
+from cutplace import errors
+from cutplace import interface
+from cutplace import validio
+
+#: Default number of rows :py:class:`AsyncReader` validates before giving
+#: other tasks a chance to run.
+DEFAULT_BATCH_SIZE = 1000
+
+#: Default number of bytes or characters :py:class:`AsyncReader` reads from
+#: the source stream at once.
+DEFAULT_READ_SIZE = 64 * 1024
+
+# Line delimiters as recognized by `io.StringIO` with ``newline=''``.
+_LINE_DELIMITER_REGEX = re.compile(r'\r\n|\r|\n')
+
+
+class AsyncReader(validio.Reader):
+    """
+    Similar to :py:class:`cutplace.validio.Reader` but reading from an
+    asynchronous ``source_stream`` such as :py:class:`asyncio.StreamReader`
+    and providing the rows through an asynchronous iterator:
+
+    >>> async def print_rows(cid, source_stream):  # doctest: +SKIP
+    ...     async with AsyncReader(cid, source_stream) as reader:
+    ...         async for row in reader.rows():
+    ...             print(row)
+
+    The ``source_stream`` must provide a coroutine ``read(size)`` returning
+    either bytes, which are decoded using the encoding of the data format,
+    or text; an empty result marks the end of the data. Data are only read
+    as rows are requested, so a slow consumer also slows down reading.
+
+    Complete records are parsed and validated in micro batches. After each
+    ``batch_size`` rows, the reader yields to the event loop so many sources
+    can be validated concurrently in a single thread.
+
+    Only delimited and fixed data can be read this way because spreadsheets
+    require random access.
+    """
+    def __init__(self, cid_or_path, source_stream, on_error='raise', validate_until=None,
+                 batch_size=DEFAULT_BATCH_SIZE, read_size=DEFAULT_READ_SIZE):
+        assert source_stream is not None
+        assert batch_size >= 1
+        assert read_size >= 1
+
+        super(AsyncReader, self).__init__(cid_or_path, source_stream, on_error, validate_until)
+        data_format = self.cid.data_format
+        assert data_format.format in (data.FORMAT_DELIMITED, data.FORMAT_FIXED), \
+            'format=%r' % data_format.format
+        self._batch_size = batch_size
+        self._read_size = read_size
+        if data_format.format == data.FORMAT_FIXED:
+            self._record_length = sum(length for _, length in interface.field_names_and_lengths(self.cid))
+        else:
+            self._record_length = None
+        if data_format.format == data.FORMAT_DELIMITED:
+            self._quote_character = data_format.quote_character
+            self._escaped_quote = data_format.escape_character + self._quote_character \
+                if data_format.escape_character != self._quote_character else None
+        else:
+            self._quote_character = None
+            self._escaped_quote = None
+        self._scan_index = 0
+        self._is_quoted = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _records_end(self, text):
+        """
+        The index in ``text`` after the last complete record or 0 if there
+        is none yet.
+
+        To avoid scanning the same text again and again, the scan resumes
+        where the previous call stopped. Consequently ``text`` has to start
+        with the text of the previous call, except for text removed with
+        :py:meth:`_remove_scanned_text`.
+        """
+        data_format = self.cid.data_format
+        if (data_format.format == data.FORMAT_FIXED) and (data_format.line_delimiter is None):
+            result = len(text) - len(text) % self._record_length
+        else:
+            result = 0
+            line_start = self._scan_index
+            for line_delimiter_match in _LINE_DELIMITER_REGEX.finditer(text, line_start):
+                line_end = line_delimiter_match.end()
+                if (line_end == len(text)) and (text[-1] == '\r'):
+                    # A trailing carriage return might be followed by a line feed that has not been read yet.
+                    break
+                if self._quote_character is not None:
+                    line = text[line_start:line_end]
+                    quote_count = line.count(self._quote_character)
+                    if self._escaped_quote is not None:
+                        quote_count -= line.count(self._escaped_quote)
+                    if quote_count % 2 == 1:
+                        self._is_quoted = not self._is_quoted
+                if not self._is_quoted:
+                    result = line_end
+                line_start = line_end
+            self._scan_index = line_start
+        return result
+
+    def _remove_scanned_text(self, length):
+        """
+        Adjust the scan state of :py:meth:`_records_end` to the first
+        ``length`` characters having been removed from the text.
+        """
+        self._scan_index = max(0, self._scan_index - length)
+
+    def _records_stream(self, records_text):
+        result = io.StringIO(records_text, newline='')
+        # Make errors refer to the source stream instead of the micro batch.
+        result.name = self.location.file_path
+        return result
+
+    async def rows(self):
+        """
+        Asynchronous iterator over the data rows of the source stream,
+        validated the same way as :py:meth:`cutplace.validio.Reader.rows`.
+
+        :raises cutplace.errors.DataError: on broken data
+        """
+        data_format = self.cid.data_format
+        self.accepted_rows_count = 0
+        self.rejected_rows_count = 0
+        for check in self.cid.check_map.values():
+            check.reset()
+        decoder = codecs.getincrementaldecoder(data_format.encoding)()
+        pending_text = ''
+        self._scan_index = 0
+        self._is_quoted = False
+        line_count = 0
+        is_at_end = False
+        while not is_at_end:
+            source_data = await self._source_data_stream_or_path.read(self._read_size)
+            is_at_end = not source_data
+            if isinstance(source_data, bytes):
+                source_data = decoder.decode(source_data, is_at_end)
+            pending_text += source_data
+            records_end = len(pending_text) if is_at_end else self._records_end(pending_text)
+            if records_end > 0:
+                records_text = pending_text[:records_end]
+                pending_text = pending_text[records_end:]
+                self._remove_scanned_text(records_end)
+                row_count = self.accepted_rows_count + self.rejected_rows_count
+                raw_rows = self._raw_rows(self._records_stream(records_text))
+                try:
+                    for batch_row_count, row in enumerate(self._validated_rows(raw_rows, row_count), 1):
+                        yield row
+                        if batch_row_count % self._batch_size == 0:
+                            await asyncio.sleep(0)
+                except errors.DataFormatError as error:
+                    # Only delimited data refer to physical lines, which can differ from rows.
+                    line_offset = line_count if data_format.format == data.FORMAT_DELIMITED else row_count
+                    validio._move_error_location(error, line_offset)
+                    raise
+                line_count += len(_LINE_DELIMITER_REGEX.findall(records_text))
+                await asyncio.sleep(0)
+
+    async def validate_rows(self):
+        """
+        Validate all rows, which is the same as iterating over
+        :py:meth:`~.rows` without doing anything with the rows.
+
+        :raises cutplace.errors.DataError: on broken data
+        """
+        async for _ in self.rows():
+            pass
@@ -21,13 +21,12 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import copy
-import tokenize
+import token
 
 import six
 
 from cutplace import fields
 from cutplace import errors
-from cutplace import _compat
 from cutplace import _tools
 from cutplace._compat import python_2_unicode_compatible
 
@@ -105,6 +104,54 @@ class AbstractCheck(object):
         """
         pass
 
+    def state(self):
+        """
+        The information collected by :py:meth:`check_row` so far in a form
+        that can be pickled and passed to :py:meth:`merge_state` of another
+        instance of the same check. By default ``None``. To be stored in
+        checkpoints, the state must only consist of ``None``, booleans,
+        numbers, text, lists, tuples, dictionaries and
+        :py:class:`~cutplace.errors.Location`.
+
+        Together with :py:meth:`merge_state` this allows to check separate
+        partitions of the data, for example in different processes, and
+        combine the results before calling :py:meth:`check_at_end`.
+        """
+        return None
+
+    def merge_state(self, other_state, line_offset=0):
+        """
+        Merge ``other_state`` obtained from :py:meth:`state` of another
+        instance of the same check with the state of this check as if the
+        rows checked by the other instance immediately followed the rows
+        checked so far. Locations in ``other_state`` are relative to the
+        start of the other partition and have to be moved by ``line_offset``
+        lines. By default do nothing.
+
+        :return: errors for rows of ``other_state`` that conform within the \
+          other partition but not when combined with the current state, \
+          ordered by location
+        :rtype: list of :py:exc:`cutplace.errors.CheckError`
+        """
+        assert line_offset >= 0
+        return []
+
+    @property
+    def is_mergeable(self):
+        """
+        ``True`` if partitions of the data can be checked independently and
+        combined using :py:meth:`state` and :py:meth:`merge_state`. This
+        is the case for checks that do not keep track of anything and
+        consequently do not implement :py:meth:`reset`, and for checks that
+        implement :py:meth:`merge_state`.
+        """
+        check_type = type(self)
+        is_without_state = \
+            six.get_unbound_function(check_type.reset) is six.get_unbound_function(AbstractCheck.reset)
+        has_merge_state = \
+            six.get_unbound_function(check_type.merge_state) is not six.get_unbound_function(AbstractCheck.merge_state)
+        return is_without_state or has_merge_state
+
     def __str__(self):
         return "%s(%r, %r)" % (self.__class__.__name__, self.description, self.rule)
 
@@ -171,8 +218,7 @@ class IsUniqueCheck(AbstractCheck):
         self.reset()
 
         # Extract field names to check from rule.
-        rule_read_line = _compat.token_io_readline(rule)
-        toky = tokenize.generate_tokens(rule_read_line)
+        toky = _tools.tokenize_without_space(rule)
         after_comma = True
         next_token = next(toky)
         unique_field_names = set()
@@ -180,7 +226,7 @@ class IsUniqueCheck(AbstractCheck):
             token_type = next_token[0]
             token_value = next_token[1]
             if after_comma:
-                if token_type != tokenize.NAME:
+                if token_type != token.NAME:
                     raise errors.InterfaceError(
                         "field name must contain only ASCII letters, numbers and underscores (_) "
                         + "but found: %r [token type=%r]" % (token_value, token_type), self.location_of_rule)
@@ -206,16 +252,42 @@ class IsUniqueCheck(AbstractCheck):
     def reset(self):
         self._row_key_to_location_map = {}
 
+    def _duplicate_row_key_error(self, row_key, location, see_also_location):
+        """
+        :py:exc:`~cutplace.errors.CheckError` for ``row_key`` at
+        ``location`` already having been found at ``see_also_location``.
+        """
+        return errors.CheckError(
+            "values for %r must be unique: %s" % (self._field_names_to_check, row_key), location,
+            see_also_message="location of first occurrence", see_also_location=see_also_location)
+
     def check_row(self, field_name_to_value_map, location):
         row_key = tuple(field_name_to_value_map[field_name] for field_name in self._field_names_to_check)
         see_also_location = self._row_key_to_location_map.get(row_key)
         if see_also_location is not None:
-            raise errors.CheckError(
-                "values for %r must be unique: %s" % (self._field_names_to_check, row_key), location,
-                see_also_message="location of first occurrence", see_also_location=see_also_location)
+            raise self._duplicate_row_key_error(row_key, location, see_also_location)
         else:
             self._row_key_to_location_map[row_key] = copy.copy(location)
 
+    def state(self):
+        return dict(self._row_key_to_location_map)
+
+    def merge_state(self, other_state, line_offset=0):
+        assert other_state is not None
+        assert line_offset >= 0
+
+        result = []
+        for row_key, other_location in sorted(other_state.items(), key=lambda item: item[1].line):
+            location = copy.copy(other_location)
+            if line_offset > 0:
+                location.advance_line(line_offset)
+            see_also_location = self._row_key_to_location_map.get(row_key)
+            if see_also_location is not None:
+                result.append(self._duplicate_row_key_error(row_key, location, see_also_location))
+            else:
+                self._row_key_to_location_map[row_key] = location
+        return result
+
 
 class DistinctCountCheck(AbstractCheck):
     """
@@ -226,12 +298,11 @@ class DistinctCountCheck(AbstractCheck):
     def __init__(self, description, rule, available_field_names, location=None):
         super(DistinctCountCheck, self).__init__(description, rule, available_field_names, location)
 
-        rule_read_line = _compat.token_io_readline(rule)
-        tokens = tokenize.generate_tokens(rule_read_line)
+        tokens = _tools.tokenize_without_space(rule)
         first_token = next(tokens)
 
         # Obtain and validate field to count.
-        if first_token[0] != tokenize.NAME:
+        if first_token[0] != token.NAME:
             raise errors.InterfaceError(
                 "rule must start with a field name but found: %r" % first_token[1], self.location_of_rule)
         self._field_name_to_count = first_token[1]
@@ -275,6 +346,17 @@ class DistinctCountCheck(AbstractCheck):
         except KeyError:
             self._distinct_value_to_count_map[value] = 1
 
+    def state(self):
+        return dict(self._distinct_value_to_count_map)
+
+    def merge_state(self, other_state, line_offset=0):
+        assert other_state is not None
+        assert line_offset >= 0
+
+        for value, count in other_state.items():
+            self._distinct_value_to_count_map[value] = self._distinct_value_to_count_map.get(value, 0) + count
+        return []
+
     def check_at_end(self, location):
         if not self._eval():
             raise errors.CheckError(
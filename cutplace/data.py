@@ -22,7 +22,9 @@ from __future__ import unicode_literals
 
 import codecs
 import io
+import re
 import string
+import sys
 import token
 import tokenize
 
@@ -90,6 +92,27 @@ _VALID_THOUSANDS_SEPARATORS = [",", ".", ""]
 _VALID_FORMATS = [FORMAT_DELIMITED, FORMAT_EXCEL, FORMAT_FIXED, FORMAT_ODS]
 
 
+def _disallowed_characters_regex(allowed_characters):
+    """
+    Compiled regular expression with a character class that matches any
+    character outside of the code points in the range
+    ``allowed_characters``, or ``None`` if all characters are allowed.
+    """
+    result = None
+    if (allowed_characters is not None) and (allowed_characters.items is not None):
+        character_class = ''
+        for lower, upper in allowed_characters.items:
+            lower = 0 if lower is None else max(0, lower)
+            upper = sys.maxunicode if upper is None else min(sys.maxunicode, upper)
+            if lower <= upper:
+                character_class += re.escape(six.unichr(lower))
+                if lower < upper:
+                    character_class += '-' + re.escape(six.unichr(upper))
+        # An empty negated character class is no valid regex, so use one that matches anything.
+        result = re.compile('[^%s]' % character_class if character_class else '(?s).')
+    return result
+
+
 @python_2_unicode_compatible
 class DataFormat(object):
     """
@@ -116,6 +139,7 @@ class DataFormat(object):
         self._header = 0
         self._is_valid = False
         self._allowed_characters = None
+        self._disallowed_characters_regex = None
         self._encoding = 'cp1252'
         if self.format == FORMAT_DELIMITED:
             self._escape_character = '"'
@@ -164,6 +188,17 @@ class DataFormat(object):
         assert (new_allowed_characters is None) or isinstance(new_allowed_characters, ranges.Range)
 
         self._allowed_characters = new_allowed_characters
+        self._disallowed_characters_regex = _disallowed_characters_regex(new_allowed_characters)
+
+    @property
+    def disallowed_characters_regex(self):
+        """
+        Compiled regular expression that matches the first character not
+        within :py:attr:`allowed_characters` when used with ``search()``,
+        or ``None`` if all characters are allowed. This allows to check all
+        characters of a value at once.
+        """
+        return self._disallowed_characters_regex
 
     @property
     def escape_character(self):
@@ -314,7 +349,7 @@ class DataFormat(object):
             self.header = DataFormat._validated_int_at_least_0(name, value, location)
         elif name == KEY_ALLOWED_CHARACTERS:
             try:
-                self._allowed_characters = ranges.Range(value)
+                self.allowed_characters = ranges.Range(value)
             except errors.InterfaceError as error:
                 raise errors.InterfaceError(
                     'data format property %s must be a valid range: %s'
@@ -151,11 +151,16 @@ class Location(object):
         assert self._has_column
         return self._column
 
-    @property
-    def line(self):
-        """The current line or row in the input."""
+    def _get_line(self):
         return self._line
 
+    def _set_line(self, new_line):
+        assert new_line is not None
+        assert new_line >= 0
+        self._line = new_line
+
+    line = property(_get_line, _set_line, doc="The current line or row in the input.")
+
     def _get_sheet(self):
         assert self._has_sheet
         return self._sheet
@@ -281,6 +286,15 @@ class CutplaceError(Exception):
         # TODO #61: Replace self._message by calls to something like str(super()).
         self._message = message
 
+    def __reduce__(self):
+        """
+        Support for :py:mod:`pickle` so errors can be passed between
+        processes, for example during parallel validation.
+        """
+        return (
+            self.__class__,
+            (self._message, self._location, self._see_also_message, self._see_also_location, self._cause))
+
     @property
     def location(self):
         """
@@ -20,6 +20,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import collections
+import datetime
 import decimal
 import fnmatch
 import keyword
@@ -30,6 +32,12 @@ import time
 
 import six
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    # Without NumPy, numbers are checked against their valid range one by one.
+    numpy = None
+
 from cutplace import data
 from cutplace import ranges
 from cutplace import errors
@@ -46,6 +54,227 @@ _FieldFormatClassSuffix = "FieldFormat"
 _ASCII_LETTERS = set(string.ascii_letters)
 _ASCII_LETTERS_DIGITS_AND_UNDERSCORE = set(string.ascii_letters + string.digits + '_')
 
+#: Default maximum number of distinct values a :py:class:`ValidationCache`
+#: remembers the outcome for.
+DEFAULT_VALIDATION_CACHE_SIZE = 1000
+
+#: Default number of lookups after which a :py:class:`ValidationCache`
+#: checks its hit rate.
+DEFAULT_VALIDATION_CACHE_SAMPLE_SIZE = 10000
+
+#: Default minimum hit rate a :py:class:`ValidationCache` needs during each
+#: sample of lookups to remain enabled.
+DEFAULT_MIN_VALIDATION_CACHE_HIT_RATE = 0.5
+
+#: Maximum number of values each :py:class:`DateTimeFieldFormat` remembers
+#: the result for, so repeated values do not need to be parsed again.
+DATE_TIME_CACHE_SIZE = 1024
+
+# Regular expressions for the directives used by `DateTimeFieldFormat`, which are the same as the ones
+# `time.strptime()` uses.
+_STRPTIME_DIRECTIVE_TO_REGEX_MAP = {
+    'd': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'M': r'(?P<M>[0-5]\d|\d)',
+    'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+    'y': r'(?P<y>\d\d)',
+    'Y': r'(?P<Y>\d\d\d\d)',
+    '%': '%',
+}
+_STRPTIME_REGEX_CHARACTERS_REGEX = re.compile(r'([\\.^$*+?\(\){}\[\]|])')
+_WHITE_SPACE_REGEX = re.compile(r'\s+')
+
+#: Minimum number of distinct numbers to check against their valid range
+#: using NumPy; for fewer numbers the overhead of creating arrays does not
+#: pay off.
+MIN_NUMPY_VALUES_COUNT = 64
+
+# Limits of the NumPy arrays used to check numbers against their valid range.
+_MIN_INT64 = -2 ** 63
+_MAX_INT64 = 2 ** 63 - 1
+
+
+def _strptime_regex(strptime_format):
+    """
+    Compiled regular expression matching the same text as
+    :py:func:`time.strptime` does with ``strptime_format``, or ``None`` if
+    ``strptime_format`` contains directives other than the ones
+    :py:class:`DateTimeFieldFormat` uses.
+    """
+    pattern = ''
+    remaining_format = _WHITE_SPACE_REGEX.sub(r'\\s+', _STRPTIME_REGEX_CHARACTERS_REGEX.sub(r'\\\1', strptime_format))
+    while '%' in remaining_format:
+        directive_index = remaining_format.index('%') + 1
+        directive = remaining_format[directive_index:directive_index + 1]
+        if directive not in _STRPTIME_DIRECTIVE_TO_REGEX_MAP:
+            return None
+        pattern += remaining_format[:directive_index - 1] + _STRPTIME_DIRECTIVE_TO_REGEX_MAP[directive]
+        remaining_format = remaining_format[directive_index + 1:]
+    pattern += remaining_format
+    try:
+        result = re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        # For example, the same directive is used twice.
+        result = None
+    return result
+
+
+def _is_within_range_items(number, range_items):
+    """
+    ``True`` if ``number`` is within any of ``range_items`` as described by
+    :py:attr:`cutplace.ranges.Range.items`.
+    """
+    assert range_items is not None
+
+    result = False
+    for lower, upper in range_items:
+        if ((lower is None) or (number >= lower)) and ((upper is None) or (number <= upper)):
+            result = True
+            break
+    return result
+
+
+def _numpy_numbers_out_of_range(numbers, range_items):
+    """
+    NumPy array of booleans that are ``True`` for each item in ``numbers``
+    that is outside of all ``range_items``, or ``None`` if ``numbers``
+    cannot be represented as 64 bit integers.
+
+    :param list numbers: integer numbers to check
+    :param list range_items: pairs of lower and upper limits as in \
+      :py:attr:`cutplace.ranges.Range.items`; limits that do not fit into a \
+      64 bit integer are taken into account correctly
+    """
+    assert numpy is not None
+    assert range_items is not None
+
+    try:
+        number_array = numpy.array(numbers, dtype=numpy.int64)
+    except OverflowError:
+        return None
+    is_in_any_range_item = numpy.zeros(len(numbers), dtype=bool)
+    for lower, upper in range_items:
+        if ((lower is not None) and (lower > _MAX_INT64)) or ((upper is not None) and (upper < _MIN_INT64)):
+            # No 64 bit integer can be within this range item.
+            continue
+        is_in_range_item = numpy.ones(len(numbers), dtype=bool)
+        if (lower is not None) and (lower > _MIN_INT64):
+            is_in_range_item &= (number_array >= lower)
+        if (upper is not None) and (upper < _MAX_INT64):
+            is_in_range_item &= (number_array <= upper)
+        is_in_any_range_item |= is_in_range_item
+    return ~is_in_any_range_item
+
+
+def _numpy_rejected_values(value_to_number_map, range_items):
+    """
+    The set of values in ``value_to_number_map`` whose number is outside
+    of ``range_items``, or ``None`` if the numbers cannot be checked using
+    NumPy.
+    """
+    values = list(value_to_number_map.keys())
+    numbers_out_of_range = _numpy_numbers_out_of_range(
+        [value_to_number_map[value] for value in values], range_items)
+    if numbers_out_of_range is None:
+        result = None
+    else:
+        result = set(values[value_index] for value_index in numpy.flatnonzero(numbers_out_of_range))
+    return result
+
+
+class ValidationCache(object):
+    """
+    Cache for the outcomes of validating raw values, which is either the
+    validated value or the :py:exc:`cutplace.errors.FieldValueError`. It
+    remembers the outcomes for up to ``size`` distinct values and discards
+    the least recently used ones beyond that.
+
+    Caching only pays off if the same values show up many times. Therefore
+    the cache checks its hit rate after each ``sample_size`` lookups and
+    disables itself for good if it is below ``min_hit_rate``.
+    """
+    def __init__(self, size=DEFAULT_VALIDATION_CACHE_SIZE, sample_size=DEFAULT_VALIDATION_CACHE_SAMPLE_SIZE,
+                 min_hit_rate=DEFAULT_MIN_VALIDATION_CACHE_HIT_RATE):
+        assert size >= 1
+        assert sample_size >= 1
+        assert 0.0 <= min_hit_rate <= 1.0
+
+        self._size = size
+        self._sample_size = sample_size
+        self._min_hit_rate = min_hit_rate
+        self._value_to_outcome_map = collections.OrderedDict()
+        self._is_enabled = True
+        self._sample_lookup_count = 0
+        self._sample_hit_count = 0
+        #: Number of values whose outcome was found in the cache.
+        self.hit_count = 0
+        #: Number of values that had to be validated.
+        self.miss_count = 0
+
+    @property
+    def is_enabled(self):
+        """
+        ``False`` if the cache disabled itself due to a poor hit rate.
+        """
+        return self._is_enabled
+
+    @property
+    def hit_rate(self):
+        """
+        The ratio of :py:attr:`hit_count` and all lookups so far, or 0 if
+        there have not been any lookups yet.
+        """
+        lookup_count = self.hit_count + self.miss_count
+        return self.hit_count / lookup_count if lookup_count >= 1 else 0.0
+
+    def validated(self, value, validate):
+        """
+        The same as ``validate(value)`` but using the cached outcome if
+        ``value`` has been validated before.
+
+        :raises cutplace.errors.FieldValueError: if ``value`` is invalid
+        """
+        if not self._is_enabled:
+            return validate(value)
+
+        value_to_outcome_map = self._value_to_outcome_map
+        error_to_raise = None
+        try:
+            # Remove and add again to mark the value as most recently used.
+            is_valid, outcome = value_to_outcome_map.pop(value)
+            value_to_outcome_map[value] = (is_valid, outcome)
+            self.hit_count += 1
+            self._sample_hit_count += 1
+            if not is_valid:
+                error_class, error_arguments = outcome
+                error_to_raise = error_class(*error_arguments)
+        except KeyError:
+            self.miss_count += 1
+            try:
+                outcome = validate(value)
+                is_valid = True
+            except errors.FieldValueError as error:
+                # Remember how to create a new error because errors are modified when passed on.
+                outcome = error.__reduce__()[:2]
+                is_valid = False
+                error_to_raise = error
+            value_to_outcome_map[value] = (is_valid, outcome)
+            if len(value_to_outcome_map) > self._size:
+                value_to_outcome_map.popitem(last=False)
+
+        self._sample_lookup_count += 1
+        if self._sample_lookup_count == self._sample_size:
+            if self._sample_hit_count < self._min_hit_rate * self._sample_size:
+                self._is_enabled = False
+                value_to_outcome_map.clear()
+            self._sample_lookup_count = 0
+            self._sample_hit_count = 0
+
+        if error_to_raise is not None:
+            raise error_to_raise
+        return outcome
+
 
 @python_2_unicode_compatible
 class AbstractFieldFormat(object):
@@ -58,8 +287,18 @@ class AbstractFieldFormat(object):
          but call ``super().__init__(...)`` from it.
       2. Implement
          :py:meth:`~cutplace.fields.AbstractFieldFormat.validated_value()`.
+
+    If the result of ``validated_value()`` depends on anything else than
+    the value or it has side effects, also set :py:attr:`is_cacheable` to
+    ``False``.
     """
 
+    #: ``False`` if the outcome of
+    #: :py:meth:`~cutplace.fields.AbstractFieldFormat.validated()` must not be
+    #: cached using
+    #: :py:meth:`~cutplace.fields.AbstractFieldFormat.enable_validation_cache()`.
+    is_cacheable = True
+
     def __init__(self, field_name, is_allowed_to_be_empty, length_text, rule, data_format, empty_value=None):
         assert field_name is not None
         assert field_name, 'field_name must not be empty'
@@ -75,6 +314,7 @@ class AbstractFieldFormat(object):
         self._data_format = data_format
         self._empty_value = empty_value
         self._example = None
+        self._validation_cache = None
 
     @property
     def field_name(self):
@@ -153,18 +393,18 @@ class AbstractFieldFormat(object):
         :raises cutplace.errors.FieldValueError: if any character in \
           ``value`` is not allowed
         """
-        valid_character_range = self.data_format.allowed_characters
-        if valid_character_range is not None:
-            for character_column, character in enumerate(value, 1):
+        disallowed_characters_regex = self.data_format.disallowed_characters_regex
+        if disallowed_characters_regex is not None:
+            disallowed_character_match = disallowed_characters_regex.search(value)
+            if disallowed_character_match is not None:
+                character = disallowed_character_match.group()
                 character_code = ord(character)
-                try:
-                    valid_character_range.validate("character", character_code)
-                except errors.RangeValueError:
-                    raise errors.FieldValueError(
-                        "character %s (code point U+%04x, decimal %d) in field '%s' at column %d must be an allowed "
-                        "character: %s" % (
-                            _compat.text_repr(character), character_code, character_code, self.field_name,
-                            character_column, valid_character_range))
+                character_column = disallowed_character_match.start() + 1
+                raise errors.FieldValueError(
+                    "character %s (code point U+%04x, decimal %d) in field '%s' at column %d must be an allowed "
+                    "character: %s" % (
+                        _compat.text_repr(character), character_code, character_code, self.field_name,
+                        character_column, self.data_format.allowed_characters))
 
     def validate_empty(self, value):
         """
@@ -224,6 +464,33 @@ class AbstractFieldFormat(object):
 
         raise NotImplementedError()
 
+    @property
+    def validation_cache(self):
+        """
+        The :py:class:`ValidationCache` used by
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated()` or
+        ``None`` if no cache is used (the default).
+        """
+        return self._validation_cache
+
+    def enable_validation_cache(self, size=DEFAULT_VALIDATION_CACHE_SIZE,
+                                sample_size=DEFAULT_VALIDATION_CACHE_SAMPLE_SIZE,
+                                min_hit_rate=DEFAULT_MIN_VALIDATION_CACHE_HIT_RATE):
+        """
+        Use a :py:class:`ValidationCache` with the specified parameters for
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated()`. This
+        is useful for fields with few distinct values, for example country
+        codes or status flags. Validators created before calling this do not
+        take the cache into account.
+
+        :return: ``True`` if the cache has been enabled or ``False`` if this \
+          field format is not :py:attr:`is_cacheable`
+        """
+        result = self.is_cacheable
+        if result:
+            self._validation_cache = ValidationCache(size, sample_size, min_hit_rate)
+        return result
+
     def validated(self, value):
         """
         Validate that value complies with field description and return the value in its "native"
@@ -231,6 +498,23 @@ class AbstractFieldFormat(object):
 
         :raises cutplace.errors.FieldValueError: if ``value`` is invalid
         """
+        if self._validation_cache is not None:
+            result = self._validation_cache.validated(value, self._validated_without_cache)
+        else:
+            result = self._validated_without_cache(value)
+        return result
+
+    def validate(self, value):
+        """
+        Same as :py:meth:`~cutplace.fields.AbstractFieldFormat.validated()`
+        but without returning the native value, which allows descendants to
+        skip creating it.
+
+        :raises cutplace.errors.FieldValueError: if ``value`` is invalid
+        """
+        self.validated(value)
+
+    def _validated_without_cache(self, value):
         self.validate_characters(value)
         self.validate_empty(value)
         self.validate_length(value)
@@ -244,6 +528,91 @@ class AbstractFieldFormat(object):
             result = self.empty_value
         return result
 
+    def rejected_values(self, values):
+        """
+        The set of items in ``values`` that
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated_value()`
+        rejects. The same conditions as for ``validated_value()`` apply to
+        each item.
+
+        Field formats can override this to validate many values at once
+        faster than one by one, for example using a set operation. The
+        default implementation simply calls ``validated_value()`` for each
+        item.
+
+        :param set values: distinct values to validate
+        """
+        result = set()
+        for value in values:
+            try:
+                self.validated_value(value)
+            except errors.FieldValueError:
+                result.add(value)
+        return result
+
+    def invalid_value_index(self, values):
+        """
+        The index of the first item in ``values`` that
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated()` rejects
+        or ``None`` if all of them are valid.
+
+        Instead of validating the items one by one, this validates all items
+        of a column at once: each distinct value and length is validated
+        only once, and the remaining values are passed to
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.rejected_values()`.
+        To obtain the actual error, call ``validated()`` with the value at
+        the resulting index.
+
+        :param list values: text values to validate
+        """
+        distinct_values = set(values)
+        rejected_values = set()
+        if '' in distinct_values:
+            distinct_values.discard('')
+            if not self.is_allowed_to_be_empty:
+                rejected_values.add('')
+
+        disallowed_characters_regex = self.data_format.disallowed_characters_regex
+        if disallowed_characters_regex is not None:
+            search = disallowed_characters_regex.search
+            rejected_values.update(value for value in distinct_values if search(value) is not None)
+
+        if self.length.items is not None:
+            rejected_lengths = set()
+            is_fixed_format = (self.data_format.format == data.FORMAT_FIXED)
+            for length in set(len(value) for value in distinct_values):
+                if is_fixed_format:
+                    if length > self.length.lower_limit:
+                        rejected_lengths.add(length)
+                else:
+                    try:
+                        self.length.validate('length', length)
+                    except errors.RangeValueError:
+                        rejected_lengths.add(length)
+            if rejected_lengths:
+                rejected_values.update(value for value in distinct_values if len(value) in rejected_lengths)
+
+        distinct_values.difference_update(rejected_values)
+        if self.data_format.format == data.FORMAT_FIXED:
+            stripped_value_to_values_map = {}
+            for value in distinct_values:
+                stripped_value_to_values_map.setdefault(value.strip(), []).append(value)
+            stripped_values_to_validate = set(stripped_value_to_values_map)
+            stripped_values_to_validate.discard('')
+            for stripped_value in self.rejected_values(stripped_values_to_validate):
+                rejected_values.update(stripped_value_to_values_map[stripped_value])
+        else:
+            rejected_values.update(self.rejected_values(distinct_values))
+
+        result = None
+        if rejected_values:
+            for value_index, value in enumerate(values):
+                if value in rejected_values:
+                    result = value_index
+                    break
+            assert result is not None
+        return result
+
     def __str__(self):
         return "%s(%s, %s, %s, %s)" % (
             self.__class__.__name__, _compat.text_repr(self.field_name), self.is_allowed_to_be_empty,
@@ -291,16 +660,37 @@ class ChoiceFieldFormat(AbstractFieldFormat):
                     raise errors.InterfaceError("trailing comma (,) must be removed")
         if not self.is_allowed_to_be_empty and not self.choices:
             raise errors.InterfaceError("choice field without any choices must be allowed to be empty")
+        self._choice_to_code_map = {}
+        for code, choice in enumerate(self.choices):
+            self._choice_to_code_map.setdefault(choice, code)
+
+    @property
+    def code_table(self):
+        """
+        The choices as tuple so that the index of each choice can serve as
+        its code when dictionary encoding values.
+        """
+        return tuple(self.choices)
+
+    def code_for(self, value):
+        """
+        The index of ``value`` in :py:attr:`code_table` or ``None`` if it is
+        not one of the choices.
+        """
+        return self._choice_to_code_map.get(value)
 
     def validated_value(self, value):
         assert value
 
-        if value not in self.choices:
+        if value not in self._choice_to_code_map:
             raise errors.FieldValueError(
                 "value is %s but must be one of: %s"
                 % (_compat.text_repr(value), _tools.human_readable_list(self.choices)))
         return value
 
+    def rejected_values(self, values):
+        return set(values).difference(self._choice_to_code_map)
+
 
 class ConstantFieldFormat(AbstractFieldFormat):
     """
@@ -338,6 +728,20 @@ class ConstantFieldFormat(AbstractFieldFormat):
                 'length is %s but must be %d to match constant %s'
                 % (self.length, len(self._constant), _compat.text_repr(self._constant)))
 
+    @property
+    def code_table(self):
+        """
+        A tuple with the constant as only item, so its code is 0 when
+        dictionary encoding values.
+        """
+        return (self._constant,)
+
+    def code_for(self, value):
+        """
+        0 if ``value`` is the constant or ``None`` otherwise.
+        """
+        return 0 if value == self._constant else None
+
     def validated_value(self, value):
         assert value
 
@@ -347,6 +751,9 @@ class ConstantFieldFormat(AbstractFieldFormat):
                 % (_compat.text_repr(value), _compat.text_repr(self._constant)))
         return value
 
+    def rejected_values(self, values):
+        return set(value for value in values if value != self._constant)
+
 
 class DecimalFieldFormat(AbstractFieldFormat):
     """
@@ -359,8 +766,9 @@ class DecimalFieldFormat(AbstractFieldFormat):
         super(DecimalFieldFormat, self).__init__(
             field_name, is_allowed_to_be_empty, "", "", data_format, empty_value)
         assert rule is not None, 'to specify "no rule" use "" instead of None'
-        self.decimal_separator = data_format.decimal_separator
-        self.thousands_separator = data_format.thousands_separator
+        self._decimal_separator = data_format.decimal_separator
+        self._thousands_separator = data_format.thousands_separator
+        self._compile_parser()
         self.valid_range = ranges.DecimalRange(rule, ranges.DEFAULT_DECIMAL_RANGE_TEXT)
         self._length = ranges.DecimalRange(length_text)
 
@@ -371,31 +779,103 @@ class DecimalFieldFormat(AbstractFieldFormat):
             self._precision = None
             self._scale = None
 
+        # Valid range the scaled range items have been computed for.
+        self._scaled_range = None
+        self._scaled_range_items = None
+
+        # Simple values can only skip `validated()` if descendants do not change how to validate them.
+        decimal_field_format_type = type(self)
+        self._can_validate_scaled = all(
+            six.get_unbound_function(getattr(decimal_field_format_type, method_name))
+            is six.get_unbound_function(getattr(DecimalFieldFormat, method_name))
+            for method_name in ('validated', 'validated_value'))
+
+    @property
+    def decimal_separator(self):
+        return self._decimal_separator
+
+    @decimal_separator.setter
+    def decimal_separator(self, new_decimal_separator):
+        self._decimal_separator = new_decimal_separator
+        self._compile_parser()
+
+    @property
+    def thousands_separator(self):
+        return self._thousands_separator
+
+    @thousands_separator.setter
+    def thousands_separator(self, new_thousands_separator):
+        self._thousands_separator = new_thousands_separator
+        self._compile_parser()
+
+    def _compile_parser(self):
+        """
+        Prepare parsing values according to the current decimal and
+        thousands separator.
+        """
+        assert self.decimal_separator
+
+        # Regex for values that can be converted to an integer scaled by the precision of the valid range.
+        thousands_separator_pattern = re.escape(self.thousands_separator) if self.thousands_separator else ''
+        self._scalable_decimal_regex = re.compile(
+            r'^([+-]?)([0-9%s]*[0-9][0-9%s]*)(?:%s([0-9]*))?\Z' % (
+                thousands_separator_pattern, thousands_separator_pattern, re.escape(self.decimal_separator)))
+
     def sql_ansi_type(self):
         return ('decimal', self._scale, self._precision)
 
+    def _current_scaled_range_items(self):
+        """
+        The items of the valid range with their limits scaled to integers
+        by the precision of the range.
+        """
+        if self._scaled_range is not self.valid_range:
+            scaling = decimal.Decimal(10) ** self.valid_range.precision
+            self._scaled_range_items = [
+                tuple(None if limit is None else int(limit * scaling) for limit in range_item)
+                for range_item in self.valid_range.items
+            ] if self.valid_range.items is not None else None
+            self._scaled_range = self.valid_range
+        return self._scaled_range_items
+
+    def _raise_misplaced_separator_error(self, value, digits_after_dot):
+        """
+        Raise an error describing the first misplaced decimal or thousands
+        separator in ``digits_after_dot``, which is the part of ``value``
+        after the first decimal separator.
+        """
+        other_decimal_separator_index = digits_after_dot.find(self.decimal_separator)
+        if self.thousands_separator:
+            thousands_separator_index = digits_after_dot.find(self.thousands_separator)
+        else:
+            thousands_separator_index = -1
+        if (other_decimal_separator_index != -1) and \
+                ((thousands_separator_index == -1) or (other_decimal_separator_index < thousands_separator_index)):
+            raise errors.FieldValueError(
+                "decimal field must contain only one decimal separator (%s): %s"
+                % (_compat.text_repr(self.decimal_separator), _compat.text_repr(value)))
+        assert thousands_separator_index != -1
+        raise errors.FieldValueError(
+            "decimal field must contain thousands separator (%s) only before "
+            "decimal separator (%s): %s "
+            % (_compat.text_repr(self.thousands_separator), _compat.text_repr(self.decimal_separator),
+               _compat.text_repr(value)))
+
     def validated_value(self, value):
         assert value
 
-        translated_value = ""
-        found_decimal_separator = False
-        for character_to_process in value:
-            if character_to_process == self.decimal_separator:
-                if found_decimal_separator:
-                    raise errors.FieldValueError(
-                        "decimal field must contain only one decimal separator (%s): %s"
-                        % (_compat.text_repr(self.decimal_separator), _compat.text_repr(value)))
-                translated_value += "."
-                found_decimal_separator = True
-            elif self.thousands_separator and (character_to_process == self.thousands_separator):
-                if found_decimal_separator:
-                    raise errors.FieldValueError(
-                        "decimal field must contain thousands separator (%r) only before "
-                        "decimal separator (%r): %r "
-                        % (self.thousands_separator, self.decimal_separator, value))
-            else:
-                translated_value += character_to_process
-
+        decimal_separator = self._decimal_separator
+        thousands_separator = self._thousands_separator
+        digits_before_dot, found_decimal_separator, digits_after_dot = value.partition(decimal_separator)
+        if found_decimal_separator and ((decimal_separator in digits_after_dot)
+                                        or (thousands_separator and (thousands_separator in digits_after_dot))):
+            self._raise_misplaced_separator_error(value, digits_after_dot)
+
+        # Convert the value to the format expected by `decimal.Decimal`.
+        translated_value = digits_before_dot.replace(thousands_separator, '') if thousands_separator \
+            else digits_before_dot
+        if found_decimal_separator:
+            translated_value += '.' + digits_after_dot
         try:
             result = decimal.Decimal(translated_value)
         except Exception as error:
@@ -403,13 +883,94 @@ class DecimalFieldFormat(AbstractFieldFormat):
             message = "value is %r but must be a decimal number: %s" % (value, error)
             raise errors.FieldValueError(message)
 
-        try:
-            self.valid_range.validate(self._field_name, result)
-        except errors.RangeValueError as error:
-            raise errors.FieldValueError(str(error))
+        if not self._is_scaled_within_range(value):
+            try:
+                self.valid_range.validate(self._field_name, result)
+            except errors.RangeValueError as error:
+                raise errors.FieldValueError(str(error))
 
         return result
 
+    def _is_scaled_within_range(self, value):
+        """
+        ``True`` if ``value`` is a simple decimal number that is within the
+        valid range when compared as integer scaled by the precision of the
+        range. ``False`` means that ``value`` has to be checked against the
+        range as :py:class:`decimal.Decimal` to tell and describe the error.
+        """
+        scaled_range_items = self._current_scaled_range_items()
+        if scaled_range_items is not None:
+            scaled_integer = self._scaled_integer(value)
+            result = (scaled_integer is not None) and _is_within_range_items(scaled_integer, scaled_range_items)
+        else:
+            result = False
+        return result
+
+    def validate(self, value):
+        """
+        Same as :py:meth:`~cutplace.fields.AbstractFieldFormat.validate()`
+        but check simple decimal numbers against the valid range as integers
+        scaled by the precision of the range without creating a
+        :py:class:`decimal.Decimal` for them.
+        """
+        if self._can_validate_scaled and self._is_scaled_within_range(value):
+            self.validate_characters(value)
+            self.validate_length(value)
+        else:
+            self.validated(value)
+
+    def _scaled_integer(self, value):
+        """
+        ``value`` as integer multiplied by ``10 ** precision`` of the valid
+        range or ``None`` if it has more digits after the decimal separator
+        than the precision or is not a simple decimal number in the first
+        place.
+        """
+        result = None
+        scalable_decimal_match = self._scalable_decimal_regex.match(value)
+        if scalable_decimal_match is not None:
+            sign, digits_before_dot, digits_after_dot = scalable_decimal_match.groups()
+            if self.thousands_separator:
+                digits_before_dot = digits_before_dot.replace(self.thousands_separator, '')
+            if digits_after_dot is None:
+                digits_after_dot = ''
+            precision = self.valid_range.precision
+            if len(digits_after_dot) <= precision:
+                result = int(sign + digits_before_dot + digits_after_dot.ljust(precision, '0'))
+        return result
+
+    def rejected_values(self, values):
+        """
+        Same as
+        :py:meth:`cutplace.fields.AbstractFieldFormat.rejected_values()` but
+        check simple decimal numbers against the valid range as integers
+        scaled by the precision of the range without creating a
+        :py:class:`decimal.Decimal` for them. If NumPy is available and there
+        are enough ``values``, use vectorized comparisons for this. Other
+        values are validated one by one.
+        """
+        scaled_range_items = self._current_scaled_range_items()
+        if scaled_range_items is None:
+            result = super(DecimalFieldFormat, self).rejected_values(values)
+        else:
+            value_to_scaled_integer_map = {}
+            values_to_validate_one_by_one = set()
+            for value in values:
+                scaled_integer = self._scaled_integer(value)
+                if scaled_integer is None:
+                    values_to_validate_one_by_one.add(value)
+                else:
+                    value_to_scaled_integer_map[value] = scaled_integer
+            result = None
+            if (numpy is not None) and (len(value_to_scaled_integer_map) >= MIN_NUMPY_VALUES_COUNT):
+                result = _numpy_rejected_values(value_to_scaled_integer_map, scaled_range_items)
+            if result is None:
+                result = set(
+                    value for value, scaled_integer in value_to_scaled_integer_map.items()
+                    if not _is_within_range_items(scaled_integer, scaled_range_items))
+            result.update(super(DecimalFieldFormat, self).rejected_values(values_to_validate_one_by_one))
+        return result
+
 
 class IntegerFieldFormat(AbstractFieldFormat):
     """
@@ -486,6 +1047,40 @@ class IntegerFieldFormat(AbstractFieldFormat):
             raise errors.FieldValueError(six.text_type(error))
         return value_as_int
 
+    def rejected_values(self, values):
+        """
+        Same as
+        :py:meth:`cutplace.fields.AbstractFieldFormat.rejected_values()` but
+        convert all ``values`` to integers at once and, if NumPy is available
+        and there are enough of them, check them against the valid range
+        using vectorized comparisons.
+        """
+        result = set()
+        try:
+            # Convert all values at once and only look for the broken ones if that fails.
+            value_to_int_map = dict(zip(values, map(int, values)))
+        except ValueError:
+            value_to_int_map = {}
+            for value in values:
+                try:
+                    value_to_int_map[value] = int(value)
+                except ValueError:
+                    result.add(value)
+        values_out_of_range = None
+        if (numpy is not None) and (len(value_to_int_map) >= MIN_NUMPY_VALUES_COUNT) \
+                and (self.valid_range.items is not None):
+            values_out_of_range = _numpy_rejected_values(value_to_int_map, self.valid_range.items)
+        if values_out_of_range is None:
+            # Check the numbers one by one, for example because some of them are too big for NumPy.
+            values_out_of_range = set()
+            for value, value_as_int in value_to_int_map.items():
+                try:
+                    self.valid_range.validate("value", value_as_int)
+                except errors.RangeValueError:
+                    values_out_of_range.add(value)
+        result.update(values_out_of_range)
+        return result
+
 
 class DateTimeFieldFormat(AbstractFieldFormat):
     """
@@ -506,19 +1101,71 @@ class DateTimeFieldFormat(AbstractFieldFormat):
             (key, value) = patternKeyValue.split(":")
             strptime_format = strptime_format.replace(key, value)
         self.strptimeFormat = strptime_format
+        self._strptime_regex = _strptime_regex(strptime_format)
+        self._value_to_result_cache = {}
 
     def sql_ansi_type(self):
         return ('date',)
 
+    def _parsed(self, value):
+        """
+        The same as ``time.strptime(value, self.strptimeFormat)`` but using
+        a precompiled regular expression and integer calendar validation, or
+        ``None`` if ``value`` cannot be parsed this way.
+        """
+        assert self._strptime_regex is not None
+
+        result = None
+        strptime_match = self._strptime_regex.match(value)
+        if (strptime_match is not None) and (strptime_match.end() == len(value)):
+            directive_to_text_map = strptime_match.groupdict()
+            if 'Y' in directive_to_text_map:
+                year = int(directive_to_text_map['Y'])
+            elif 'y' in directive_to_text_map:
+                year = int(directive_to_text_map['y'])
+                # Use the same pivot year as `time.strptime()`.
+                year += 2000 if year <= 68 else 1900
+            else:
+                year = None
+            month = int(directive_to_text_map.get('m', 1))
+            day = int(directive_to_text_map.get('d', 1))
+            if year is None:
+                # Like `time.strptime()`, accept February 29 without year.
+                calendar_year = 1904 if (month == 2) and (day == 29) else 1900
+                year = 1900
+            else:
+                calendar_year = year
+            try:
+                date = datetime.date(calendar_year, month, day)
+            except ValueError:
+                date = None
+            if date is not None:
+                day_of_year = date.toordinal() - datetime.date(calendar_year, 1, 1).toordinal() + 1
+                result = time.struct_time((
+                    year, month, day, int(directive_to_text_map.get('H', 0)),
+                    int(directive_to_text_map.get('M', 0)), int(directive_to_text_map.get('S', 0)),
+                    date.weekday(), day_of_year, -1))
+        return result
+
     def validated_value(self, value):
         assert value
 
-        try:
-            result = time.strptime(value, self.strptimeFormat)
-        except ValueError:
-            raise errors.FieldValueError(
-                "date must match format %s (%s) but is: %s (%s)"
-                % (self.human_readable_format, self.strptimeFormat, _compat.text_repr(value), sys.exc_info()[1]))
+        result = self._value_to_result_cache.get(value)
+        if result is None:
+            if self._strptime_regex is not None:
+                result = self._parsed(value)
+            if result is None:
+                # Use `time.strptime()` for unusual formats and to describe the error.
+                try:
+                    result = time.strptime(value, self.strptimeFormat)
+                except ValueError:
+                    raise errors.FieldValueError(
+                        "date must match format %s (%s) but is: %s (%s)"
+                        % (self.human_readable_format, self.strptimeFormat, _compat.text_repr(value),
+                           sys.exc_info()[1]))
+            if len(self._value_to_result_cache) >= DATE_TIME_CACHE_SIZE:
+                self._value_to_result_cache.clear()
+            self._value_to_result_cache[value] = result
         return result
 
 
@@ -540,6 +1187,10 @@ class RegExFieldFormat(AbstractFieldFormat):
                 % (_compat.text_repr(value), _compat.text_repr(self.rule)))
         return value
 
+    def rejected_values(self, values):
+        match = self.regex.match
+        return set(value for value in values if not match(value))
+
 
 class PatternFieldFormat(AbstractFieldFormat):
     """
@@ -560,6 +1211,10 @@ class PatternFieldFormat(AbstractFieldFormat):
                 % (_compat.text_repr(value), _compat.text_repr(self.rule), _compat.text_repr(self.pattern)))
         return value
 
+    def rejected_values(self, values):
+        match = self.regex.match
+        return set(value for value in values if not match(value))
+
 
 class TextFieldFormat(AbstractFieldFormat):
     """
@@ -574,6 +1229,9 @@ class TextFieldFormat(AbstractFieldFormat):
         # TODO: Validate Text with rules like: 32..., a...z and so on.
         return value
 
+    def rejected_values(self, values):
+        return set()
+
 
 def field_name_index(field_name_to_look_up, available_field_names, location):
     """
@@ -22,6 +22,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import bisect
+import collections
 import token
 import decimal
 
@@ -58,6 +60,27 @@ DEFAULT_PRECISION = len(MAX_DECIMAL_TEXT.split('.')[1])
 #: specified.
 DEFAULT_SCALE = len(MAX_DECIMAL_TEXT) - 1
 
+#: Maximum number of distinct range descriptions whose parsed result is
+#: remembered, so ranges used by many fields such as ``1...40`` are only
+#: parsed once. Once the cache is full, the least recently used description
+#: is forgotten.
+RANGE_CACHE_SIZE = 1024
+
+# Map of (range class, description, default) to the attributes of the range
+# parsed from it, ordered from least to most recently used.
+_range_cache_key_to_attributes_map = collections.OrderedDict()
+
+
+def _copied_attributes(name_to_attribute_map):
+    """
+    Copy of ``name_to_attribute_map`` with lists such as the items of a
+    range copied, too, so ranges sharing cached attributes cannot modify
+    each other. All other attributes are immutable.
+    """
+    return dict(
+        (name, list(attribute) if isinstance(attribute, list) else attribute)
+        for name, attribute in name_to_attribute_map.items())
+
 
 def code_for_number_token(name, value, location):
     """
@@ -194,6 +217,10 @@ class Range(object):
         """
         assert default is None or (default.strip() != ''), "default=%r" % default
 
+        cache_key = (type(self), description, default)
+        if self._set_attributes_from_cache(cache_key):
+            return
+
         # Find out if a `text` has been specified and if not, use optional `default` instead.
         has_description = (description is not None) and (description.strip() != '')
         if not has_description and default is not None:
@@ -328,6 +355,8 @@ class Range(object):
                     self._upper_limit = None
                 elif (self._upper_limit is not None) and (upper_item > self._upper_limit):
                     self._upper_limit = upper_item
+        self._compile_intervals()
+        self._add_attributes_to_cache(cache_key)
 
     @property
     def description(self):
@@ -412,6 +441,86 @@ class Range(object):
             result = six.text_type(None)
         return result
 
+    def _set_attributes_from_cache(self, cache_key):
+        """
+        Set all attributes to the ones of a range created before with the
+        same ``cache_key`` if there is one.
+
+        :return: ``True`` if the attributes have been set
+        """
+        # Remove and add again to mark the attributes as most recently used.
+        attributes = _range_cache_key_to_attributes_map.pop(cache_key, None)
+        if attributes is not None:
+            _range_cache_key_to_attributes_map[cache_key] = attributes
+            self.__dict__.update(_copied_attributes(attributes))
+        return attributes is not None
+
+    def _add_attributes_to_cache(self, cache_key):
+        _range_cache_key_to_attributes_map[cache_key] = _copied_attributes(self.__dict__)
+        if len(_range_cache_key_to_attributes_map) > RANGE_CACHE_SIZE:
+            _range_cache_key_to_attributes_map.popitem(last=False)
+
+    def _compile_intervals(self):
+        """
+        Merge :py:attr:`~cutplace.ranges.Range.items` into sorted intervals
+        that do not overlap so :py:meth:`~._contains` can find the only
+        interval a value might be in using bisection. Items without a lower
+        or upper limit are kept separately as the limits below and above
+        which any value is valid.
+        """
+        self._accepts_any_value = (self._items is None)
+        self._at_most = None
+        self._at_least = None
+        self._interval_lowers = []
+        self._interval_uppers = []
+        if self._items is not None:
+            intervals = []
+            for lower, upper in self._items:
+                if lower is None:
+                    # Handle "...y".
+                    if (self._at_most is None) or (upper > self._at_most):
+                        self._at_most = upper
+                elif upper is None:
+                    # Handle "x...".
+                    if (self._at_least is None) or (lower < self._at_least):
+                        self._at_least = lower
+                else:
+                    # Handle "x...y" and "x".
+                    intervals.append((lower, upper))
+            intervals.sort()
+            for lower, upper in intervals:
+                if (self._at_most is not None) and (lower <= self._at_most):
+                    self._at_most = max(self._at_most, upper)
+                elif self._interval_uppers and (lower <= self._interval_uppers[-1]):
+                    self._interval_uppers[-1] = max(self._interval_uppers[-1], upper)
+                else:
+                    self._interval_lowers.append(lower)
+                    self._interval_uppers.append(upper)
+            if self._at_least is not None:
+                while self._interval_uppers and (self._interval_uppers[-1] >= self._at_least):
+                    self._at_least = min(self._at_least, self._interval_lowers.pop())
+                    self._interval_uppers.pop()
+                if (self._at_most is not None) and (self._at_least <= self._at_most):
+                    self._accepts_any_value = True
+
+    def _contains(self, value):
+        """
+        ``True`` if ``value`` is within any of the
+        :py:attr:`~cutplace.ranges.Range.items`.
+        """
+        if self._accepts_any_value:
+            result = True
+        elif (self._at_most is not None) and (value <= self._at_most):
+            result = True
+        elif (self._at_least is not None) and (value >= self._at_least):
+            result = True
+        elif len(self._interval_lowers) == 1:
+            result = self._interval_lowers[0] <= value <= self._interval_uppers[0]
+        else:
+            interval_index = bisect.bisect_right(self._interval_lowers, value) - 1
+            result = (interval_index >= 0) and (value <= self._interval_uppers[interval_index])
+        return result
+
     def _items_overlap(self, some, other):
         assert some is not None
         assert len(some) == 2
@@ -459,24 +568,9 @@ class Range(object):
         assert name
         assert value is not None
 
-        if self._items is not None:
-            is_valid = False
-            item_index = 0
-            while not is_valid and item_index < len(self._items):
-                lower, upper = self._items[item_index]
-                if lower is None:
-                    assert upper is not None
-                    if value <= upper:
-                        is_valid = True
-                elif upper is None:
-                    if value >= lower:
-                        is_valid = True
-                elif (value >= lower) and (value <= upper):
-                    is_valid = True
-                item_index += 1
-            if not is_valid:
-                raise errors.RangeValueError(
-                    "%s is %r but must be within range: %s" % (name, value, self), location)
+        if not self._contains(value):
+            raise errors.RangeValueError(
+                "%s is %r but must be within range: %s" % (name, value, self), location)
 
 
 @python_2_unicode_compatible
@@ -486,6 +580,10 @@ class DecimalRange(Range):
 
         assert default is None or (default.strip() != ''), "default=%r" % default
 
+        cache_key = (type(self), description, default)
+        if self._set_attributes_from_cache(cache_key):
+            return
+
         self._precision = DEFAULT_PRECISION
         self._scale = DEFAULT_SCALE
 
@@ -623,6 +721,8 @@ class DecimalRange(Range):
                     self._upper_limit = None
                 elif (self._upper_limit is not None) and (upper_item > self._upper_limit):
                     self._upper_limit = upper_item
+        self._compile_intervals()
+        self._add_attributes_to_cache(cache_key)
 
     @property
     def precision(self):
@@ -701,21 +801,6 @@ class DecimalRange(Range):
         else:
             value_as_decimal = value
 
-        if self._items is not None:
-            is_valid = False
-            item_index = 0
-            while not is_valid and item_index < len(self._items):
-                lower, upper = self._items[item_index]
-                if lower is None:
-                    assert upper is not None
-                    if value_as_decimal <= upper:
-                        is_valid = True
-                elif upper is None:
-                    if value_as_decimal >= lower:
-                        is_valid = True
-                elif (value_as_decimal >= lower) and (value_as_decimal <= upper):
-                    is_valid = True
-                item_index += 1
-            if not is_valid:
-                raise errors.RangeValueError(
-                    "%s is %r but must be within range: %r" % (name, value_as_decimal, self), location)
+        if not self._contains(value_as_decimal):
+            raise errors.RangeValueError(
+                "%s is %r but must be within range: %r" % (name, value_as_decimal, self), location)
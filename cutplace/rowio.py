@@ -21,18 +21,34 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import bz2
+import codecs
 import csv
 import datetime
+import gzip
 import io
+import itertools
+import json
 import os
 import re
+import shutil
 import six
+import tempfile
+import threading
 import xlrd
 import xlsxwriter
 import zipfile
+import zlib
 from contextlib import closing
+from six.moves import queue
 from xml.etree import ElementTree
 
+try:
+    import lzma
+except ImportError:  # pragma: no cover
+    # Python 2 has no lzma module, so xz compressed data cannot be read.
+    lzma = None
+
 from cutplace import data
 from cutplace import errors
 from cutplace import _compat
@@ -41,6 +57,71 @@ from cutplace import _tools
 # Valid line delimiters for  `fixed_rows()`.
 _VALID_FIXED_ANY_LINE_DELIMITERS = ('\n', '\r', '\r\n')
 _VALID_FIXED_LINE_DELIMITERS = data.LINE_DELIMITER_TO_TEXT_MAP.keys()
+# Line delimiters `fixed_rows()` can handle by reading large blocks of data.
+# Other line delimiters always result in an error when reading from a path
+# due to universal newlines.
+_VALID_FIXED_BLOCK_LINE_DELIMITERS = (None, '\n', 'any')
+
+#: Default number of bytes for chunks computed by `delimited_chunks()` and
+#: `fixed_chunks()`.
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+#: Default number of rows between two entries of a `RowIndex`.
+DEFAULT_ROW_INDEX_STEP = 10000
+
+#: Suffix added to the path of data files to obtain the path of the sidecar
+#: file storing their `RowIndex`.
+ROW_INDEX_SUFFIX = '.cutplace-index'
+
+#: Default number of rows `pipelined_rows()` passes from the reading thread
+#: to the consumer at once.
+DEFAULT_PIPELINE_BATCH_SIZE = 256
+
+#: Default number of batches `pipelined_rows()` reads ahead, which is
+#: enough to bridge the latency of network file systems.
+DEFAULT_PIPELINE_QUEUE_DEPTH = 16
+
+# Seconds after which the reading thread of `pipelined_rows()` checks if
+# the consumer has stopped while waiting for room in the queue.
+_PIPELINE_POLL_INTERVAL = 0.1
+
+#: Default number of bytes at the start of the data examined by
+#: `sniff_data_format()`.
+DEFAULT_SNIFF_SIZE = 256 * 1024
+
+# Item delimiters `sniff_data_format()` considers, in order of preference.
+_SNIFF_ITEM_DELIMITERS = (',', ';', '\t', '|', ':')
+# Byte order marks and the encodings they indicate; UTF-32 has to come
+# before UTF-16 because their little endian marks start the same.
+_SNIFF_BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+# Encodings `sniff_data_format()` tries if there is no byte order mark;
+# the last one can decode any data.
+_SNIFF_ENCODINGS = ('utf-8', 'cp1252', 'iso-8859-1')
+_SNIFF_NUMBER_REGEX = re.compile(r'^\s*[+-]?(\d+([.,]\d*)*|[.,]\d+)([eE][+-]?\d+)?\s*$')
+
+# Number of bytes to read at once when scanning data for chunk boundaries or
+# reading fixed data.
+_READ_BLOCK_SIZE = 1024 * 1024
+
+# Compressions that can be read transparently and their signatures at the
+# start of the compressed data.
+_COMPRESSION_SIGNATURES = (
+    ('bz2', b'BZh'),
+    ('gzip', b'\x1f\x8b'),
+    ('xz', b'\xfd7zXZ\x00'),
+)
+_DECOMPRESSION_ERRORS = (EOFError, EnvironmentError, zipfile.BadZipfile, zlib.error) + ((lzma.LZMAError,) if lzma is not None else ())
+
+#: Separator between the path of a ZIP archive and the name of a member
+#: stored in it, for example ``'bundle.zip!customers.csv'``.
+ARCHIVE_MEMBER_SEPARATOR = '!'
+_ARCHIVE_MEMBER_PATH_REGEX = re.compile(r'^(?P<archive>.+?\.zip)!(?P<member>.+)$', re.IGNORECASE)
 
 # Namespaces used by OpenOffice.org documents.
 _OOO_NAMESPACES = {
@@ -73,19 +154,6 @@ _OOO_NAMESPACES = {
     'xsd': 'http://www.w3.org/2001/XMLSchema',
     'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
 }
-_NUMBER_COLUMNS_REPEATED = '{' + _OOO_NAMESPACES['table'] + '}number-columns-repeated'
-
-if six.PY2:
-    # HACK: Prepare ``ElementTree`` for namespaced find operations.
-    # See also: <http://effbot.org/zone/element-namespaces.htm>.
-    try:
-        register_namespace = ElementTree.register_namespace
-    except AttributeError:
-        def register_namespace(prefix, uri):
-            ElementTree._namespace_map[uri] = prefix
-
-    for short_name, url in _OOO_NAMESPACES.items():
-        register_namespace(short_name, url)
 
 
 def _excel_cell_value(cell, datemode):
@@ -130,13 +198,413 @@ def _excel_cell_value(cell, datemode):
     return result
 
 
-def excel_rows(source_path, sheet=1):
+_XLSX_MAIN_NAMESPACE = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_XLSX_C_TAG = '{%s}c' % _XLSX_MAIN_NAMESPACE
+_XLSX_CELL_XFS_TAG = '{%s}cellXfs' % _XLSX_MAIN_NAMESPACE
+_XLSX_DIMENSION_TAG = '{%s}dimension' % _XLSX_MAIN_NAMESPACE
+_XLSX_IS_TAG = '{%s}is' % _XLSX_MAIN_NAMESPACE
+_XLSX_NUM_FMT_TAG = '{%s}numFmt' % _XLSX_MAIN_NAMESPACE
+_XLSX_R_TAG = '{%s}r' % _XLSX_MAIN_NAMESPACE
+_XLSX_ROW_TAG = '{%s}row' % _XLSX_MAIN_NAMESPACE
+_XLSX_SHEET_TAG = '{%s}sheet' % _XLSX_MAIN_NAMESPACE
+_XLSX_SI_TAG = '{%s}si' % _XLSX_MAIN_NAMESPACE
+_XLSX_T_TAG = '{%s}t' % _XLSX_MAIN_NAMESPACE
+_XLSX_V_TAG = '{%s}v' % _XLSX_MAIN_NAMESPACE
+_XLSX_WORKBOOK_PR_TAG = '{%s}workbookPr' % _XLSX_MAIN_NAMESPACE
+_XLSX_XF_TAG = '{%s}xf' % _XLSX_MAIN_NAMESPACE
+_XLSX_RELATIONSHIP_TAG = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+_XLSX_RELATIONSHIP_ID_ATTRIBUTE = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+_XLSX_WORKSHEET_RELATIONSHIP_TYPE = 'worksheet'
+_XML_SPACE_ATTRIBUTE = '{http://www.w3.org/XML/1998/namespace}space'
+
+# Built in number formats for dates and times; see ECMA-376, part 1, 18.8.30.
+_XLSX_DATE_NUMBER_FORMAT_IDS = set(list(range(14, 23)) + list(range(45, 48)))
+
+_XLSX_ESCAPE_REGEX = re.compile(r'_x[0-9A-Fa-f]{4}_')
+_XLSX_QUOTED_OR_BRACKETED_OR_ESCAPED_REGEX = re.compile(r'"[^"]*"|\[[^\]]*\]|[\\_*].')
+_XLSX_DATE_FORMAT_CHARACTERS = set('dhmsyDHMSY')
+_XLSX_NUMBER_FORMAT_CHARACTERS = set('#0?')
+
+_ZIP_SIGNATURE = b'PK\x03\x04'
+
+# Maximum number of texts for Excel numbers to remember while reading a sheet.
+_MAX_EXCEL_NUMBER_TO_TEXT_COUNT = 10000
+
+_EXCEL_ERROR_TEXTS = set(xlrd.error_text_from_code.values())
+
+
+def _is_xlsx_date_format(format_code):
+    """
+    ``True`` if the Excel number format ``format_code`` describes a date or
+    time using the same heuristic as :py:mod:`xlrd`: ignoring quoted texts,
+    escaped characters and anything in brackets, it contains more date
+    characters (such as "d" or "m") than number characters (such as "0").
+    """
+    assert format_code is not None
+
+    reduced_format_code = _XLSX_QUOTED_OR_BRACKETED_OR_ESCAPED_REGEX.sub('', format_code)
+    if reduced_format_code.lower() == 'general':
+        result = False
+    else:
+        date_character_count = sum(1 for code in reduced_format_code if code in _XLSX_DATE_FORMAT_CHARACTERS)
+        number_character_count = sum(1 for code in reduced_format_code if code in _XLSX_NUMBER_FORMAT_CHARACTERS)
+        result = date_character_count > number_character_count
+    return result
+
+
+def _xlsx_text(element):
+    """
+    The text of an XLSX ``element`` with leading and trailing white space
+    removed unless ``xml:space="preserve"`` and characters escaped using
+    "_xHHHH_" resolved.
+    """
+    result = element.text
+    if result is None:
+        result = ''
+    else:
+        if element.get(_XML_SPACE_ATTRIBUTE) != 'preserve':
+            result = result.strip('\t\n\r ')
+        if '_' in result:
+            result = _XLSX_ESCAPE_REGEX.sub(lambda match: six.unichr(int(match.group(0)[2:6], 16)), result)
+        if six.PY2 and isinstance(result, six.binary_type):
+            result = six.text_type(result, 'utf-8')
+    return result
+
+
+def _xlsx_rich_text(element):
+    """
+    The text of an XLSX ``<si>`` or ``<is>`` element that can consist of a
+    single ``<t>`` or multiple runs ``<r>`` with formatted text.
+    """
+    texts = []
+    for child in element:
+        if child.tag == _XLSX_T_TAG:
+            texts.append(_xlsx_text(child))
+        elif child.tag == _XLSX_R_TAG:
+            texts.extend(_xlsx_text(t_element) for t_element in child.findall(_XLSX_T_TAG))
+    return ''.join(texts)
+
+
+def _xlsx_column_index(cell_reference):
+    """
+    The zero based column index of ``cell_reference``, for example 0 for
+    "A1" and 27 for "AB17".
+    """
+    result = 0
+    for code in cell_reference:
+        if 'A' <= code <= 'Z':
+            result = 26 * result + ord(code) - ord('A') + 1
+        elif code != '$':
+            break
+    return result - 1
+
+
+class _XlsxWorkbook(object):
+    """
+    Information from an XLSX workbook needed to convert the cells of a
+    worksheet to text. Only the worksheet itself is read incrementally;
+    the workbook structure, styles and shared strings are small in
+    comparison and are read completely.
+    """
+    def __init__(self, zip_archive, location):
+        assert zip_archive is not None
+        assert location is not None
+
+        self._zip_archive = zip_archive
+        self._location = location
+        # Names in the archive are case insensitive.
+        self._lower_name_to_name_map = dict((name.lower(), name) for name in zip_archive.namelist())
+        self.datemode = 0
+        self.sheet_paths = []
+        self.shared_strings = []
+        self.date_styles = []
+        self._read_workbook()
+        self._read_styles()
+        self._read_shared_strings()
+
+    def open(self, member_name):
+        """
+        Stream to read ``member_name`` from the archive or ``None`` if the
+        archive has no such member.
+        """
+        name = self._lower_name_to_name_map.get(member_name.lower())
+        return self._zip_archive.open(name) if name is not None else None
+
+    def _parsed(self, member_name):
+        member_stream = self.open(member_name)
+        if member_stream is None:
+            raise errors.DataFormatError('cannot read Excel file: archive must contain %s' % member_name, self._location)
+        with closing(member_stream):
+            return ElementTree.parse(member_stream).getroot()
+
+    def _read_workbook(self):
+        relationship_id_to_path_map = {}
+        for relationship_element in self._parsed('xl/_rels/workbook.xml.rels').iter(_XLSX_RELATIONSHIP_TAG):
+            if relationship_element.get('Type').split('/')[-1] == _XLSX_WORKSHEET_RELATIONSHIP_TYPE:
+                target = relationship_element.get('Target').replace('\\', '/')
+                sheet_path = target[1:] if target.startswith('/') else 'xl/' + target
+                relationship_id_to_path_map[relationship_element.get('Id')] = sheet_path
+        workbook_root = self._parsed('xl/workbook.xml')
+        workbook_pr_element = workbook_root.find(_XLSX_WORKBOOK_PR_TAG)
+        if workbook_pr_element is not None:
+            self.datemode = 1 if workbook_pr_element.get('date1904') in ('1', 'true') else 0
+        for sheet_element in workbook_root.iter(_XLSX_SHEET_TAG):
+            sheet_path = relationship_id_to_path_map.get(sheet_element.get(_XLSX_RELATIONSHIP_ID_ATTRIBUTE))
+            if sheet_path is not None:
+                self.sheet_paths.append(sheet_path)
+
+    def _read_styles(self):
+        styles_stream = self.open('xl/styles.xml')
+        if styles_stream is not None:
+            with closing(styles_stream):
+                styles_root = ElementTree.parse(styles_stream).getroot()
+            date_number_format_ids = set(_XLSX_DATE_NUMBER_FORMAT_IDS)
+            for number_format_element in styles_root.iter(_XLSX_NUM_FMT_TAG):
+                number_format_id = int(number_format_element.get('numFmtId'))
+                if _is_xlsx_date_format(number_format_element.get('formatCode', '')):
+                    date_number_format_ids.add(number_format_id)
+                else:
+                    date_number_format_ids.discard(number_format_id)
+            cell_xfs_element = styles_root.find(_XLSX_CELL_XFS_TAG)
+            if cell_xfs_element is not None:
+                self.date_styles = [
+                    int(xf_element.get('numFmtId', '0')) in date_number_format_ids
+                    for xf_element in cell_xfs_element.findall(_XLSX_XF_TAG)
+                ]
+
+    def _read_shared_strings(self):
+        shared_strings_stream = self.open('xl/sharedStrings.xml')
+        if shared_strings_stream is not None:
+            with closing(shared_strings_stream):
+                for _, element in ElementTree.iterparse(shared_strings_stream):
+                    if element.tag == _XLSX_SI_TAG:
+                        self.shared_strings.append(_xlsx_rich_text(element))
+                        element.clear()
+
+    def cell_value(self, cell_element):
+        """
+        The text of ``cell_element`` as :py:func:`_excel_cell_value` would
+        return it for the cell read by :py:mod:`xlrd`, or ``None`` if the
+        cell is empty.
+        """
+        cell_type = cell_element.get('t', 'n')
+        value_element = cell_element.find(_XLSX_V_TAG)
+        value_text = value_element.text if value_element is not None else None
+        if cell_type == 'n':
+            if value_text:
+                style_index = int(cell_element.get('s', '0'))
+                is_date = (style_index < len(self.date_styles)) and self.date_styles[style_index]
+                cell = xlrd.sheet.Cell(xlrd.XL_CELL_DATE if is_date else xlrd.XL_CELL_NUMBER, float(value_text))
+                result = _excel_cell_value(cell, self.datemode)
+            else:
+                result = None
+        elif cell_type == 's':
+            result = self.shared_strings[int(value_text)] if value_text else None
+        elif cell_type == 'str':
+            result = _xlsx_text(value_element) if value_element is not None else ''
+        elif cell_type == 'inlineStr':
+            is_element = cell_element.find(_XLSX_IS_TAG)
+            if is_element is not None:
+                result = _xlsx_rich_text(is_element)
+            else:
+                result = value_text
+            result = result or None
+        elif cell_type == 'b':
+            result = '1' if value_text in ('1', 'true') else '0'
+        elif cell_type == 'e':
+            result = value_text if value_text in _EXCEL_ERROR_TEXTS else xlrd.error_text_from_code[0x2a]
+        elif cell_type == 'd':
+            result = value_text
+        else:
+            raise errors.DataFormatError('cell type is %s but must be one of: b, d, e, inlineStr, n, s, str'
+                                         % _compat.text_repr(cell_type), self._location)
+        if six.PY2 and isinstance(result, six.binary_type):
+            result = six.text_type(result, 'utf-8')
+        return result
+
+
+def _xlsx_valued_rows(sheet_stream, cell_value, dimension_column_count):
+    """
+    Pairs ``(row_number, column_index_to_value_map)`` for the rows in the
+    worksheet XML ``sheet_stream`` that contain at least one cell for which
+    ``cell_value(cell_element)`` is not ``None``. Rows are parsed
+    incrementally and removed from the tree once processed. If the
+    worksheet has a ``<dimension>``, set the first item of the list
+    ``dimension_column_count`` to the number of columns it covers.
+    """
+    row_number = 0
+    element_stack = []
+    for event, element in ElementTree.iterparse(sheet_stream, events=('start', 'end')):
+        if event == 'start':
+            element_stack.append(element)
+        else:
+            element_stack.pop()
+            if element.tag == _XLSX_DIMENSION_TAG:
+                last_cell_reference = element.get('ref', 'A1').split(':')[-1]
+                dimension_column_count[0] = _xlsx_column_index(last_cell_reference) + 1
+            elif element.tag == _XLSX_ROW_TAG:
+                row_number_text = element.get('r')
+                row_number = int(row_number_text) if row_number_text is not None else row_number + 1
+                column_index_to_value_map = {}
+                column_index = -1
+                for cell_element in element.iter(_XLSX_C_TAG):
+                    cell_reference = cell_element.get('r')
+                    column_index = _xlsx_column_index(cell_reference) \
+                        if cell_reference is not None else column_index + 1
+                    value = cell_value(cell_element)
+                    if value is not None:
+                        column_index_to_value_map[column_index] = value
+                if column_index_to_value_map:
+                    yield row_number, column_index_to_value_map
+                # Remove the processed row so the tree does not grow while parsing.
+                del element_stack[-1][:]
+
+
+def _xlsx_rows(xlsx_source, sheet, location, cell_count=None):
+    """
+    Rows in ``sheet`` of XLSX document ``xlsx_source`` (a path or a seekable
+    binary stream) parsed incrementally
+    in the same format as :py:mod:`xlrd` would provide them. Empty cells at
+    the end of a row beyond ``cell_count`` are dropped.
+
+    Like :py:attr:`xlrd.sheet.Sheet.ncols`, the number of columns only
+    considers cells with values, so formatted but empty cells do not add
+    columns. The worksheet does not store this number, but the
+    ``<dimension>`` of the worksheet is an upper limit for it. So rows are
+    yielded as soon as the columns found so far reach ``cell_count`` or
+    this limit. Until then, rows are kept and padded once the number of
+    columns is known, at the latest at the end of the worksheet.
+    """
+    assert xlsx_source is not None
+    assert sheet >= 1
+    assert location is not None
+
+    try:
+        zip_archive = zipfile.ZipFile(xlsx_source, 'r')
+        with closing(zip_archive):
+            workbook = _XlsxWorkbook(zip_archive, location)
+            sheet_count = len(workbook.sheet_paths)
+            if sheet_count < sheet:
+                raise errors.DataFormatError(
+                    'Excel document must contain at least %d sheet(s) instead of just %d' % (sheet, sheet_count),
+                    location)
+            sheet_path = workbook.sheet_paths[sheet - 1]
+            sheet_stream = workbook.open(sheet_path)
+            if sheet_stream is None:
+                raise errors.DataFormatError('cannot read Excel file: archive must contain %s' % sheet_path, location)
+            # HACK: list with the column count of the dimension so `_xlsx_valued_rows()` can modify it.
+            dimension_column_count = [None]
+            column_count = 0
+            is_column_count_known = False
+            pending_rows = []
+            row_count = 0
+            with closing(sheet_stream):
+                valued_rows = _xlsx_valued_rows(sheet_stream, workbook.cell_value, dimension_column_count)
+                for row_number, column_index_to_value_map in itertools.chain(valued_rows, [(None, None)]):
+                    if row_number is not None:
+                        pending_rows.append((row_number, column_index_to_value_map))
+                        column_count = max(column_count, max(column_index_to_value_map) + 1)
+                        max_column_count = dimension_column_count[0]
+                        if (max_column_count is not None) and (column_count > max_column_count):
+                            # The dimension is broken, so it is no limit.
+                            max_column_count = None
+                            dimension_column_count[0] = None
+                        is_column_count_known = is_column_count_known \
+                            or ((cell_count is not None) and (column_count >= cell_count)) \
+                            or (column_count == max_column_count)
+                    else:
+                        is_column_count_known = True
+                    if is_column_count_known:
+                        empty_row_cell_count = column_count if cell_count is None else min(cell_count, column_count)
+                        for pending_row_number, pending_column_index_to_value_map in pending_rows:
+                            while row_count < pending_row_number - 1:
+                                yield [''] * empty_row_cell_count
+                                location.advance_line()
+                                row_count += 1
+                            row_cell_count = max(empty_row_cell_count, max(pending_column_index_to_value_map) + 1)
+                            yield [
+                                pending_column_index_to_value_map.get(column_index, '')
+                                for column_index in range(row_cell_count)
+                            ]
+                            location.advance_line()
+                            row_count += 1
+                        pending_rows = []
+    except errors.DataFormatError:
+        raise
+    except (ElementTree.ParseError, zipfile.BadZipfile, zlib.error, KeyError, ValueError) as error:
+        raise errors.DataFormatError('cannot read Excel file: %s' % error, location)
+
+
+def _xls_row(cell_types, cell_values, datemode, number_to_text_map):
+    """
+    The texts for a row of an :file:`*.xls` document with ``cell_types``
+    and ``cell_values`` as obtained from :py:meth:`xlrd.sheet.Sheet.row_types`
+    and :py:meth:`xlrd.sheet.Sheet.row_values`. The result is the same as
+    calling :py:func:`_excel_cell_value` for each cell but avoids the
+    overhead for the most common cell types and remembers the texts of
+    numbers in ``number_to_text_map``, which should be shared by all rows.
+    """
+    result = []
+    for cell_type, cell_value in zip(cell_types, cell_values):
+        if cell_type == xlrd.XL_CELL_TEXT:
+            result.append(cell_value)
+        elif cell_type == xlrd.XL_CELL_NUMBER:
+            cell_text = number_to_text_map.get(cell_value)
+            if cell_text is None:
+                cell_text = six.text_type(cell_value)
+                if cell_text.endswith('.0'):
+                    cell_text = cell_text[:-2]
+                # Do not remember 0 because -0.0 == 0.0 but their texts differ.
+                if (cell_value != 0) and (len(number_to_text_map) < _MAX_EXCEL_NUMBER_TO_TEXT_COUNT):
+                    number_to_text_map[cell_value] = cell_text
+            result.append(cell_text)
+        elif cell_type in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+            result.append('')
+        else:
+            result.append(_excel_cell_value(xlrd.sheet.Cell(cell_type, cell_value), datemode))
+    return result
+
+
+def _is_xlsx(excel_source):
+    """
+    ``True`` if ``excel_source`` (a path or a seekable binary stream)
+    starts like a ZIP archive and consequently most likely is an XLSX
+    document. Similar to :py:mod:`xlrd`, this only checks the first few
+    bytes because old Excel documents might contain the signature for the
+    end of a ZIP archive by chance.
+    """
+    if isinstance(excel_source, six.string_types):
+        try:
+            with io.open(excel_source, 'rb') as source_stream:
+                result = (source_stream.read(len(_ZIP_SIGNATURE)) == _ZIP_SIGNATURE)
+        except EnvironmentError:
+            # Let xlrd report the error.
+            result = False
+    else:
+        result = (excel_source.read(len(_ZIP_SIGNATURE)) == _ZIP_SIGNATURE)
+        excel_source.seek(0)
+    return result
+
+
+def excel_rows(source_path, sheet=1, cell_count=None):
     """
     Rows read from an Excel document (both :file:`*.xls` and :file:`*.xlsx`
     thanks to :py:mod:`xlrd`).
 
+    Worksheets of :file:`*.xlsx` documents are parsed incrementally, so
+    memory consumption does not depend on the size of the sheet. Other
+    sheets of the document are not read at all.
+
+    Documents stored in a ZIP archive as described with
+    :py:func:`split_archive_member_path` are extracted to a temporary file
+    first because reading them requires random access.
+
     :param str source_path: path to the Excel file to be read
     :param int sheet: the sheet in the file to be read
+    :param cell_count: number of cells expected in each row; for \
+      :file:`*.xlsx` documents, empty cells at the end of a row beyond \
+      ``cell_count`` are dropped; ``None`` means to keep all cells
+    :type: int or None
     :return: sequence of lists with each list representing a row in the \
       Excel file
     :raises cutplace.errors.DataFormatError: in case the file cannot be read
@@ -145,21 +613,253 @@ def excel_rows(source_path, sheet=1):
     assert sheet >= 1, 'sheet=%r' % sheet
 
     location = errors.Location(source_path, has_cell=True)
-    try:
-        with xlrd.open_workbook(source_path) as book:
-            sheet = book.sheet_by_index(0)
-            datemode = book.datemode
-            for y in range(sheet.nrows):
-                row = []
-                for x in range(sheet.ncols):
-                    row.append(_excel_cell_value(sheet.cell(y, x), datemode))
-                    location.advance_cell()
+    if is_archive_member_path(source_path):
+        with closing(_extracted_archive_member(source_path)) as excel_stream:
+            for row in _excel_rows(excel_stream, sheet, location, cell_count):
                 yield row
-                location.advance_line()
-    except xlrd.XLRDError as error:
-        raise errors.DataFormatError('cannot read Excel file: %s' % error, location)
-    except UnicodeError as error:
-        raise errors.DataFormatError('cannot decode Excel data: %s' % error, location)
+    else:
+        for row in _excel_rows(source_path, sheet, location, cell_count):
+            yield row
+
+
+def _excel_rows(excel_source, sheet, location, cell_count):
+    """
+    Same as :py:func:`excel_rows` but reading from ``excel_source``, which
+    is a path or a seekable binary stream.
+    """
+    if _is_xlsx(excel_source):
+        for row in _xlsx_rows(excel_source, sheet, location, cell_count):
+            yield row
+    else:
+        if isinstance(excel_source, six.string_types):
+            open_workbook_kwargs = {'filename': excel_source}
+        else:
+            open_workbook_kwargs = {'file_contents': excel_source.read()}
+        try:
+            # Only load the sheet actually needed.
+            with xlrd.open_workbook(on_demand=True, **open_workbook_kwargs) as book:
+                if book.nsheets < sheet:
+                    raise errors.DataFormatError(
+                        'Excel document must contain at least %d sheet(s) instead of just %d' % (sheet, book.nsheets),
+                        location)
+                excel_sheet = book.sheet_by_index(sheet - 1)
+                datemode = book.datemode
+                number_to_text_map = {}
+                for y in range(excel_sheet.nrows):
+                    try:
+                        row = _xls_row(excel_sheet.row_types(y), excel_sheet.row_values(y), datemode, number_to_text_map)
+                    except xlrd.XLDateError as error:
+                        # Find the broken cell only now to avoid tracking the location for each cell.
+                        for x in range(excel_sheet.ncols):
+                            try:
+                                _excel_cell_value(excel_sheet.cell(y, x), datemode)
+                            except xlrd.XLDateError:
+                                location.set_cell(x)
+                                break
+                        raise errors.DataFormatError('cannot convert Excel date: %s' % error, location)
+                    yield row
+                    location.advance_line()
+        except xlrd.XLRDError as error:
+            raise errors.DataFormatError('cannot read Excel file: %s' % error, location)
+        except UnicodeError as error:
+            raise errors.DataFormatError('cannot decode Excel data: %s' % error, location)
+
+
+def compression_of(data_path):
+    """
+    The compression of the data in ``data_path`` as determined by the
+    signature at its start, or ``None`` if the data are not compressed.
+    Possible compressions are ``'bz2'``, ``'gzip'`` and ``'xz'``. Members
+    of ZIP archives as described with :py:func:`split_archive_member_path`
+    have no compression on their own.
+    """
+    assert data_path is not None
+
+    result = None
+    if not is_archive_member_path(data_path):
+        max_signature_length = max(len(signature) for _, signature in _COMPRESSION_SIGNATURES)
+        with io.open(data_path, 'rb') as data_stream:
+            start = data_stream.read(max_signature_length)
+        for compression, signature in _COMPRESSION_SIGNATURES:
+            if start.startswith(signature):
+                result = compression
+                break
+    return result
+
+
+class _DecompressingIO(io.RawIOBase):
+    """
+    Raw binary stream named ``name`` providing the data of
+    ``decompressed_file``, which decompresses data using ``compression``.
+    Closing the stream also closes ``archive`` unless it is ``None``.
+    """
+    def __init__(self, name, compression, decompressed_file, archive=None):
+        assert name is not None
+        assert compression is not None
+        assert decompressed_file is not None
+
+        super(_DecompressingIO, self).__init__()
+        self.name = name
+        self._compression = compression
+        self._decompressed_file = decompressed_file
+        self._archive = archive
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        try:
+            data = self._decompressed_file.read(len(buffer))
+        except _DECOMPRESSION_ERRORS as error:
+            raise errors.DataFormatError(
+                'cannot decompress %s data: %s' % (self._compression, error), errors.Location(self.name))
+        data_length = len(data)
+        buffer[:data_length] = data
+        return data_length
+
+    def close(self):
+        if not self.closed:
+            self._decompressed_file.close()
+            if self._archive is not None:
+                self._archive.close()
+        super(_DecompressingIO, self).close()
+
+
+def _decompressing_io(compressed_path, compression):
+    """
+    A :py:class:`_DecompressingIO` for the data in ``compressed_path``
+    compressed using ``compression``.
+    """
+    assert compressed_path is not None
+    assert compression in [compression for compression, _ in _COMPRESSION_SIGNATURES]
+
+    if compression == 'bz2':
+        decompressed_file = bz2.BZ2File(compressed_path, 'rb')
+    elif compression == 'gzip':
+        decompressed_file = gzip.GzipFile(compressed_path, 'rb')
+    else:
+        assert compression == 'xz'
+        if lzma is None:  # pragma: no cover
+            raise errors.DataFormatError(
+                'cannot decompress xz data without module lzma', errors.Location(compressed_path))
+        decompressed_file = lzma.LZMAFile(compressed_path, 'rb')
+    return _DecompressingIO(compressed_path, compression, decompressed_file)
+
+
+def split_archive_member_path(data_path):
+    """
+    Tuple ``(archive_path, member_name)`` for a ``data_path`` referring to
+    a member of a ZIP archive such as ``'bundle.zip!customers.csv'``, or
+    ``(data_path, None)`` for any other path. The archive has to have the
+    suffix :file:`.zip`.
+    """
+    assert data_path is not None
+
+    match = _ARCHIVE_MEMBER_PATH_REGEX.match(data_path)
+    if match is not None:
+        result = match.group('archive'), match.group('member')
+    else:
+        result = data_path, None
+    return result
+
+
+def is_archive_member_path(data_path):
+    """
+    ``True`` if ``data_path`` refers to a member of a ZIP archive as
+    described with :py:func:`split_archive_member_path`.
+    """
+    return split_archive_member_path(data_path)[1] is not None
+
+
+def archive_member_paths(archive_path):
+    """
+    Paths referring to the files stored in the ZIP archive
+    ``archive_path`` in the form ``'bundle.zip!customers.csv'``.
+
+    :raises cutplace.errors.DataFormatError: if ``archive_path`` is not a \
+      ZIP archive
+    """
+    assert archive_path is not None
+
+    try:
+        # HACK: Use ``closing()`` because of Python 2.6.
+        with closing(zipfile.ZipFile(archive_path, 'r')) as zip_archive:
+            member_names = [name for name in zip_archive.namelist() if not name.endswith('/')]
+    except zipfile.BadZipfile as error:
+        raise errors.DataFormatError('cannot read ZIP archive: %s' % error, errors.Location(archive_path))
+    return [archive_path + ARCHIVE_MEMBER_SEPARATOR + member_name for member_name in member_names]
+
+
+def _open_archive_member(archive_path, member_name, data_path):
+    location = errors.Location(data_path)
+    try:
+        zip_archive = zipfile.ZipFile(archive_path, 'r')
+    except zipfile.BadZipfile as error:
+        raise errors.DataFormatError('cannot read ZIP archive: %s' % error, location)
+    try:
+        member_file = zip_archive.open(member_name)
+    except KeyError:
+        zip_archive.close()
+        raise errors.DataFormatError(
+            'ZIP archive must contain member %s' % _compat.text_repr(member_name), location)
+    except Exception:
+        zip_archive.close()
+        raise
+    return _DecompressingIO(data_path, 'zip', member_file, zip_archive)
+
+
+def _extracted_archive_member(data_path):
+    """
+    Seekable binary stream with the data of the ZIP archive member
+    ``data_path`` as described with :py:func:`split_archive_member_path`.
+    The data are extracted to a temporary file that is removed once the
+    stream is closed.
+    """
+    archive_path, member_name = split_archive_member_path(data_path)
+    assert member_name is not None, 'data_path=%r' % data_path
+
+    result = tempfile.TemporaryFile()
+    try:
+        with closing(_open_archive_member(archive_path, member_name, data_path)) as member_io:
+            shutil.copyfileobj(member_io, result, _READ_BLOCK_SIZE)
+        result.seek(0)
+    except Exception:
+        result.close()
+        raise
+    return result
+
+
+def open_data(data_path, encoding=None, newline=None):
+    """
+    Stream to read the data in ``data_path``, which are decompressed on the
+    fly in case they are compressed as described with
+    :py:func:`compression_of` or stored in a ZIP archive as described with
+    :py:func:`split_archive_member_path`. Decompressed data are read in
+    large blocks.
+
+    :param encoding: the encoding to read text; ``None`` means to read \
+      binary data
+    :type: str or None
+    :param newline: same as with :py:func:`io.open` when reading text
+    """
+    assert data_path is not None
+
+    archive_path, member_name = split_archive_member_path(data_path)
+    if member_name is not None:
+        decompressing_io = _open_archive_member(archive_path, member_name, data_path)
+    else:
+        compression = compression_of(data_path)
+        decompressing_io = _decompressing_io(data_path, compression) if compression is not None else None
+    if decompressing_io is None:
+        if encoding is None:
+            result = io.open(data_path, 'rb')
+        else:
+            result = io.open(data_path, 'r', encoding=encoding, newline=newline)
+    else:
+        result = io.BufferedReader(decompressing_io, _READ_BLOCK_SIZE)
+        if encoding is not None:
+            result = io.TextIOWrapper(result, encoding=encoding, newline=newline)
+    return result
 
 
 def _raise_delimited_data_format_error(delimited_path, reader, error):
@@ -204,7 +904,7 @@ def delimited_rows(delimited_source, data_format):
       a valid delimited file
     """
     if isinstance(delimited_source, six.string_types):
-        delimited_stream = io.open(delimited_source, 'r', newline='', encoding=data_format.encoding)
+        delimited_stream = open_data(delimited_source, data_format.encoding, '')
         has_opened_delimited_stream = True
     else:
         delimited_stream = delimited_source
@@ -222,101 +922,213 @@ def delimited_rows(delimited_source, data_format):
             delimited_stream.close()
 
 
-def _findall(element, xpath, namespaces):
-    if six.PY2:
-        resolved_xpath = xpath
-        for short_name, url in namespaces.items():
-            resolved_xpath = re.sub(r'\b' + short_name + ':', '{' + url + '}', resolved_xpath)
-        result = element.findall(resolved_xpath)
-    else:
-        result = element.findall(xpath, namespaces)
+def _ods_tag(short_tag):
+    """
+    The fully qualified tag for ``short_tag`` of the form "prefix:name"
+    with "prefix" being a key of ``_OOO_NAMESPACES``.
+    """
+    prefix, name = short_tag.split(':')
+    return '{' + _OOO_NAMESPACES[prefix] + '}' + name
+
+
+_ODS_SPREADSHEET_TAG = _ods_tag('office:spreadsheet')
+_ODS_TABLE_TAG = _ods_tag('table:table')
+_ODS_TABLE_CELL_TAG = _ods_tag('table:table-cell')
+_ODS_TABLE_ROW_TAG = _ods_tag('table:table-row')
+_ODS_TEXT_P_TAG = _ods_tag('text:p')
+
+
+def _ods_repeated_count(element, attribute_name, location):
+    """
+    The number of times ``element`` is repeated according to the ODS
+    attribute ``attribute_name``, for example "table:number-rows-repeated".
+    """
+    repeated_text = element.attrib.get(_ods_tag(attribute_name), '1')
+    try:
+        result = int(repeated_text)
+    except ValueError:
+        raise errors.DataFormatError(
+            '%s is %s but must be an integer' % (attribute_name, _compat.text_repr(repeated_text)), location)
+    if result < 1:
+        raise errors.DataFormatError(
+            '%s is %s but must be at least 1' % (attribute_name, _compat.text_repr(repeated_text)), location)
     return result
 
 
-def ods_rows(source_ods_path, sheet=1):
+def _ods_cell_runs(table_row, location):
     """
-    Rows stored in ODS document ``source_ods_path`` in ``sheet``.
+    The cell values of the ODS ``table_row`` element, which must be fully
+    parsed, as list of pairs ``(cell_value, repeated_count)``.
+    """
+    result = []
+    for table_cell in table_row.findall(_ODS_TABLE_CELL_TAG):
+        repeated_count = _ods_repeated_count(table_cell, 'table:number-columns-repeated', location)
+        text_p = table_cell.find(_ODS_TEXT_P_TAG)
+        if text_p is None:
+            cell_value = ''
+        else:
+            cell_value = text_p.text
+            if six.PY2:
+                # HACK: It seems that under Python 2 ElementTree.find() returns a unicode string only of the value
+                # actually contains non ASCII characters, and otherwise a binary string. To work around this we
+                # check the result for binary strings and possibly convert them to uncicode strings assuming UTF-8
+                # to be the internal encoding for the XML file. Ideally we would parse the XML header for the
+                # encoding. Considering that Python 2 is on the way out, this just doesn't seem to be worth the
+                # trouble right now.
+                if isinstance(cell_value, six.binary_type):
+                    cell_value = six.text_type(cell_value, 'utf-8')
+                else:
+                    assert isinstance(cell_value, six.text_type), 'cell_value=%r' % cell_value
+        result.append((cell_value, repeated_count))
+        location.advance_cell(repeated_count)
+    return result
 
-    :raises cutplace.errors.DataFormarError: if ``source_ods_path`` is not \
-      a valid ODS file.
+
+def _ods_row(cell_runs, cell_count=None):
     """
-    assert sheet >= 1
+    The row described by ``cell_runs`` as returned by
+    :py:func:`_ods_cell_runs`. If ``cell_count`` is not ``None``, empty
+    cells at the end of the row beyond ``cell_count`` are dropped without
+    ever expanding them.
+    """
+    assert (cell_count is None) or (cell_count >= 0)
+
+    run_count = len(cell_runs)
+    if cell_count is not None:
+        while (run_count >= 1) and not cell_runs[run_count - 1][0]:
+            run_count -= 1
+    result = []
+    for cell_value, repeated_count in cell_runs[:run_count]:
+        if repeated_count == 1:
+            result.append(cell_value)
+        else:
+            result.extend([cell_value] * repeated_count)
+    if cell_count is not None:
+        trailing_empty_count = min(
+            cell_count - len(result), sum(repeated_count for _, repeated_count in cell_runs[run_count:]))
+        if trailing_empty_count > 0:
+            result.extend([cell_runs[run_count][0]] * trailing_empty_count)
+    return result
 
-    def ods_content_root():
-        """
-        `ElementTree` for content.xml in `source_ods_path`.
-        """
-        assert source_ods_path is not None
 
-        location = errors.Location(source_ods_path)
+def _ods_content_events(source_ods_path):
+    """
+    Start and end events from incrementally parsing content.xml in
+    ``source_ods_path`` as pairs ``(event, element)``. Only the archive
+    directory is read in advance, the XML is uncompressed and parsed while
+    the events are consumed.
+
+    Documents stored in a ZIP archive as described with
+    :py:func:`split_archive_member_path` are extracted to a temporary file
+    first because reading them requires random access.
+    """
+    assert source_ods_path is not None
+
+    if is_archive_member_path(source_ods_path):
+        with closing(_extracted_archive_member(source_ods_path)) as ods_stream:
+            for event_and_element in _ods_stream_content_events(ods_stream, source_ods_path):
+                yield event_and_element
+    else:
+        for event_and_element in _ods_stream_content_events(source_ods_path, source_ods_path):
+            yield event_and_element
+
+
+def _ods_stream_content_events(ods_source, source_ods_path):
+    """
+    Same as :py:func:`_ods_content_events` but reading from ``ods_source``,
+    which is a path or a seekable binary stream.
+    """
+    location = errors.Location(source_ods_path)
+    try:
+        zip_archive = zipfile.ZipFile(ods_source, "r")
+    except Exception as error:
+        raise errors.DataFormatError('cannot uncompress ODS spreadsheet: %s' % error, location)
+    # HACK: Use ``closing()`` because of Python 2.6.
+    with closing(zip_archive):
         try:
-            # HACK: Use ``closing()`` because of Python 2.6.
-            with closing(zipfile.ZipFile(source_ods_path, "r")) as zip_archive:
-                try:
-                    xml_data = zip_archive.read("content.xml")
-                except Exception as error:
-                    raise errors.DataFormatError('cannot extract content.xml for ODS spreadsheet: %s' % error, location)
-        except errors.DataFormatError:
-            raise
+            xml_stream = zip_archive.open("content.xml")
         except Exception as error:
-            raise errors.DataFormatError('cannot uncompress ODS spreadsheet: %s' % error, location)
+            raise errors.DataFormatError('cannot extract content.xml for ODS spreadsheet: %s' % error, location)
+        with closing(xml_stream):
+            events = iter(ElementTree.iterparse(xml_stream, events=('start', 'end')))
+            while True:
+                try:
+                    event_and_element = next(events)
+                except StopIteration:
+                    break
+                except (ElementTree.ParseError, zipfile.BadZipfile, zlib.error) as error:
+                    raise errors.DataFormatError('cannot parse content.xml: %s' % error, location)
+                yield event_and_element
 
-        with io.BytesIO(xml_data) as xml_stream:
-            try:
-                tree = ElementTree.parse(xml_stream)
-            except Exception as error:
-                raise errors.DataFormatError('cannot parse content.xml: %s' % error, location)
 
-        return tree.getroot()
+def ods_rows(source_ods_path, sheet=1, cell_count=None):
+    """
+    Rows stored in ODS document ``source_ods_path`` in ``sheet``.
+
+    The document is parsed incrementally and each row is discarded once it
+    has been processed, so memory consumption does not depend on the size
+    of the sheet.
+
+    Rows repeated using ``table:number-rows-repeated`` are yielded as often
+    as specified, except for empty rows at the end of the sheet, which are
+    dropped independent of ``cell_count``, whether repeated or not.
+    Spreadsheet applications tend to write such rows to fill up the sheet
+    to its maximum size.
+
+    :param cell_count: number of cells expected in each row; empty cells \
+      at the end of a row beyond ``cell_count`` are dropped; ``None`` means \
+      to keep all cells
+    :type: int or None
+    :raises cutplace.errors.DataFormarError: if ``source_ods_path`` is not \
+      a valid ODS file.
+    """
+    assert sheet >= 1
+    assert (cell_count is None) or (cell_count >= 0)
 
-    content_root = ods_content_root()
-    table_elements = list(
-        _findall(content_root, 'office:body/office:spreadsheet/table:table', namespaces=_OOO_NAMESPACES))
-    table_count = len(table_elements)
-    if table_count < sheet:
-        error_message = 'ODS must contain at least %d sheet(s) instead of just %d' % (sheet, table_count)
-        raise errors.DataFormatError(error_message, errors.Location(source_ods_path))
-    table_element = table_elements[sheet - 1]
     location = errors.Location(source_ods_path, has_cell=True, has_sheet=True)
     for _ in range(sheet - 1):
         location.advance_sheet()
-    for table_row in _findall(table_element, 'table:table-row', namespaces=_OOO_NAMESPACES):
-        row = []
-        for table_cell in _findall(table_row, 'table:table-cell', namespaces=_OOO_NAMESPACES):
-            repeated_text = table_cell.attrib.get(_NUMBER_COLUMNS_REPEATED, '1')
-            try:
-                repeated_count = int(repeated_text)
-                if repeated_count < 1:
-                    raise errors.DataFormatError(
-                        'table:number-columns-repeated is %s but must be at least 1'
-                        % _compat.text_repr(repeated_text), location)
-            except ValueError:
-                raise errors.DataFormatError(
-                    'table:number-columns-repeated is %s but must be an integer' % _compat.text_repr(repeated_text),
-                    location)
-            if six.PY2:
-                text_p = table_cell.find('{%s}p' % _OOO_NAMESPACES['text'])
-            else:
-                text_p = table_cell.find('text:p', namespaces=_OOO_NAMESPACES)
-            if text_p is None:
-                cell_value = ''
-            else:
-                cell_value = text_p.text
-                if six.PY2:
-                    # HACK: It seems that under Python 2 ElementTree.find() returns a unicode string only of the value
-                    # actually contains non ASCII characters, and otherwise a binary string. To work around this we
-                    # check the result for binary strings and possibly convert them to uncicode strings assuming UTF-8
-                    # to be the internal encoding for the XML file. Ideally we would parse the XML header for the
-                    # encoding. Considering that Python 2 is on the way out, this just doesn't seem to be worth the
-                    # trouble right now.
-                    if isinstance(cell_value, six.binary_type):
-                        cell_value = six.text_type(cell_value, 'utf-8')
+    table_count = 0
+    # Elements from the root to the element currently parsed.
+    element_stack = []
+    # Empty rows as pairs ``(row, repeated_count)`` that are only yielded if a non empty row follows.
+    pending_empty_rows = []
+    for event, element in _ods_content_events(source_ods_path):
+        if event == 'start':
+            if (element.tag == _ODS_TABLE_TAG) and element_stack and (element_stack[-1].tag == _ODS_SPREADSHEET_TAG):
+                table_count += 1
+            element_stack.append(element)
+        else:
+            assert event == 'end'
+            element_stack.pop()
+            parent = element_stack[-1] if element_stack else None
+            if element.tag == _ODS_TABLE_ROW_TAG:
+                is_row_of_sheet = (table_count == sheet) and (parent.tag == _ODS_TABLE_TAG) \
+                    and (element_stack[-2].tag == _ODS_SPREADSHEET_TAG)
+                if is_row_of_sheet:
+                    repeated_row_count = _ods_repeated_count(element, 'table:number-rows-repeated', location)
+                    cell_runs = _ods_cell_runs(element, location)
+                    row = _ods_row(cell_runs, cell_count)
+                    if any(cell_value for cell_value, _ in cell_runs):
+                        for pending_row, pending_row_count in pending_empty_rows:
+                            for _ in range(pending_row_count):
+                                yield list(pending_row)
+                                location.advance_line()
+                        pending_empty_rows = []
+                        for _ in range(repeated_row_count - 1):
+                            yield list(row)
+                            location.advance_line()
+                        yield row
+                        location.advance_line()
                     else:
-                        assert isinstance(cell_value, six.text_type), 'cell_value=%r' % cell_value
-            row.extend([cell_value] * repeated_count)
-            location.advance_cell(repeated_count)
-        yield row
-        location.advance_line()
+                        pending_empty_rows.append((row, repeated_row_count))
+                # Remove the processed rows so the tree does not grow while parsing.
+                del parent[:]
+            elif (element.tag == _ODS_TABLE_TAG) and (table_count == sheet) and (parent.tag == _ODS_SPREADSHEET_TAG):
+                break
+    if table_count < sheet:
+        error_message = 'ODS must contain at least %d sheet(s) instead of just %d' % (sheet, table_count)
+        raise errors.DataFormatError(error_message, errors.Location(source_ods_path))
 
 
 def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter='any'):
@@ -337,8 +1149,89 @@ def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter='a
     assert line_delimiter in _VALID_FIXED_LINE_DELIMITERS, \
         'line_delimiter=%s but must be one of: %s' % (_compat.text_repr(line_delimiter), _VALID_FIXED_LINE_DELIMITERS)
 
+    is_block_readable = isinstance(fixed_source, six.string_types) \
+        and (line_delimiter in _VALID_FIXED_BLOCK_LINE_DELIMITERS) and _is_single_byte_encoding(encoding)
+    if is_block_readable:
+        result = _fixed_rows_from_blocks(fixed_source, encoding, field_name_and_lengths, line_delimiter)
+    else:
+        result = _fixed_rows_from_text(fixed_source, encoding, field_name_and_lengths, line_delimiter)
+    return result
+
+
+def _fixed_rows_from_blocks(fixed_path, encoding, field_name_and_lengths, line_delimiter):
+    """
+    Same as :py:func:`_fixed_rows_from_text` but reading large blocks of
+    binary data from ``fixed_path`` and slicing them into records and
+    fields. This requires ``encoding`` to use a single byte for each
+    character.
+
+    Line delimiters are translated the same way as :py:func:`io.open` does
+    in text mode. Anything that is not a complete record followed by the
+    expected line delimiter is passed on to :py:func:`_fixed_rows_from_text`
+    so errors and the end of the data are handled the same way.
+    """
+    assert line_delimiter in _VALID_FIXED_BLOCK_LINE_DELIMITERS
+
+    location = errors.Location(fixed_path, has_column=True)
+    field_slices = []
+    record_length = 0
+    for _, field_length in field_name_and_lengths:
+        field_slices.append(slice(record_length, record_length + field_length))
+        record_length += field_length
+    carriage_return = '\r'.encode(encoding)
+    line_feed = '\n'.encode(encoding)
+    carriage_return_and_line_feed = carriage_return + line_feed
+    line_delimiter_length = 0 if line_delimiter is None else 1
+    record_size = record_length + line_delimiter_length
+    with open_data(fixed_path) as fixed_file:
+        unprocessed_data = b''
+        held_back_carriage_return = b''
+        is_at_end = False
+        while not is_at_end:
+            block = fixed_file.read(_READ_BLOCK_SIZE)
+            is_at_end = not block
+            block = held_back_carriage_return + block
+            if not is_at_end and block.endswith(carriage_return):
+                # Wait for the next block in case the carriage return is followed by a line feed.
+                held_back_carriage_return = carriage_return
+                block = block[:-1]
+            else:
+                held_back_carriage_return = b''
+            data = unprocessed_data + block.replace(carriage_return_and_line_feed, line_feed).replace(
+                carriage_return, line_feed)
+            data_length = len(data)
+            record_start = 0
+            record_end = record_length
+            while record_end + line_delimiter_length <= data_length:
+                if (line_delimiter_length == 1) and (data[record_end:record_end + 1] != line_feed):
+                    broken_record = data[record_start:record_end + 1].decode(encoding)
+                    for row in _fixed_rows_from_text(
+                            io.StringIO(broken_record), encoding, field_name_and_lengths, line_delimiter, location):
+                        yield row
+                    assert False, 'broken line delimiter must result in DataFormatError'
+                record = data[record_start:record_end].decode(encoding)
+                location.advance_column(record_length)
+                yield [record[field_slice] for field_slice in field_slices]
+                location.advance_line()
+                record_start += record_size
+                record_end += record_size
+            unprocessed_data = data[record_start:]
+    if unprocessed_data:
+        for row in _fixed_rows_from_text(
+                io.StringIO(unprocessed_data.decode(encoding)), encoding, field_name_and_lengths, line_delimiter,
+                location):
+            yield row
+
+
+def _fixed_rows_from_text(fixed_source, encoding, field_name_and_lengths, line_delimiter, location=None):
+    """
+    Rows found in ``fixed_source``, see :py:func:`fixed_rows` for details.
+    If ``location`` is ``None``, it starts at the beginning of
+    ``fixed_source``.
+    """
     # Predefine variable for access in local function.
-    location = errors.Location(fixed_source, has_column=True)
+    if location is None:
+        location = errors.Location(fixed_source, has_column=True)
     fixed_file = None
     # HACK: list with at most 1 character to be unread after a line feed. We
     # need to use a list so `_has_data_after_skipped_line_delimiter` can
@@ -389,7 +1282,7 @@ def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter='a
         return result
 
     if isinstance(fixed_source, six.string_types):
-        fixed_file = io.open(fixed_source, 'r', encoding=encoding)
+        fixed_file = open_data(fixed_source, encoding)
         is_opened = True
     else:
         fixed_file = fixed_source
@@ -448,34 +1341,999 @@ def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter='a
             fixed_file.close()
 
 
+def _is_single_byte_encoding(encoding):
+    """
+    ``True`` if each character in ``encoding`` takes exactly one byte, so
+    byte offsets can be computed from character offsets.
+    """
+    assert encoding is not None
+    all_bytes = six.binary_type(bytearray(range(256)))
+    all_characters = ''.join(six.unichr(code) for code in range(256))
+    return (len(all_bytes.decode(encoding, 'replace')) == 256) \
+        and (len(all_characters.encode(encoding, 'replace')) == 256)
+
+
+def _is_ascii_compatible_encoding(encoding):
+    """
+    ``True`` if in ``encoding`` ASCII characters take exactly one byte and
+    these bytes never occur as part of other characters, so data can be
+    scanned for ASCII delimiters and quotes without decoding them.
+    """
+    assert encoding is not None
+    return (codecs.lookup(encoding).name == 'utf-8') or _is_single_byte_encoding(encoding)
+
+
+class _ChunkIO(io.RawIOBase):
+    """
+    Binary stream that reads only the bytes from ``start`` up to but not
+    including ``end`` of the file at ``source_path``.
+    """
+    def __init__(self, source_path, start, end):
+        assert source_path is not None
+        assert 0 <= start <= end, 'start=%r, end=%r' % (start, end)
+
+        super(_ChunkIO, self).__init__()
+        self.name = source_path
+        self._source_file = io.open(source_path, 'rb')
+        self._source_file.seek(start)
+        self._remaining_size = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size_to_read = min(len(buffer), self._remaining_size)
+        if size_to_read > 0:
+            data_read = self._source_file.read(size_to_read)
+            result = len(data_read)
+            buffer[:result] = data_read
+            self._remaining_size -= result
+        else:
+            result = 0
+        return result
+
+    def close(self):
+        if not self.closed:
+            self._source_file.close()
+        super(_ChunkIO, self).close()
+
+
+def open_chunk(source_path, encoding, start, end, newline=None):
+    """
+    Text stream to read the bytes from ``start`` up to but not including
+    ``end`` of the file at ``source_path`` using ``encoding``. The
+    ``newline`` parameter has the same meaning as with :py:func:`io.open`.
+    The ``name`` of the stream is ``source_path`` so :py:class:`~cutplace.errors.Location`
+    refers to the actual file.
+
+    Typically ``start`` and ``end`` are obtained from
+    :py:func:`delimited_chunks` or :py:func:`fixed_chunks` and the result
+    is passed to :py:func:`delimited_rows` or :py:func:`fixed_rows`.
+    """
+    assert source_path is not None
+    assert encoding is not None
+
+    return io.TextIOWrapper(io.BufferedReader(_ChunkIO(source_path, start, end)), encoding=encoding, newline=newline)
+
+
+class _DelimitedRecordScanner(object):
+    """
+    Scanner to find the byte offsets at which records in a binary stream of
+    delimited data end without actually parsing the records. Quotes and
+    escape characters are taken into account so line delimiters within
+    quoted items are not mistaken for the end of a record.
+    """
+    def __init__(self, binary_stream, data_format, block_size=_READ_BLOCK_SIZE):
+        assert binary_stream is not None
+        assert data_format is not None
+        assert data_format.format == data.FORMAT_DELIMITED
+        assert _is_ascii_compatible_encoding(data_format.encoding)
+        assert block_size >= 1
+
+        def encoded(text):
+            return re.escape(text.encode(data_format.encoding))
+
+        quote = encoded(data_format.quote_character)
+        line_delimiter = encoded('\r' if data_format.line_delimiter == '\r' else '\n')
+        initial_space = b' *' if data_format.skip_initial_space else b''
+        quote_at_start_of_item = \
+            b'(?<=[' + encoded(data_format.item_delimiter) + b'\r\n])' + initial_space + quote
+        unquoted_patterns = [b'(?P<quote>' + quote_at_start_of_item + b')']
+        self._has_escape_character = (data_format.escape_character != data_format.quote_character)
+        if self._has_escape_character:
+            escape_pattern = b'(?P<escape>' + encoded(data_format.escape_character) + b'.)'
+            unquoted_patterns.insert(0, escape_pattern)
+            self._quoted_regex = re.compile(escape_pattern + b'|(?P<quote>' + quote + b')', re.DOTALL)
+        else:
+            # Quotes within quoted items are doubled, so only an odd number of consecutive quotes ends an item.
+            self._quoted_regex = re.compile(b'(?P<quote>(?:' + quote + b')+)')
+        self._quote_length = len(data_format.quote_character.encode(data_format.encoding))
+        self._unquoted_regex = re.compile(b'|'.join(unquoted_patterns), re.DOTALL)
+        self._unquoted_or_line_delimiter_regex = re.compile(
+            b'|'.join(unquoted_patterns + [b'(?P<line_delimiter>' + line_delimiter + b')']), re.DOTALL)
+        self._binary_stream = binary_stream
+        self._block_size = block_size
+        # Start with a virtual line delimiter so a quote at the very beginning starts a quoted item.
+        self._buffer = b'\n'
+        self._buffer_offset = -1
+        self._position = 0
+        self._is_quoted = False
+        self._is_at_end = False
+
+    @property
+    def position(self):
+        """
+        Offset in the stream up to which the data have been scanned.
+        """
+        return self._position
+
+    def _read_more(self, keep_from):
+        """
+        Drop buffered data before ``keep_from`` except for a single byte
+        needed to look behind and append the next block of data.
+
+        :return: ``False`` if the end of the stream has been reached.
+        """
+        block = self._binary_stream.read(self._block_size)
+        if block:
+            keep_index = keep_from - 1 - self._buffer_offset
+            assert keep_index >= 0
+            self._buffer = self._buffer[keep_index:] + block
+            self._buffer_offset = keep_from - 1
+            self._position = keep_from
+            result = True
+        else:
+            self._is_at_end = True
+            result = False
+        return result
+
+    def next_record_end(self, min_offset):
+        """
+        The offset right after the first line delimiter that ends a record
+        and is located at or after ``min_offset`` or ``None`` if the end of
+        the stream is reached before.
+        """
+        assert min_offset >= self._position - 1, 'min_offset=%r, position=%r' % (min_offset, self._position)
+
+        result = None
+        while result is None:
+            if self._is_quoted:
+                regex = self._quoted_regex
+                limit = None
+            elif self._position < min_offset:
+                # Line delimiters before min_offset do not matter, so only look for quotes and escapes.
+                regex = self._unquoted_regex
+                limit = min_offset
+            else:
+                regex = self._unquoted_or_line_delimiter_regex
+                limit = None
+            buffer_end = self._buffer_offset + len(self._buffer)
+            match = regex.search(self._buffer, self._position - self._buffer_offset)
+            if match is not None:
+                match_start = self._buffer_offset + match.start()
+                match_end = self._buffer_offset + match.end()
+            is_match_before_limit = (match is not None) and ((limit is None) or (match_start < limit))
+            if is_match_before_limit and ((match_end < buffer_end) or self._is_at_end):
+                self._position = match_end
+                event = match.lastgroup
+                if event == 'line_delimiter':
+                    result = match_end
+                elif event == 'quote':
+                    if self._is_quoted and not self._has_escape_character:
+                        quote_count = (match_end - match_start) // self._quote_length
+                        if quote_count % 2 == 1:
+                            self._is_quoted = False
+                    else:
+                        self._is_quoted = not self._is_quoted
+                else:
+                    assert event == 'escape', 'event=%r' % event
+            elif (limit is not None) and not is_match_before_limit and (limit < buffer_end):
+                # Skip to limit because there are no quotes or escapes before it.
+                self._position = limit
+            else:
+                # Read more data because the buffer is exhausted or the match might continue in the next block.
+                skip_to = match_start if is_match_before_limit else buffer_end
+                if limit is not None:
+                    skip_to = min(skip_to, limit)
+                keep_from = max(self._position, skip_to - 1)
+                while (keep_from > self._position) and (self._buffer[keep_from - 1 - self._buffer_offset:keep_from - self._buffer_offset] == b' '):
+                    # Keep initial spaces so a following quote can still be detected.
+                    keep_from -= 1
+                if not self._read_more(keep_from) and not is_match_before_limit:
+                    break
+        return result
+
+
+def delimited_chunks(delimited_path, data_format, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    List of tuples ``(start, end)`` describing consecutive byte ranges of
+    approximately ``chunk_size`` bytes each that together cover the whole
+    file at ``delimited_path``. Each range starts at the beginning of a
+    record and ends after a line delimiter that is not part of a quoted
+    item, so it can be read independently using :py:func:`open_chunk` and
+    :py:func:`delimited_rows`. The first range contains at least the
+    header rows.
+
+    If the :py:attr:`~cutplace.data.DataFormat.encoding` does not allow to
+    scan for delimiters without decoding the data, for example with UTF-16,
+    or the data are compressed, the result is a single range covering the
+    whole file.
+    """
+    assert delimited_path is not None
+    assert data_format is not None
+    assert data_format.format == data.FORMAT_DELIMITED
+    assert data_format.is_valid
+    assert chunk_size >= 1
+
+    data_size = os.path.getsize(delimited_path)
+    result = []
+    if (data_size > chunk_size) and _is_ascii_compatible_encoding(data_format.encoding) \
+            and (compression_of(delimited_path) is None):
+        with io.open(delimited_path, 'rb') as delimited_binary_stream:
+            scanner = _DelimitedRecordScanner(delimited_binary_stream, data_format)
+            header_end = 0
+            for _ in range(data_format.header):
+                if header_end is not None:
+                    header_end = scanner.next_record_end(header_end)
+            if header_end is not None:
+                start = 0
+                while start < data_size:
+                    end = scanner.next_record_end(max(start + chunk_size, header_end) - 1)
+                    if (end is None) or (end > data_size):
+                        end = data_size
+                    result.append((start, end))
+                    start = end
+    if not result:
+        result.append((0, data_size))
+    return result
+
+
+def _fixed_binary_line_delimiter(fixed_binary_stream, encoding, record_length, line_delimiter):
+    """
+    The encoded line delimiter used by fixed data in ``fixed_binary_stream``.
+    With ``line_delimiter='any'`` this is derived from the end of the first
+    record, in which case the result can be ``None`` if the data do not
+    contain a valid line delimiter there.
+    """
+    assert encoding is not None
+    assert record_length >= 1
+    assert line_delimiter in _VALID_FIXED_LINE_DELIMITERS
+
+    if line_delimiter == 'any':
+        fixed_binary_stream.seek(record_length)
+        possible_line_delimiter = fixed_binary_stream.read(2)
+        result = None
+        for any_line_delimiter in ('\r\n', '\n', '\r'):
+            binary_any_line_delimiter = any_line_delimiter.encode(encoding)
+            if (result is None) and possible_line_delimiter.startswith(binary_any_line_delimiter):
+                result = binary_any_line_delimiter
+    elif line_delimiter is None:
+        result = b''
+    else:
+        result = line_delimiter.encode(encoding)
+    return result
+
+
+def fixed_chunks(fixed_path, encoding, field_names_and_lengths, line_delimiter='any', chunk_size=DEFAULT_CHUNK_SIZE,
+                 header=0):
+    """
+    Similar to :py:func:`delimited_chunks` but for fixed data. The
+    boundaries are computed from the record length, so ``encoding`` must
+    use a single byte for each character and the data must not be
+    compressed. Otherwise the result is a single range covering the whole
+    file.
+
+    With ``line_delimiter='any'`` the actual delimiter is derived from the
+    end of the first record. If it turns out that the delimiter is not the
+    same for all boundaries, the result also is a single range.
+    """
+    assert fixed_path is not None
+    assert encoding is not None
+    assert field_names_and_lengths
+    assert line_delimiter in _VALID_FIXED_LINE_DELIMITERS
+    assert chunk_size >= 1
+    assert header >= 0
+
+    data_size = os.path.getsize(fixed_path)
+    result = []
+    if (data_size > chunk_size) and _is_single_byte_encoding(encoding) and (compression_of(fixed_path) is None):
+        record_length = sum(field_length for _, field_length in field_names_and_lengths)
+        with io.open(fixed_path, 'rb') as fixed_binary_stream:
+            binary_line_delimiter = _fixed_binary_line_delimiter(
+                fixed_binary_stream, encoding, record_length, line_delimiter)
+            if binary_line_delimiter is not None:
+                line_delimiter_length = len(binary_line_delimiter)
+                record_size = record_length + line_delimiter_length
+                records_per_chunk = max(1, chunk_size // record_size, header)
+                start = 0
+                while start < data_size:
+                    end = start + records_per_chunk * record_size
+                    if end >= data_size:
+                        end = data_size
+                    elif line_delimiter == 'any':
+                        fixed_binary_stream.seek(end - line_delimiter_length)
+                        if fixed_binary_stream.read(line_delimiter_length) != binary_line_delimiter:
+                            # Line delimiters vary, so boundaries cannot be computed.
+                            result = []
+                            break
+                    result.append((start, end))
+                    start = end
+    if not result:
+        result.append((0, data_size))
+    return result
+
+
+class RowIndex(object):
+    r"""
+    Byte offsets of every :py:attr:`step`\ th row in a data file that allow
+    to start reading at any row without parsing all the rows before it.
+
+    Each entry is a tuple ``(row, offset, line)`` where ``row`` is the
+    number of rows before ``offset`` and ``line`` the number of physical
+    lines before it, which is what
+    :py:exc:`~cutplace.errors.DataFormatError`\ s refer to.
+
+    The index is valid only as long as the data file keeps the same size
+    and modification time and is read using the same data format, which is
+    described by :py:attr:`key`.
+    """
+    def __init__(self, key, step, entries, data_size, data_modified):
+        assert key is not None
+        assert step >= 1
+        assert entries
+        assert entries[0] == (0, 0, 0)
+        assert data_size >= 0
+
+        self._key = key
+        self._step = step
+        self._entries = entries
+        self._data_size = data_size
+        self._data_modified = data_modified
+
+    @property
+    def key(self):
+        """
+        Text describing the data format the index was built for.
+        """
+        return self._key
+
+    @property
+    def step(self):
+        """
+        Number of rows between two entries.
+        """
+        return self._step
+
+    @property
+    def entries(self):
+        """
+        List of tuples ``(row, offset, line)``.
+        """
+        return self._entries
+
+    def entry_for_row(self, row):
+        """
+        The entry for the last indexed row at or before ``row``.
+        """
+        assert row >= 0
+        return self._entries[min(row // self._step, len(self._entries) - 1)]
+
+    def is_current_for(self, data_path, key):
+        """
+        ``True`` if the index was built for the current version of
+        ``data_path`` using a data format described by ``key``.
+        """
+        assert data_path is not None
+        assert key is not None
+
+        data_stat = os.stat(data_path)
+        return (self._key == key) and (self._data_size == data_stat.st_size) \
+            and (self._data_modified == data_stat.st_mtime)
+
+    def write(self, index_path):
+        """
+        Write the index to ``index_path`` so it can later be read using
+        :py:func:`read_row_index`.
+        """
+        assert index_path is not None
+
+        index_map = {
+            'key': self._key,
+            'step': self._step,
+            'entries': self._entries,
+            'data_size': self._data_size,
+            'data_modified': self._data_modified,
+        }
+        with io.open(index_path, 'w', encoding='utf-8') as index_file:
+            index_file.write(six.text_type(json.dumps(index_map, ensure_ascii=True)))
+
+
+def read_row_index(index_path):
+    """
+    :py:class:`RowIndex` stored in ``index_path`` by :py:meth:`RowIndex.write`.
+
+    :raises cutplace.errors.DataFormatError: if ``index_path`` does not \
+      contain a valid index
+    """
+    assert index_path is not None
+
+    with io.open(index_path, 'r', encoding='utf-8') as index_file:
+        try:
+            index_map = json.loads(index_file.read())
+            entries = [tuple(entry) for entry in index_map['entries']]
+            result = RowIndex(
+                index_map['key'], index_map['step'], entries, index_map['data_size'], index_map['data_modified'])
+        except (AssertionError, KeyError, TypeError, ValueError) as error:
+            raise errors.DataFormatError('cannot read row index: %s' % error, errors.Location(index_path))
+    return result
+
+
+def row_index_path(data_path):
+    """
+    Path of the sidecar file storing the :py:class:`RowIndex` for ``data_path``.
+    """
+    assert data_path is not None
+    return data_path + ROW_INDEX_SUFFIX
+
+
+def row_index_key(data_format, field_names_and_lengths=None):
+    """
+    Text identifying the settings of ``data_format`` and, for fixed data,
+    the field lengths the byte offsets of records depend on.
+    """
+    if data_format.format == data.FORMAT_DELIMITED:
+        key_items = [
+            data_format.format, data_format.encoding, data_format.item_delimiter, data_format.quote_character,
+            data_format.escape_character, data_format.line_delimiter, data_format.skip_initial_space]
+    else:
+        assert data_format.format == data.FORMAT_FIXED
+        key_items = [data_format.format, data_format.encoding, data_format.line_delimiter] \
+            + [field_length for _, field_length in field_names_and_lengths]
+    return json.dumps(key_items, ensure_ascii=True)
+
+
+def _delimited_rows_and_positions(delimited_binary_stream, data_format, delimited_path):
+    """
+    Triples ``(row, offset, line)`` for the delimited data in
+    ``delimited_binary_stream`` with ``offset`` being the number of bytes
+    and ``line`` the number of lines read after ``row``. Lines are split the
+    same way as text streams opened with ``newline=''`` do and parsed the
+    same way as by :py:func:`delimited_rows`, so quotes and escape
+    characters are taken into account.
+
+    :raises cutplace.errors.DataFormatError: if the data are not a valid \
+      delimited file
+    """
+    # HACK: list with the number of bytes read so `decoded_lines()` can modify it.
+    offset = [0]
+    encoding = data_format.encoding
+
+    def decoded_lines():
+        unfinished_line = b''
+        block = delimited_binary_stream.read(_READ_BLOCK_SIZE)
+        while block:
+            lines = (unfinished_line + block).splitlines(True)
+            # The last line might continue in the next block, even if it ends with a carriage return.
+            unfinished_line = b'' if lines[-1].endswith(b'\n') else lines.pop()
+            for line in lines:
+                offset[0] += len(line)
+                yield line.decode(encoding)
+            block = delimited_binary_stream.read(_READ_BLOCK_SIZE)
+        if unfinished_line:
+            offset[0] += len(unfinished_line)
+            yield unfinished_line.decode(encoding)
+
+    delimited_reader = _compat.csv_reader(decoded_lines(), **_as_delimited_keywords(data_format))
+    try:
+        for row in delimited_reader:
+            yield row, offset[0], delimited_reader.line_num
+    except csv.Error as error:
+        _raise_delimited_data_format_error(delimited_path, delimited_reader, error)
+
+
+def _delimited_row_index_entries(delimited_binary_stream, data_format, step):
+    """
+    Entries for a :py:class:`RowIndex` of the delimited data in
+    ``delimited_binary_stream``. On broken data, simply stop because the
+    entries found until then are still valid and the error is reported
+    once the data are actually read.
+    """
+    result = [(0, 0, 0)]
+    rows_and_positions = _delimited_rows_and_positions(
+        delimited_binary_stream, data_format, delimited_binary_stream.name)
+    try:
+        for row, (_, offset, line) in enumerate(rows_and_positions, 1):
+            if row % step == 0:
+                result.append((row, offset, line))
+    except (errors.DataFormatError, UnicodeError):
+        pass
+    return result
+
+
+def _is_seekable_data(data_path, data_format):
+    """
+    ``True`` if records in the delimited or fixed data in ``data_path`` can
+    be found by byte offset, which requires uncompressed data and an
+    encoding that allows to find records without decoding the data.
+    """
+    if compression_of(data_path) is not None:
+        # Offsets in compressed data cannot be used to seek.
+        result = False
+    elif data_format.format == data.FORMAT_DELIMITED:
+        result = _is_ascii_compatible_encoding(data_format.encoding) \
+            and ('\r\n'.encode(data_format.encoding) == b'\r\n')
+    else:
+        assert data_format.format == data.FORMAT_FIXED
+        result = _is_single_byte_encoding(data_format.encoding)
+    return result
+
+
+def build_row_index(data_path, data_format, field_names_and_lengths=None, step=DEFAULT_ROW_INDEX_STEP):
+    """
+    :py:class:`RowIndex` for the delimited or fixed data in ``data_path``
+    with an entry every ``step`` rows or ``None`` if the data cannot be
+    indexed. This is the case if the data are compressed, the encoding does
+    not allow to find records without decoding the data or if fixed data
+    use ``line_delimiter='any'`` and the actual delimiters vary.
+
+    For delimited data, the records are parsed the same way as with
+    :py:func:`delimited_rows` while keeping track of the byte offsets, so
+    quotes and escape characters are taken into account. For fixed data,
+    the offsets are computed from the record length, which requires
+    ``field_names_and_lengths``.
+    """
+    assert data_path is not None
+    assert data_format is not None
+    assert data_format.format in (data.FORMAT_DELIMITED, data.FORMAT_FIXED)
+    assert data_format.is_valid
+    assert (data_format.format != data.FORMAT_FIXED) or field_names_and_lengths
+    assert step >= 1
+
+    data_stat = os.stat(data_path)
+    data_size = data_stat.st_size
+    entries = [(0, 0, 0)]
+    is_indexable = _is_seekable_data(data_path, data_format)
+    if is_indexable and (data_format.format == data.FORMAT_DELIMITED):
+        with io.open(data_path, 'rb') as delimited_binary_stream:
+            entries = _delimited_row_index_entries(delimited_binary_stream, data_format, step)
+        if (len(entries) >= 2) and (entries[-1][1] >= data_size):
+            # Remove entry pointing to the end of the data.
+            del entries[-1]
+    elif is_indexable:
+        record_length = sum(field_length for _, field_length in field_names_and_lengths)
+        with io.open(data_path, 'rb') as fixed_binary_stream:
+            binary_line_delimiter = _fixed_binary_line_delimiter(
+                fixed_binary_stream, data_format.encoding, record_length, data_format.line_delimiter)
+            if binary_line_delimiter is not None:
+                line_delimiter_length = len(binary_line_delimiter)
+                record_size = record_length + line_delimiter_length
+                offset = step * record_size
+                while is_indexable and (offset < data_size):
+                    if data_format.line_delimiter == 'any':
+                        fixed_binary_stream.seek(offset - line_delimiter_length)
+                        is_indexable = (fixed_binary_stream.read(line_delimiter_length) == binary_line_delimiter)
+                    row = len(entries) * step
+                    # The location of errors in fixed data refers to rows instead of lines.
+                    entries.append((row, offset, row))
+                    offset += step * record_size
+            elif data_size > record_length:
+                is_indexable = False
+
+    if is_indexable:
+        key = row_index_key(data_format, field_names_and_lengths)
+        result = RowIndex(key, step, entries, data_size, data_stat.st_mtime)
+    else:
+        result = None
+    return result
+
+
+def row_index(data_path, data_format, field_names_and_lengths=None, step=None):
+    """
+    Same as :py:func:`build_row_index` but use the index stored in the
+    sidecar file :py:func:`row_index_path` if it is still current.
+    Otherwise build a new index and attempt to store it there. If the
+    sidecar file cannot be written, for example because the folder is
+    read-only, simply build the index again the next time.
+
+    :param step: number of rows between two entries; ``None`` means to \
+      accept an existing index with any step and use \
+      :py:const:`DEFAULT_ROW_INDEX_STEP` when building a new one
+    :type: int or None
+    """
+    assert data_path is not None
+    assert data_format is not None
+    assert (step is None) or (step >= 1)
+
+    index_path = row_index_path(data_path)
+    key = row_index_key(data_format, field_names_and_lengths)
+    result = None
+    if os.path.exists(index_path):
+        try:
+            result = read_row_index(index_path)
+        except (EnvironmentError, errors.DataFormatError):
+            result = None
+        is_other_step = (step is not None) and (result is not None) and (result.step != step)
+        if (result is not None) and (is_other_step or not result.is_current_for(data_path, key)):
+            result = None
+    if result is None:
+        result = build_row_index(
+            data_path, data_format, field_names_and_lengths, DEFAULT_ROW_INDEX_STEP if step is None else step)
+        if result is not None:
+            try:
+                result.write(index_path)
+            except EnvironmentError:
+                # The index is only a cache, so simply build it again next time.
+                pass
+    return result
+
+
+def positioned_rows(data_path, data_format, field_names_and_lengths=None, offset=0, step=1):
+    """
+    Pairs ``(row, position)`` for the delimited or fixed data in
+    ``data_path`` starting at byte ``offset``, which must be the start of a
+    record, for example taken from an earlier ``position``. Every ``step``
+    rows, ``position`` is a pair ``(offset, line)`` with the byte offset
+    after ``row`` and the number of lines read since the start, which is
+    what errors refer to. For other rows or if reading cannot continue
+    after ``row`` because fixed data use ``line_delimiter='any'`` and the
+    actual delimiters vary, ``position`` is ``None``.
+
+    This allows to remember where to continue reading later on while
+    reading the data only once. The data must not be compressed and the
+    encoding must allow to find records without decoding the data as
+    described with :py:func:`build_row_index`, which
+    :py:func:`is_positionable` tells. Errors refer to lines after the start.
+
+    :raises cutplace.errors.DataFormatError: on broken data
+    """
+    assert data_path is not None
+    assert data_format is not None
+    assert is_positionable(data_path, data_format)
+    assert (data_format.format != data.FORMAT_FIXED) or field_names_and_lengths
+    assert offset >= 0
+    assert step >= 1
+
+    if data_format.format == data.FORMAT_DELIMITED:
+        with io.open(data_path, 'rb') as delimited_binary_stream:
+            delimited_binary_stream.seek(offset)
+            rows_and_positions = _delimited_rows_and_positions(delimited_binary_stream, data_format, data_path)
+            for row_count, (row, row_offset, line) in enumerate(rows_and_positions, 1):
+                yield row, (offset + row_offset, line) if row_count % step == 0 else None
+    else:
+        record_length = sum(field_length for _, field_length in field_names_and_lengths)
+        data_size = os.path.getsize(data_path)
+        with io.open(data_path, 'rb') as fixed_binary_stream:
+            binary_line_delimiter = _fixed_binary_line_delimiter(
+                fixed_binary_stream, data_format.encoding, record_length, data_format.line_delimiter)
+            line_delimiter_length = len(binary_line_delimiter) if binary_line_delimiter is not None else 0
+            record_size = record_length + line_delimiter_length
+            with open_chunk(data_path, data_format.encoding, offset, data_size) as fixed_stream:
+                rows = fixed_rows(
+                    fixed_stream, data_format.encoding, field_names_and_lengths, data_format.line_delimiter)
+                for row_count, row in enumerate(rows, 1):
+                    position = None
+                    if (row_count % step == 0) and (binary_line_delimiter is not None):
+                        row_offset = offset + row_count * record_size
+                        if data_format.line_delimiter == 'any':
+                            fixed_binary_stream.seek(row_offset - line_delimiter_length)
+                            is_positioned = (fixed_binary_stream.read(line_delimiter_length) == binary_line_delimiter)
+                        else:
+                            is_positioned = True
+                        if is_positioned:
+                            # The location of errors in fixed data refers to rows instead of lines.
+                            position = (row_offset, row_count)
+                    yield row, position
+
+
+def is_positionable(data_path, data_format):
+    """
+    ``True`` if the data in ``data_path`` can be read with
+    :py:func:`positioned_rows`.
+    """
+    assert data_path is not None
+    assert data_format is not None
+
+    return (data_format.format in (data.FORMAT_DELIMITED, data.FORMAT_FIXED)) \
+        and not is_archive_member_path(data_path) and _is_seekable_data(data_path, data_format)
+
+
+def _sniffed_encoding(sample, is_truncated):
+    """
+    The encoding of the bytes in ``sample`` derived from a byte order mark
+    or else the first of ``_SNIFF_ENCODINGS`` that can decode it. If
+    ``is_truncated``, ``sample`` may end in the middle of a character.
+    """
+    assert sample is not None
+
+    result = None
+    for byte_order_mark, encoding in _SNIFF_BYTE_ORDER_MARKS:
+        if sample.startswith(byte_order_mark):
+            result = encoding
+            break
+    if result is None:
+        for encoding in _SNIFF_ENCODINGS:
+            try:
+                codecs.getincrementaldecoder(encoding)().decode(sample, not is_truncated)
+                result = encoding
+                break
+            except UnicodeDecodeError:
+                pass
+    assert result is not None
+    return result
+
+
+def _sniffed_rows(sample_text, item_delimiter, quote_character='"', escape_character='"'):
+    """
+    Rows in ``sample_text`` using the specified delimited dialect, ignoring
+    any errors in broken rows.
+    """
+    assert sample_text is not None
+
+    keywords = {
+        'delimiter': item_delimiter,
+        'doublequote': escape_character == quote_character,
+        'escapechar': None if escape_character == quote_character else escape_character,
+        'quotechar': quote_character,
+    }
+    result = []
+    rows = _compat.csv_reader(io.StringIO(sample_text, newline=''), **keywords)
+    try:
+        for row in rows:
+            if row:
+                result.append(row)
+    except csv.Error:
+        pass
+    return result
+
+
+def _sniffed_item_delimiter(sample_text):
+    """
+    The item delimiter from ``_SNIFF_ITEM_DELIMITERS`` that splits the most
+    rows in ``sample_text`` into the same number of at least 2 items.
+    """
+    assert sample_text is not None
+
+    result = _SNIFF_ITEM_DELIMITERS[0]
+    best_row_count = 0
+    for item_delimiter in _SNIFF_ITEM_DELIMITERS:
+        item_count_to_row_count_map = {}
+        for row in _sniffed_rows(sample_text, item_delimiter):
+            item_count = len(row)
+            if item_count >= 2:
+                item_count_to_row_count_map[item_count] = item_count_to_row_count_map.get(item_count, 0) + 1
+        if item_count_to_row_count_map:
+            row_count = max(item_count_to_row_count_map.values())
+            if row_count > best_row_count:
+                result = item_delimiter
+                best_row_count = row_count
+    return result
+
+
+def _sniffed_quote_and_escape_character(sample_text, item_delimiter):
+    """
+    Tuple ``(quote_character, escape_character)`` for ``sample_text`` based
+    on how often each quote character starts an item and whether quotes
+    within items are doubled or escaped with a backslash.
+    """
+    assert sample_text is not None
+    assert item_delimiter is not None
+
+    quote_character = '"'
+    best_quote_count = 0
+    for possible_quote_character in ('"', "'"):
+        quoted_item_regex = re.compile(
+            r'(?:^|%s)[ ]*%s' % (re.escape(item_delimiter), re.escape(possible_quote_character)), re.MULTILINE)
+        quote_count = len(quoted_item_regex.findall(sample_text))
+        if quote_count > best_quote_count:
+            quote_character = possible_quote_character
+            best_quote_count = quote_count
+    backslash_quote_count = sample_text.count('\\' + quote_character)
+    # Doubled single quotes cannot be described in a CID, so escape them
+    # using a backslash.
+    if (quote_character != '"') or (backslash_quote_count > sample_text.count(quote_character * 2)):
+        escape_character = '\\'
+    else:
+        escape_character = quote_character
+    return quote_character, escape_character
+
+
+def _sniffed_header(rows):
+    """
+    The number of header rows at the start of ``rows``, which is 1 if the
+    items in the first row look different from the items below them in the
+    same column and 0 otherwise. Similar to :py:meth:`csv.Sniffer.has_header`,
+    an item looks different if it is not a number while the items below it
+    are, or if it has a different length than the items below it, which all
+    have the same length.
+    """
+    assert rows is not None
+
+    header_votes = 0
+    if len(rows) >= 2:
+        first_row = rows[0]
+        item_count = len(first_row)
+        other_rows = [row for row in rows[1:] if len(row) == item_count]
+        if other_rows:
+            for column_index, first_item in enumerate(first_row):
+                column_items = [row[column_index] for row in other_rows]
+                is_first_item_a_number = _SNIFF_NUMBER_REGEX.match(first_item) is not None
+                if all(_SNIFF_NUMBER_REGEX.match(item) is not None for item in column_items):
+                    header_votes += -1 if is_first_item_a_number else 1
+                else:
+                    item_lengths = set(len(item) for item in column_items)
+                    if len(item_lengths) == 1:
+                        header_votes += -1 if len(first_item) in item_lengths else 1
+    return 1 if header_votes > 0 else 0
+
+
+def _sniffed_delimited_format(sample_text, is_truncated, encoding):
+    """
+    A validated delimited :py:class:`~cutplace.data.DataFormat` for data
+    starting with ``sample_text`` using ``encoding``.
+    """
+    assert sample_text is not None
+    assert encoding is not None
+
+    if is_truncated:
+        # Ignore the last line, which most likely is incomplete.
+        last_line_end = max(sample_text.rfind('\n'), sample_text.rfind('\r'))
+        if last_line_end >= 0:
+            sample_text = sample_text[:last_line_end + 1]
+    item_delimiter = _sniffed_item_delimiter(sample_text)
+    quote_character, escape_character = _sniffed_quote_and_escape_character(sample_text, item_delimiter)
+    rows = _sniffed_rows(sample_text, item_delimiter, quote_character, escape_character)
+    result = data.DataFormat(data.FORMAT_DELIMITED)
+    result.encoding = encoding
+    result.item_delimiter = item_delimiter
+    result.quote_character = quote_character
+    result.escape_character = escape_character
+    result.header = _sniffed_header(rows)
+    result.validate()
+    return result
+
+
+def sniff_data_format(source_path, sample_size=DEFAULT_SNIFF_SIZE):
+    """
+    A validated :py:class:`~cutplace.data.DataFormat` for the data in
+    ``source_path`` derived from heuristics. ODS and Excel documents are
+    detected by their suffix. Everything else is assumed to be delimited
+    data, for which only the first ``sample_size`` bytes are examined to
+    determine the encoding, item delimiter, quote and escape character and
+    the number of header rows. This takes only a few milliseconds even for
+    huge files, so it is a quick way to find out how to describe new data in
+    a CID.
+
+    Encodings are detected from a byte order mark or else the first of
+    UTF-8, CP1252 and ISO-8859-1 that can decode the sample.
+    """
+    assert source_path is not None
+    assert sample_size >= 1
+
+    suffix = os.path.splitext(source_path)[1].lstrip('.').lower()
+    if suffix == 'ods':
+        result = data.DataFormat(data.FORMAT_ODS)
+        result.validate()
+    elif suffix in ('xls', 'xlsx'):
+        result = data.DataFormat(data.FORMAT_EXCEL)
+        result.validate()
+    else:
+        with open_data(source_path) as sample_stream:
+            sample = sample_stream.read(sample_size + 1)
+        is_truncated = len(sample) > sample_size
+        if is_truncated:
+            sample = sample[:sample_size]
+        encoding = _sniffed_encoding(sample, is_truncated)
+        # Decode incrementally to ignore a character cut off at the end.
+        sample_text = codecs.getincrementaldecoder(encoding)().decode(sample, not is_truncated)
+        result = _sniffed_delimited_format(sample_text, is_truncated, encoding)
+    return result
+
+
 def auto_rows(source):
     """
     Determine basic data format of `source` based on heuristics and return its contents.
-    If source is a string, it is considered a path to a file, otherwise assume it is a
-    text stream providing a ``read()`` method.
+    If source is a string, it is considered a path to a file and its data format is
+    determined using :py:func:`sniff_data_format`. Otherwise assume it is a text stream
+    providing a ``read()`` method; if it also can ``seek()``, the delimited dialect is
+    sniffed from the start of the stream, otherwise comma delimited data are assumed.
     """
-    result = None
     if isinstance(source, six.string_types):
-        suffix = os.path.splitext(source)[1].lstrip('.').lower()
-        if suffix == 'ods':
+        data_format = sniff_data_format(source)
+        if data_format.format == data.FORMAT_ODS:
             result = ods_rows(source)
-        elif suffix in ('xls', 'xlsx'):
+        elif data_format.format == data.FORMAT_EXCEL:
             result = excel_rows(source)
+        else:
+            result = delimited_rows(source, data_format)
     elif isinstance(source, io.BytesIO):
         # TODO: Assume ODS; cannot use XLS and XLSX (at least not without temp file) because the readers need a file.
         raise NotImplementedError('ODS from io.BytesIO')
-    if result is None:
-        delimited_format = data.DataFormat(data.FORMAT_DELIMITED)
-        # TODO: Use chardet to figure out an encoding.
-        delimited_format.set_property(data.KEY_ENCODING, 'utf-8')
-        # TODO: Determine delimiter by counting common delimiters with the first 4096 bytes and choosing the maximum one.
-        delimited_format.set_property(data.KEY_ITEM_DELIMITER, ',')
-        delimited_format.validate()
-        result = delimited_rows(source, delimited_format)
+    else:
+        try:
+            is_seekable = source.seekable()
+        except AttributeError:
+            is_seekable = False
+        if is_seekable:
+            start = source.tell()
+            sample_text = source.read(DEFAULT_SNIFF_SIZE + 1)
+            source.seek(start)
+            is_truncated = len(sample_text) > DEFAULT_SNIFF_SIZE
+            data_format = _sniffed_delimited_format(sample_text[:DEFAULT_SNIFF_SIZE], is_truncated, 'utf-8')
+        else:
+            data_format = data.DataFormat(data.FORMAT_DELIMITED)
+            data_format.set_property(data.KEY_ENCODING, 'utf-8')
+            data_format.validate()
+        result = delimited_rows(source, data_format)
 
     return result
 
 
+def pipelined_rows(rows, batch_size=DEFAULT_PIPELINE_BATCH_SIZE, queue_depth=DEFAULT_PIPELINE_QUEUE_DEPTH):
+    """
+    Same as ``rows`` but read in a separate thread so reading, decoding and
+    parsing the data overlaps with processing the rows. The reading thread
+    passes rows in batches of ``batch_size`` rows and reads at most
+    ``queue_depth`` batches ahead. Errors in the reading thread are raised
+    when the consumer reaches the position where they occurred.
+
+    The reading thread starts with the first row requested and stops once
+    all rows are read or the result is closed, for example because the
+    consumer stopped iterating over it early.
+    """
+    assert rows is not None
+    assert batch_size >= 1
+    assert queue_depth >= 1
+
+    batch_queue = queue.Queue(queue_depth)
+    stop_event = threading.Event()
+
+    def put(item):
+        is_put = False
+        while not (is_put or stop_event.is_set()):
+            try:
+                batch_queue.put(item, True, _PIPELINE_POLL_INTERVAL)
+                is_put = True
+            except queue.Full:
+                pass
+        return is_put
+
+    def read_batches():
+        # Items in the queue are batches of rows, an exception or ``None``
+        # at the end of the rows.
+        batch = []
+        end_item = None
+        try:
+            try:
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        if not put(batch):
+                            return
+                        batch = []
+            except Exception as error:
+                end_item = error
+            if (not batch) or put(batch):
+                put(end_item)
+        finally:
+            if hasattr(rows, 'close'):
+                rows.close()
+
+    reading_thread = threading.Thread(target=read_batches, name='cutplace-pipeline')
+    reading_thread.daemon = True
+    reading_thread.start()
+    try:
+        item = batch_queue.get()
+        while isinstance(item, list):
+            for row in item:
+                yield row
+            item = batch_queue.get()
+        if item is not None:
+            raise item
+    finally:
+        stop_event.set()
+        reading_thread.join()
+
+
 class AbstractRowWriter(object):
     """
     Base class for writers that can write rows to ``target`` using a certain
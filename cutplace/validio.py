@@ -20,12 +20,18 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import io
 import itertools
+import json
+import logging
+import multiprocessing
+import os
 
 import six
 
 from cutplace import data
 from cutplace import errors
+from cutplace import fields
 from cutplace import interface
 from cutplace import rowio
 from cutplace import _compat
@@ -33,6 +39,21 @@ from cutplace import _compat
 # Valid choices for ``on_error`` parameter.
 _VALID_ON_ERROR_CHOICES = ('continue', 'raise', 'yield')
 
+# Valid choices for ``dictionary_encoding`` parameter.
+_VALID_DICTIONARY_ENCODING_CHOICES = (None, 'code', 'intern')
+
+# Valid choices for ``validation_engine`` parameter.
+_VALID_VALIDATION_ENGINE_CHOICES = ('columnar', 'row')
+
+#: Suffix added to the path of data files to obtain the default path of the
+#: checkpoint written by :py:meth:`Reader.validate_rows`.
+CHECKPOINT_SUFFIX = '.cutplace-checkpoint'
+
+#: Default number of rows in each batch of :py:meth:`Reader.row_batches`.
+DEFAULT_ROW_BATCH_SIZE = 1000
+
+_log = logging.getLogger("cutplace")
+
 
 def _create_field_map(field_names, field_values):
     assert field_names
@@ -42,6 +63,374 @@ def _create_field_map(field_names, field_values):
     return dict(zip(field_names, field_values))
 
 
+def _range_condition_code(range_items, name):
+    """
+    Python expression that is ``True`` if the integer variable ``name`` is
+    within ``range_items`` as described by
+    :py:attr:`cutplace.ranges.Range.items`.
+    """
+    assert range_items
+
+    conditions = []
+    for lower, upper in range_items:
+        if lower is None:
+            assert upper is not None
+            conditions.append('%s <= %d' % (name, upper))
+        elif upper is None:
+            conditions.append('%s >= %d' % (name, lower))
+        elif lower == upper:
+            conditions.append('%s == %d' % (name, lower))
+        else:
+            conditions.append('%d <= %s <= %d' % (lower, name, upper))
+    if len(conditions) == 1:
+        result = conditions[0]
+    else:
+        result = ' or '.join('(%s)' % condition for condition in conditions)
+    return result
+
+
+def _compiled_fields_validator(cid):
+    """
+    A function ``first_invalid_field(row)`` specialized for ``cid`` that
+    returns ``None`` if ``row`` has the expected number of items and all of
+    them conform to their field format. Otherwise it returns a tuple
+    ``(field_index, error)`` with the index of the first field that might
+    be broken and, if the field format already raised it, the
+    :py:exc:`cutplace.errors.FieldValueError`. Without an error the row
+    might still be valid; only the generic validation in
+    :py:meth:`BaseValidator.validate_row` can tell and describe the error.
+
+    The function is generated as Python source code for all fields with
+    simple checks such as length, choices, patterns and integer ranges
+    inlined and field formats that accept anything skipped. All other field
+    formats fall back to :py:meth:`cutplace.fields.AbstractFieldFormat.validate`.
+    """
+    assert cid is not None
+
+    data_format = cid.data_format
+    # Fixed format requires stripping values before validating them, which is hardly worth inlining.
+    can_inline = (data_format.format != data.FORMAT_FIXED)
+    has_disallowed_characters = (data_format.disallowed_characters_regex is not None)
+    field_count = len(cid.field_formats)
+    parameter_name_to_value_map = {
+        'text_type': six.text_type,
+        'FieldValueError': errors.FieldValueError,
+    }
+    if has_disallowed_characters:
+        parameter_name_to_value_map['search_disallowed_character'] = data_format.disallowed_characters_regex.search
+    lines = [
+        'def first_invalid_field(row):',
+        '    if len(row) != %d:' % field_count,
+        '        return 0, None',
+    ]
+    if field_count >= 1:
+        value_names = ', '.join('value_%d' % field_index for field_index in range(field_count))
+        lines.append('    %s%s = row' % (value_names, ',' if field_count == 1 else ''))
+    for field_index, field_format in enumerate(cid.field_formats):
+        value_name = 'value_%d' % field_index
+        field_format_type = type(field_format)
+        return_invalid = 'return %d, None' % field_index
+        lines.extend([
+            '    if %s.__class__ is not text_type:' % value_name,
+            '        ' + return_invalid,
+        ])
+        if can_inline and (field_format.validation_cache is None) and field_format_type in (
+                fields.ChoiceFieldFormat, fields.ConstantFieldFormat, fields.IntegerFieldFormat,
+                fields.PatternFieldFormat, fields.RegExFieldFormat, fields.TextFieldFormat):
+            check_lines = []
+            if has_disallowed_characters:
+                check_lines.extend([
+                    'if search_disallowed_character(%s) is not None:' % value_name,
+                    '    ' + return_invalid,
+                ])
+            if field_format.length.items is not None:
+                check_lines.extend([
+                    'length = len(%s)' % value_name,
+                    'if not (%s):' % _range_condition_code(field_format.length.items, 'length'),
+                    '    ' + return_invalid,
+                ])
+            if field_format_type is fields.ChoiceFieldFormat:
+                choices_name = 'choices_%d' % field_index
+                parameter_name_to_value_map[choices_name] = frozenset(field_format.choices)
+                check_lines.extend([
+                    'if %s not in %s:' % (value_name, choices_name),
+                    '    ' + return_invalid,
+                ])
+            elif field_format_type is fields.ConstantFieldFormat:
+                constant_name = 'constant_%d' % field_index
+                parameter_name_to_value_map[constant_name] = field_format._constant
+                check_lines.extend([
+                    'if %s != %s:' % (value_name, constant_name),
+                    '    ' + return_invalid,
+                ])
+            elif field_format_type is fields.IntegerFieldFormat:
+                check_lines.extend([
+                    'try:',
+                    '    number = int(%s)' % value_name,
+                    'except ValueError:',
+                    '    ' + return_invalid,
+                ])
+                if field_format.valid_range.items is not None:
+                    check_lines.extend([
+                        'if not (%s):' % _range_condition_code(field_format.valid_range.items, 'number'),
+                        '    ' + return_invalid,
+                    ])
+            elif field_format_type in (fields.PatternFieldFormat, fields.RegExFieldFormat):
+                match_name = 'match_%d' % field_index
+                parameter_name_to_value_map[match_name] = field_format.regex.match
+                check_lines.extend([
+                    'if %s(%s) is None:' % (match_name, value_name),
+                    '    ' + return_invalid,
+                ])
+            else:
+                assert field_format_type is fields.TextFieldFormat
+            if field_format.is_allowed_to_be_empty:
+                if check_lines:
+                    lines.append('    if %s:' % value_name)
+                    lines.extend('        ' + check_line for check_line in check_lines)
+            else:
+                lines.extend([
+                    '    if not %s:' % value_name,
+                    '        ' + return_invalid,
+                ])
+                lines.extend('    ' + check_line for check_line in check_lines)
+        else:
+            validate_name = 'validate_%d' % field_index
+            parameter_name_to_value_map[validate_name] = field_format.validate
+            lines.extend([
+                '    try:',
+                '        %s(%s)' % (validate_name, value_name),
+                '    except FieldValueError as error:',
+                '        return %d, error' % field_index,
+            ])
+    lines.append('    return None')
+
+    # Wrap the function in a factory so all values it needs are bound to local variables.
+    parameter_names = sorted(parameter_name_to_value_map.keys())
+    source_code = '\n'.join(
+        ['def create_first_invalid_field(%s):' % ', '.join(parameter_names)]
+        + ['    ' + line for line in lines]
+        + ['    return first_invalid_field'])
+    _log.debug('compiled fields validator:\n%s', source_code)
+    namespace = {}
+    exec(compile(source_code, '<cutplace fields validator>', 'exec'), namespace)
+    return namespace['create_first_invalid_field'](
+        *[parameter_name_to_value_map[parameter_name] for parameter_name in parameter_names])
+
+
+def _can_validate_column(field_format):
+    """
+    ``True`` if the values of ``field_format`` can be validated column by
+    column using :py:meth:`cutplace.fields.AbstractFieldFormat.invalid_value_index`,
+    which validates each distinct value only once and bypasses
+    :py:meth:`~cutplace.fields.AbstractFieldFormat.validated`. This requires
+    the outcome of the validation to depend on nothing but the value and
+    ``validated()`` not to be overridden.
+    """
+    assert field_format is not None
+    return field_format.is_cacheable and (
+        six.get_unbound_function(type(field_format).validated)
+        is six.get_unbound_function(fields.AbstractFieldFormat.validated))
+
+
+def _dictionary_encoder(cid, dictionary_encoding):
+    """
+    A function ``encoded_row(row)`` that returns a copy of ``row`` with the
+    values of choice and constant fields replaced according to
+    ``dictionary_encoding`` (as described with :py:class:`Reader`) or
+    ``None`` if there is nothing to encode.
+    """
+    assert cid is not None
+    assert dictionary_encoding in _VALID_DICTIONARY_ENCODING_CHOICES, \
+        'dictionary_encoding=%r' % dictionary_encoding
+
+    field_index_and_value_to_encoded_maps = []
+    if dictionary_encoding is not None:
+        for field_index, field_format in enumerate(cid.field_formats):
+            if isinstance(field_format, (fields.ChoiceFieldFormat, fields.ConstantFieldFormat)):
+                code_table = field_format.code_table
+                if dictionary_encoding == 'code':
+                    value_to_encoded_map = dict((value, field_format.code_for(value)) for value in code_table)
+                else:
+                    assert dictionary_encoding == 'intern'
+                    value_to_encoded_map = dict((value, value) for value in code_table)
+                field_index_and_value_to_encoded_maps.append((field_index, value_to_encoded_map))
+    if field_index_and_value_to_encoded_maps:
+        def encoded_row(row):
+            result = list(row)
+            for field_index, value_to_encoded_map in field_index_and_value_to_encoded_maps:
+                value = result[field_index]
+                result[field_index] = value_to_encoded_map.get(value, value)
+            return result
+    else:
+        encoded_row = None
+    return encoded_row
+
+
+class _ChunkResult(object):
+    """
+    Result of validating a single chunk of data in a worker process.
+    """
+    def __init__(self, row_count, accepted_rows_count, rejected_rows_count, check_name_to_state_map, error=None):
+        self.row_count = row_count
+        self.accepted_rows_count = accepted_rows_count
+        self.rejected_rows_count = rejected_rows_count
+        self.check_name_to_state_map = check_name_to_state_map
+        self.error = error
+        self.is_format_error = isinstance(error, errors.DataFormatError)
+
+
+# CID used by `_validated_chunk()` in worker processes.
+_chunk_worker_cid = None
+
+
+def _initialize_chunk_worker(cid):
+    global _chunk_worker_cid
+    _chunk_worker_cid = cid
+
+
+def _validated_chunk(source_path, start, end, header_row_count, on_error):
+    """
+    Validate the data in ``source_path`` from byte ``start`` to ``end``
+    using the CID set by :py:func:`_initialize_chunk_worker`.
+
+    :rtype: _ChunkResult
+    """
+    assert _chunk_worker_cid is not None
+
+    data_format = _chunk_worker_cid.data_format
+    newline = '' if data_format.format == data.FORMAT_DELIMITED else None
+    with rowio.open_chunk(source_path, data_format.encoding, start, end, newline) as chunk_stream:
+        reader = Reader(_chunk_worker_cid, chunk_stream, on_error)
+        reader._header_row_count = header_row_count
+        try:
+            reader.validate_rows()
+            error = None
+        except errors.DataError as raised_error:
+            error = raised_error
+        check_name_to_state_map = dict(
+            (check_name, check.state()) for check_name, check in _chunk_worker_cid.check_map.items())
+        return _ChunkResult(
+            reader.location.line, reader.accepted_rows_count, reader.rejected_rows_count, check_name_to_state_map,
+            error)
+
+
+def _validated_chunk_task(task):
+    return _validated_chunk(*task)
+
+
+def _validated_member(cid, member_path):
+    """
+    Validate the whole member of a ZIP archive described by ``member_path``
+    using ``cid``.
+
+    :return: tuple ``(member_path, accepted_rows_count, error)`` with \
+      ``error`` being ``None`` if the member is valid
+    """
+    accepted_rows_count = 0
+    error = None
+    try:
+        with Reader(cid, member_path) as reader:
+            try:
+                reader.validate_rows()
+            finally:
+                accepted_rows_count = reader.accepted_rows_count
+    except errors.CutplaceError as raised_error:
+        error = raised_error
+    return member_path, accepted_rows_count, error
+
+
+def _validated_member_task(member_path):
+    assert _chunk_worker_cid is not None
+    return _validated_member(_chunk_worker_cid, member_path)
+
+
+def _move_error_location(error, line_offset):
+    """
+    Move the lines of the locations of ``error`` by ``line_offset`` so they
+    refer to the whole data instead of a single chunk.
+    """
+    assert error is not None
+    assert line_offset >= 0
+
+    for location in (error.location, error.see_also_location):
+        if (location is not None) and (line_offset > 0):
+            location.advance_line(line_offset)
+
+
+def _json_compatible(value):
+    """
+    ``value`` converted so it can be stored using :py:func:`json.dumps`
+    and restored using :py:func:`_from_json_compatible`. Tuples,
+    dictionaries and locations become dictionaries with a single item
+    telling their type because JSON has no tuples and only allows text keys.
+
+    :raises TypeError: if ``value`` contains anything else than ``None``, \
+      booleans, numbers, text, lists, tuples, dictionaries and \
+      :py:class:`cutplace.errors.Location`
+    """
+    if (value is None) or isinstance(value, (bool, float) + six.integer_types + six.string_types):
+        result = value
+    elif isinstance(value, list):
+        result = [_json_compatible(item) for item in value]
+    elif isinstance(value, tuple):
+        result = {'tuple': [_json_compatible(item) for item in value]}
+    elif isinstance(value, dict):
+        result = {'dict': [[_json_compatible(key), _json_compatible(item)] for key, item in value.items()]}
+    elif isinstance(value, errors.Location):
+        result = {'location': dict(value.__dict__)}
+    else:
+        raise TypeError('value of type %s cannot be stored as JSON: %r' % (type(value).__name__, value))
+    return result
+
+
+def _location_from_json_compatible(location_map):
+    """
+    The :py:class:`cutplace.errors.Location` stored in ``location_map`` by
+    :py:func:`_json_compatible`.
+    """
+    result = errors.Location(location_map['file_path'])
+    if sorted(location_map.keys()) != sorted(result.__dict__.keys()):
+        raise ValueError('location must have attributes %s but has: %s' % (
+            sorted(result.__dict__.keys()), sorted(location_map.keys())))
+    for name, value in location_map.items():
+        default_value = result.__dict__[name]
+        if isinstance(value, bool) != isinstance(default_value, bool) \
+                or not isinstance(value, six.string_types if name == 'file_path' else six.integer_types):
+            raise ValueError('location attribute %s has wrong type: %r' % (name, value))
+    result.__dict__.update(location_map)
+    return result
+
+
+def _from_json_compatible(value):
+    """
+    The value stored by :py:func:`_json_compatible`.
+
+    :raises ValueError: if ``value`` cannot have been stored by \
+      :py:func:`_json_compatible`
+    """
+    if isinstance(value, list):
+        result = [_from_json_compatible(item) for item in value]
+    elif isinstance(value, dict):
+        if len(value) != 1:
+            raise ValueError('dictionary must have a single item telling the type: %r' % value)
+        value_type, content = list(value.items())[0]
+        if not isinstance(content, dict if value_type == 'location' else list):
+            raise ValueError('content of %s has wrong type: %r' % (value_type, content))
+        if value_type == 'tuple':
+            result = tuple(_from_json_compatible(item) for item in content)
+        elif value_type == 'dict':
+            result = dict(
+                (_from_json_compatible(key), _from_json_compatible(item)) for key, item in content)
+        elif value_type == 'location':
+            result = _location_from_json_compatible(content)
+        else:
+            raise ValueError('type must be one of %s but is: %r' % (['dict', 'location', 'tuple'], value_type))
+    else:
+        result = value
+    return result
+
+
 class BaseValidator(object):
     """
     A general validator to validate a single row (by validating its fields
@@ -66,6 +455,7 @@ class BaseValidator(object):
             assert self._cid.data_format.is_valid, \
                 'DataFormat.validate() must be called before using a CID for validation'
         self._expected_item_count = len(self._cid.field_formats)
+        self._first_invalid_field = _compiled_fields_validator(self._cid)
         self._location = None
         self._is_closed = False
 
@@ -111,10 +501,31 @@ class BaseValidator(object):
         The caller is responsible for :py:attr:`~.location` pointing to the
         correct row in the data while ``validate_row`` takes care of calling
         :py:meth:`cutplace.errors.Location.set_cell` appropriately.
+
+        Step 1 and 2 first use a function generated specifically for the
+        fields of the CID when the validator was created. Only if it finds
+        a problem, the fields are validated again one by one to describe
+        the error.
         """
         assert row is not None
         assert self.location is not None
 
+        invalid_field = self._first_invalid_field(row)
+        if invalid_field is not None:
+            self._validate_fields(row, *invalid_field)
+        self._check_row(row)
+
+    def _validate_fields(self, row, first_field_index=0, first_field_error=None):
+        """
+        Validate the number of items in ``row`` and that all of them conform
+        to their field format, setting the cell of the :py:attr:`~.location`
+        for each of them.
+
+        Fields before ``first_field_index`` are known to be valid already
+        and are skipped. If ``first_field_error`` is not ``None``, it is the
+        error validating the field at ``first_field_index`` already
+        resulted in, which is used instead of validating the field again.
+        """
         # Validate that number of fields.
         actual_item_count = len(row)
         if actual_item_count < self._expected_item_count:
@@ -129,25 +540,88 @@ class BaseValidator(object):
                 self.location)
 
         # Validate each field according to its format.
-        for field_index, field_value in enumerate(row):
+        for field_index in range(first_field_index, actual_item_count):
+            field_value = row[field_index]
             self.location.set_cell(field_index)
             field_to_validate = self.cid.field_formats[field_index]
             try:
+                if (field_index == first_field_index) and (first_field_error is not None):
+                    raise first_field_error
                 if not isinstance(field_value, six.text_type):
                     raise errors.FieldValueError(
                         'type must be %s instead of %s: %s'
                         % (six.text_type.__name__, type(field_value).__name__, _compat.text_repr(field_value)))
-                field_to_validate.validated(field_value)
+                field_to_validate.validate(field_value)
             except errors.FieldValueError as error:
                 error.prepend_message(
                     'cannot accept field %s' % _compat.text_repr(field_to_validate.field_name), self.location)
                 raise
 
-        # Validate the whole row according to row checks.
+    def _check_row(self, row):
+        """
+        Validate the whole ``row`` according to row checks.
+        """
         self.location.set_cell(0)
-        field_map = _create_field_map(self.cid.field_names, row)
-        for check_name in self.cid.check_names:
-            self.cid.check_map[check_name].check_row(field_map, self.location)
+        if self.cid.check_names:
+            field_map = _create_field_map(self.cid.field_names, row)
+            for check_name in self.cid.check_names:
+                self.cid.check_map[check_name].check_row(field_map, self.location)
+
+    def valid_fields_row_count(self, rows):
+        """
+        The number of rows at the start of ``rows`` that have the expected
+        number of items and conform to their field formats, similar to step
+        1 and 2 of :py:meth:`~.validate_row` but without row checks.
+
+        Instead of validating row by row, this turns ``rows`` into columns
+        and validates each column at once using
+        :py:meth:`cutplace.fields.AbstractFieldFormat.invalid_value_index`,
+        which is considerably faster for many rows. Field formats that are
+        not :py:attr:`~cutplace.fields.AbstractFieldFormat.is_cacheable` or
+        override :py:meth:`~cutplace.fields.AbstractFieldFormat.validated`
+        still validate their values one by one. This does not raise any
+        errors or change the :py:attr:`~.location`; to obtain the error for
+        the first broken row, call :py:meth:`~.validate_row` with it.
+
+        :param list rows: rows to validate
+        """
+        assert rows is not None
+
+        result = len(rows)
+        for row_index, row in enumerate(rows):
+            if len(row) != self._expected_item_count:
+                result = row_index
+                break
+        if result >= 1:
+            columns = list(zip(*rows[:result]))
+            for field_format, column in zip(self.cid.field_formats, columns):
+                column = column[:result]
+                invalid_index = None
+                if set(map(type, column)) != set([six.text_type]):
+                    for value_index, value in enumerate(column):
+                        if not isinstance(value, six.text_type):
+                            invalid_index = value_index
+                            break
+                    if invalid_index is not None:
+                        column = column[:invalid_index]
+                if column:
+                    if _can_validate_column(field_format):
+                        invalid_value_index = field_format.invalid_value_index(column)
+                    else:
+                        invalid_value_index = None
+                        for value_index, value in enumerate(column):
+                            try:
+                                field_format.validate(value)
+                            except errors.FieldValueError:
+                                invalid_value_index = value_index
+                                break
+                    if invalid_value_index is not None:
+                        invalid_index = invalid_value_index
+                if invalid_index is not None:
+                    result = invalid_index
+                    if result == 0:
+                        break
+        return result
 
     def close(self):
         """
@@ -168,7 +642,9 @@ class BaseValidator(object):
 
 
 class Reader(BaseValidator):
-    def __init__(self, cid_or_path, source_data_stream_or_path, on_error='raise', validate_until=None):
+    def __init__(self, cid_or_path, source_data_stream_or_path, on_error='raise', validate_until=None,
+                 pipeline_queue_depth=None, pipeline_batch_size=rowio.DEFAULT_PIPELINE_BATCH_SIZE,
+                 dictionary_encoding=None, validation_engine='row'):
         """
         An iterator that produces possibly validated rows from
         ``source_data_stream_or_path`` conforming to ``cid_or_path``.
@@ -185,11 +661,44 @@ class Reader(BaseValidator):
           ``None`` all rows should be validated (the default); 0 means no \
           rows should be validated
         :type: int or None
+        :param pipeline_queue_depth: if not ``None``, read and parse the \
+          data in a separate thread while validating the rows, using \
+          :py:func:`cutplace.rowio.pipelined_rows` with this many batches \
+          of ``pipeline_batch_size`` rows read ahead; this keeps the CPU \
+          busy while waiting for slow storage such as network file systems \
+          and :py:const:`cutplace.rowio.DEFAULT_PIPELINE_QUEUE_DEPTH` is a \
+          reasonable value to start with
+        :type: int or None
+        :param int pipeline_batch_size: number of rows passed between the \
+          threads at once
+        :param dictionary_encoding: how rows represent the values of \
+          :py:class:`cutplace.fields.ChoiceFieldFormat` and \
+          :py:class:`cutplace.fields.ConstantFieldFormat` fields: \
+          ``None`` means the values as read (the default); ``'intern'`` \
+          means the same string object shared by all rows; ``'code'`` \
+          means the index of the value in the field's \
+          :py:attr:`~.code_tables`; both save a lot of memory when keeping \
+          many rows around; empty values and values of rows that are not \
+          validated remain unchanged
+        :type: str or None
+        :param str validation_engine: how :py:meth:`~.row_batches` and \
+          :py:meth:`~.validate_rows` validate fields: ``'row'`` (the \
+          default) validates each row on its own; ``'columnar'`` \
+          validates the fields of a batch column by column using \
+          :py:meth:`~.valid_fields_row_count`, which is faster but only \
+          used if all field formats are \
+          :py:attr:`~cutplace.fields.AbstractFieldFormat.is_cacheable` and \
+          do not override :py:meth:`~cutplace.fields.AbstractFieldFormat.validated`
         """
         assert cid_or_path is not None
         assert source_data_stream_or_path is not None
         assert on_error in _VALID_ON_ERROR_CHOICES, 'on_error=%r' % on_error
         assert (validate_until is None) or (validate_until >= 0)
+        assert (pipeline_queue_depth is None) or (pipeline_queue_depth >= 1)
+        assert pipeline_batch_size >= 1
+        assert dictionary_encoding in _VALID_DICTIONARY_ENCODING_CHOICES, \
+            'dictionary_encoding=%r' % dictionary_encoding
+        assert validation_engine in _VALID_VALIDATION_ENGINE_CHOICES, 'validation_engine=%r' % validation_engine
 
         super(Reader, self).__init__(cid_or_path)
         # TODO: Consolidate obtaining source path with other code segments that do similar things.
@@ -204,6 +713,16 @@ class Reader(BaseValidator):
         self._source_data_stream_or_path = source_data_stream_or_path
         self._on_error = on_error
         self._validate_until = validate_until
+        self._header_row_count = self._cid.data_format.header
+        self._pipeline_queue_depth = pipeline_queue_depth
+        self._pipeline_batch_size = pipeline_batch_size
+        self._dictionary_encoding = dictionary_encoding
+        self._encoded_row = _dictionary_encoder(self._cid, dictionary_encoding)
+        self._validation_engine = validation_engine
+        # Stateful field formats would see values twice if a row after the first broken one in the batch has to
+        # be validated again, so they prevent columnar validation.
+        self._validates_columns = (validation_engine == 'columnar') and all(
+            _can_validate_column(field_format) for field_format in self._cid.field_formats)
         self.accepted_rows_count = None
         self.rejected_rows_count = None
 
@@ -211,23 +730,111 @@ class Reader(BaseValidator):
     def on_error(self):
         return self._on_error
 
-    def _raw_rows(self):
+    @property
+    def dictionary_encoding(self):
+        return self._dictionary_encoding
+
+    @property
+    def validation_engine(self):
+        return self._validation_engine
+
+    @property
+    def code_tables(self):
+        """
+        Map of field names to the tuple of values the codes of
+        ``dictionary_encoding='code'`` refer to, for all choice and
+        constant fields. The tuples are shared by all rows, so
+        ``code_tables[field_name][row[field_index]]`` yields the original
+        value.
+        """
+        return dict(
+            (field_format.field_name, field_format.code_table) for field_format in self.cid.field_formats
+            if isinstance(field_format, (fields.ChoiceFieldFormat, fields.ConstantFieldFormat)))
+
+    def _raw_rows(self, source_data_stream_or_path=None):
         data_format = self.cid.data_format
         format = data_format.format
+        if source_data_stream_or_path is None:
+            source_data_stream_or_path = self._source_data_stream_or_path
         if format == data.FORMAT_EXCEL:
-            return rowio.excel_rows(self._source_data_stream_or_path, data_format.sheet)
+            return rowio.excel_rows(source_data_stream_or_path, data_format.sheet, len(self.cid.field_names))
         elif format == data.FORMAT_DELIMITED:
-            return rowio.delimited_rows(self._source_data_stream_or_path, data_format)
+            return rowio.delimited_rows(source_data_stream_or_path, data_format)
         elif format == data.FORMAT_FIXED:
             return rowio.fixed_rows(
-                self._source_data_stream_or_path, data_format.encoding, interface.field_names_and_lengths(self.cid),
+                source_data_stream_or_path, data_format.encoding, interface.field_names_and_lengths(self.cid),
                 data_format.line_delimiter)
         elif format == data.FORMAT_ODS:
-            return rowio.ods_rows(self._source_data_stream_or_path, data_format.sheet)
+            return rowio.ods_rows(source_data_stream_or_path, data_format.sheet, len(self.cid.field_names))
         else:
             assert False, 'format=%r' % format
 
-    def rows(self):
+    def _is_source_file(self):
+        """
+        ``True`` if the data are read from a file path that allows to seek
+        to byte offsets as opposed to a stream or a member of a ZIP archive.
+        """
+        source = self._source_data_stream_or_path
+        return isinstance(source, six.string_types) and not rowio.is_archive_member_path(source)
+
+    def row_index(self):
+        """
+        The :py:class:`cutplace.rowio.RowIndex` for the data, possibly
+        read from or stored in a sidecar file as described with
+        :py:func:`cutplace.rowio.row_index`, or ``None`` if the data are no
+        delimited or fixed file or cannot be indexed.
+        """
+        result = None
+        data_format = self.cid.data_format
+        if self._is_source_file() and (data_format.format in (data.FORMAT_DELIMITED, data.FORMAT_FIXED)):
+            field_names_and_lengths = interface.field_names_and_lengths(self.cid) \
+                if data_format.format == data.FORMAT_FIXED else None
+            result = rowio.row_index(self._source_data_stream_or_path, data_format, field_names_and_lengths)
+        return result
+
+    def _raw_rows_after_offset(self, offset, line_offset):
+        """
+        Same as :py:meth:`_raw_rows` but starting at byte ``offset`` with
+        errors referring to lines after ``line_offset``.
+        """
+        data_format = self.cid.data_format
+        source_path = self._source_data_stream_or_path
+        newline = '' if data_format.format == data.FORMAT_DELIMITED else None
+        with rowio.open_chunk(
+                source_path, data_format.encoding, offset, os.path.getsize(source_path), newline) as data_stream:
+            try:
+                for row in self._raw_rows(data_stream):
+                    yield row
+            except errors.DataFormatError as error:
+                _move_error_location(error, line_offset)
+                raise
+
+    def _raw_rows_in_range(self, start, stop):
+        """
+        Same as :py:meth:`_raw_rows` but only for rows from index ``start``
+        up to but not including ``stop``. Use a row index to skip the rows
+        before ``start`` if possible.
+        """
+        result = None
+        first_row = 0
+        source = self._source_data_stream_or_path
+        # Unless there already is an index, building one only helps if it has an entry after the first row.
+        is_index_helpful = (start >= rowio.DEFAULT_ROW_INDEX_STEP) or (
+            isinstance(source, six.string_types) and os.path.exists(rowio.row_index_path(source)))
+        if is_index_helpful:
+            index = self.row_index()
+            if index is not None:
+                indexed_row, offset, line = index.entry_for_row(start)
+                if indexed_row > 0:
+                    first_row = indexed_row
+                    result = self._raw_rows_after_offset(offset, line)
+        if result is None:
+            result = self._raw_rows()
+        if (start > first_row) or (stop is not None):
+            result = itertools.islice(result, start - first_row, None if stop is None else stop - first_row)
+        return result
+
+    def rows(self, start=0, stop=None):
         """
         Data rows of ``source_path``.
 
@@ -237,19 +844,128 @@ class Reader(BaseValidator):
         files result in a
         :py:exc:`cutplace.errors.DataFormatError`.
 
+        :param int start: index of the first row to read; rows before it \
+          are skipped without validating them, using :py:meth:`row_index` \
+          if possible
+        :param stop: index of the row after the last row to read; \
+          ``None`` means to read all remaining rows
+        :type: int or None
+        :raises cutplace.errors.DataError: on broken data
+        """
+        assert start >= 0
+        assert (stop is None) or (stop >= start)
+
+        self.accepted_rows_count = 0
+        self.rejected_rows_count = 0
+        for check in self.cid.check_map.values():
+            check.reset()
+        if (start == 0) and (stop is None):
+            raw_rows = self._raw_rows()
+        else:
+            raw_rows = self._raw_rows_in_range(start, stop)
+            self._location.line = start
+        for row in self._validated_rows(raw_rows, start):
+            yield row
+
+    def row_batches(self, size=DEFAULT_ROW_BATCH_SIZE):
+        """
+        Same as :py:meth:`~.rows` but in lists of up to ``size`` rows, which
+        saves the overhead of passing each row on its own. This is useful
+        for consumers that process batches anyway, for example to insert
+        them in a data base.
+
+        With ``validation_engine='columnar'``, the fields of each batch are
+        validated column by column using :py:meth:`~.valid_fields_row_count`,
+        which is faster than validating row by row while still reporting the
+        same errors.
+
+        With ``on_error='raise'``, an error stops reading immediately, so
+        the valid rows before it in the same batch are not provided.
+        :py:attr:`accepted_rows_count` still includes them though.
+
+        :param int size: maximum number of rows in each batch
         :raises cutplace.errors.DataError: on broken data
         """
+        assert size >= 1
+
         self.accepted_rows_count = 0
         self.rejected_rows_count = 0
         for check in self.cid.check_map.values():
             check.reset()
-        header_row_count = self._cid.data_format.header
-        for row_count, row in enumerate(self._raw_rows(), 1):
+        raw_rows = self._raw_rows()
+        if self._pipeline_queue_depth is not None:
+            raw_rows = rowio.pipelined_rows(raw_rows, self._pipeline_batch_size, self._pipeline_queue_depth)
+        # Use local variables for anything accessed for each row.
+        advance_line = self._location.advance_line
+        validate_row = self.validate_row
+        check_row = self._check_row
+        has_checks = bool(self.cid.check_names)
+        on_error = self.on_error
+        encoded_row = self._encoded_row
+        first_row_to_validate = self._header_row_count + 1
+        last_row_to_validate = self._validate_until
+        row_count = 0
+        raw_batch = list(itertools.islice(raw_rows, size))
+        while raw_batch:
+            batch = []
+            accepted_rows_count = 0
+            # Validate the fields of the batch column by column; only rows after the first broken one and rows
+            # with broken row checks need the row by row validation to report the error.
+            first_row_to_validate_in_batch = min(len(raw_batch), max(0, first_row_to_validate - row_count - 1))
+            if last_row_to_validate is None:
+                last_row_to_validate_in_batch = len(raw_batch)
+            else:
+                last_row_to_validate_in_batch = min(len(raw_batch), max(0, last_row_to_validate - row_count))
+            if self._validates_columns and (first_row_to_validate_in_batch < last_row_to_validate_in_batch):
+                first_row_with_unknown_fields_in_batch = first_row_to_validate_in_batch + self.valid_fields_row_count(
+                    raw_batch[first_row_to_validate_in_batch:last_row_to_validate_in_batch])
+            else:
+                first_row_with_unknown_fields_in_batch = first_row_to_validate_in_batch
             try:
-                is_after_header_row = (row_count > header_row_count)
+                for row_index_in_batch, row in enumerate(raw_batch):
+                    row_count += 1
+                    try:
+                        if row_index_in_batch < first_row_with_unknown_fields_in_batch:
+                            if has_checks and (row_index_in_batch >= first_row_to_validate_in_batch):
+                                check_row(row)
+                        elif (row_count >= first_row_to_validate) and \
+                                ((last_row_to_validate is None) or (row_count <= last_row_to_validate)):
+                            validate_row(row)
+                        accepted_rows_count += 1
+                        if (encoded_row is not None) and (row_count >= first_row_to_validate) and \
+                                ((last_row_to_validate is None) or (row_count <= last_row_to_validate)):
+                            row = encoded_row(row)
+                        batch.append(row)
+                    except errors.DataError as error:
+                        if on_error == 'raise':
+                            raise
+                        self.rejected_rows_count += 1
+                        if on_error == 'yield':
+                            batch.append(error)
+                        else:
+                            assert on_error == 'continue'
+                    advance_line()
+            finally:
+                self.accepted_rows_count += accepted_rows_count
+            yield batch
+            raw_batch = list(itertools.islice(raw_rows, size))
+
+    def _validated_rows(self, raw_rows, first_row, after_row=None):
+        """
+        Validate ``raw_rows`` starting after the ``first_row`` and yield
+        them, taking ``on_error`` into account. After processing each row,
+        call ``after_row`` with the number of rows processed so far.
+        """
+        if self._pipeline_queue_depth is not None:
+            raw_rows = rowio.pipelined_rows(raw_rows, self._pipeline_batch_size, self._pipeline_queue_depth)
+        for row_count, row in enumerate(raw_rows, first_row + 1):
+            try:
+                is_after_header_row = (row_count > self._header_row_count)
                 is_before_validate_until = (self._validate_until is None) or (row_count <= self._validate_until)
                 if is_after_header_row and is_before_validate_until:
                     self.validate_row(row)
+                    if self._encoded_row is not None:
+                        row = self._encoded_row(row)
                 self.accepted_rows_count += 1
                 yield row
             except errors.DataError as error:
@@ -261,8 +977,231 @@ class Reader(BaseValidator):
                 else:
                     assert self.on_error == 'continue'
             self._location.advance_line()
+            if after_row is not None:
+                after_row(row_count)
+
+    def _has_mergeable_checks(self):
+        """
+        ``True`` if the checks can be performed on chunks of the data and
+        yield the same result as when performed on all data at once.
+        """
+        # Rows rejected by one check would still be counted by other checks
+        # in the chunk, so only stopping on the first error yields the same
+        # result.
+        return (not self.cid.check_names) or (
+            (self.on_error == 'raise') and all(check.is_mergeable for check in self.cid.check_map.values()))
+
+    def _chunks(self, chunk_size):
+        """
+        Byte ranges of the data that can be validated independently or
+        ``None`` if the data have to be validated as a whole.
+        """
+        result = None
+        source_path = self._source_data_stream_or_path
+        data_format = self.cid.data_format
+        if self._is_source_file() and (self._validate_until is None) and self._has_mergeable_checks():
+            if data_format.format == data.FORMAT_DELIMITED:
+                result = rowio.delimited_chunks(source_path, data_format, chunk_size)
+            elif data_format.format == data.FORMAT_FIXED:
+                result = rowio.fixed_chunks(
+                    source_path, data_format.encoding, interface.field_names_and_lengths(self.cid),
+                    data_format.line_delimiter, chunk_size, data_format.header)
+            if (result is not None) and (len(result) < 2):
+                result = None
+        return result
+
+    def _line_offset_for_format_error(self, chunk_start):
+        """
+        Number of physical lines in the data before ``chunk_start``, which
+        is what a :py:exc:`cutplace.errors.DataFormatError` refers to in
+        case of delimited data.
+        """
+        data_format = self.cid.data_format
+        if data_format.format == data.FORMAT_DELIMITED:
+            line_delimiter = b'\r' if data_format.line_delimiter == '\r' else b'\n'
+            result = 0
+            with io.open(self._source_data_stream_or_path, 'rb') as delimited_binary_stream:
+                remaining_size = chunk_start
+                while remaining_size > 0:
+                    block = delimited_binary_stream.read(min(remaining_size, rowio.DEFAULT_CHUNK_SIZE))
+                    assert block
+                    result += block.count(line_delimiter)
+                    remaining_size -= len(block)
+        else:
+            result = None
+        return result
+
+    def _validate_chunks_in_parallel(self, chunks, jobs):
+        assert chunks
+        assert (jobs is None) or (jobs >= 2)
+
+        self.accepted_rows_count = 0
+        self.rejected_rows_count = 0
+        for check in self.cid.check_map.values():
+            check.reset()
+        worker_on_error = 'raise' if self.on_error == 'raise' else 'continue'
+        tasks = [
+            (self._source_data_stream_or_path, start, end, self._header_row_count if chunk_index == 0 else 0,
+             worker_on_error)
+            for chunk_index, (start, end) in enumerate(chunks)
+        ]
+        pool = multiprocessing.Pool(jobs, _initialize_chunk_worker, (self.cid,))
+        try:
+            row_count = 0
+            for (start, _), chunk_result in zip(chunks, pool.imap(_validated_chunk_task, tasks)):
+                self.accepted_rows_count += chunk_result.accepted_rows_count
+                self.rejected_rows_count += chunk_result.rejected_rows_count
+                # Errors detected when merging refer to rows before the error of the chunk (if any).
+                errors_found = []
+                for check_name in self.cid.check_names:
+                    check = self.cid.check_map[check_name]
+                    check_state = chunk_result.check_name_to_state_map[check_name]
+                    errors_found.extend(check.merge_state(check_state, row_count))
+                if chunk_result.error is not None:
+                    line_offset = None
+                    if chunk_result.is_format_error:
+                        line_offset = self._line_offset_for_format_error(start)
+                    if line_offset is None:
+                        line_offset = row_count
+                    _move_error_location(chunk_result.error, line_offset)
+                    errors_found.append(chunk_result.error)
+                if errors_found:
+                    raise min(errors_found, key=lambda error: error.location.line)
+                row_count += chunk_result.row_count
+            self._location.line = row_count
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _checkpoint_identity(self):
+        """
+        Information that has to match between the checkpoint and the current
+        run in order to resume validation.
+        """
+        data_format = self.cid.data_format
+        field_names_and_lengths = interface.field_names_and_lengths(self.cid) \
+            if data_format.format == data.FORMAT_FIXED else None
+        data_stat = os.stat(self._source_data_stream_or_path)
+        return {
+            'data_format_key': rowio.row_index_key(data_format, field_names_and_lengths),
+            'data_size': data_stat.st_size,
+            'data_modified': data_stat.st_mtime,
+            'field_names': list(self.cid.field_names),
+            'check_names': list(self.cid.check_names),
+            'on_error': self.on_error,
+            'validate_until': self._validate_until,
+        }
+
+    def _resume_from_checkpoint(self, checkpoint_path):
+        """
+        Restore the row counts and check states from the checkpoint stored
+        in ``checkpoint_path`` and return the triple ``(row, offset, line)``
+        where to continue, or ``None`` if there is no such checkpoint or it
+        does not match the current data and CID.
+        """
+        result = None
+        if os.path.exists(checkpoint_path):
+            try:
+                with io.open(checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+                    checkpoint = json.loads(checkpoint_file.read())
+                if not isinstance(checkpoint, dict):
+                    raise ValueError('checkpoint must be a dictionary but is: %s' % type(checkpoint).__name__)
+                if checkpoint.get('identity') == self._checkpoint_identity():
+                    for key in ('row', 'offset', 'line', 'accepted_rows_count', 'rejected_rows_count'):
+                        value = checkpoint[key]
+                        if isinstance(value, bool) or not isinstance(value, six.integer_types) or (value < 0):
+                            raise ValueError('%s must be an integer of at least 0 but is: %r' % (key, value))
+                    check_name_to_state_map = checkpoint['check_name_to_state_map']
+                    if sorted(check_name_to_state_map.keys()) != sorted(self.cid.check_names):
+                        raise ValueError('checkpoint must contain the state of all checks')
+                    for check_name, check_state in check_name_to_state_map.items():
+                        self.cid.check_map[check_name].merge_state(_from_json_compatible(check_state))
+                    self.accepted_rows_count = checkpoint['accepted_rows_count']
+                    self.rejected_rows_count = checkpoint['rejected_rows_count']
+                    result = (checkpoint['row'], checkpoint['offset'], checkpoint['line'])
+                else:
+                    _log.warning(
+                        'checkpoint "%s" does not match data or CID, starting from first row', checkpoint_path)
+            except (AssertionError, AttributeError, EnvironmentError, KeyError, TypeError, ValueError) as error:
+                _log.warning('cannot read checkpoint "%s", starting from first row: %s', checkpoint_path, error)
+                for check in self.cid.check_map.values():
+                    check.reset()
+        return result
+
+    def _write_checkpoint(self, checkpoint_path, row, offset, line):
+        """
+        Store a checkpoint in ``checkpoint_path`` to continue after ``row``
+        at byte ``offset`` with ``line`` lines read so far.
+        """
+        checkpoint = {
+            'identity': self._checkpoint_identity(),
+            'row': row,
+            'offset': offset,
+            'line': line,
+            'accepted_rows_count': self.accepted_rows_count,
+            'rejected_rows_count': self.rejected_rows_count,
+            'check_name_to_state_map': dict(
+                (check_name, _json_compatible(check.state())) for check_name, check in self.cid.check_map.items()),
+        }
+        # Write to a temporary file first so a killed process never leaves a broken checkpoint.
+        temp_checkpoint_path = checkpoint_path + '.tmp'
+        with io.open(temp_checkpoint_path, 'w', encoding='utf-8') as checkpoint_file:
+            checkpoint_file.write(six.text_type(json.dumps(checkpoint, ensure_ascii=True)))
+        _compat.replace_file(temp_checkpoint_path, checkpoint_path)
+
+    def _validate_rows_with_checkpoints(self, checkpoint_path, checkpoint_interval, resume):
+        """
+        Validate all rows while keeping track of the byte offset after
+        every ``checkpoint_interval`` rows in order to write checkpoints
+        there without reading the data another time.
+        """
+        assert checkpoint_path is not None
+        assert (checkpoint_interval is None) or (checkpoint_interval >= 1)
+
+        self.accepted_rows_count = 0
+        self.rejected_rows_count = 0
+        for check in self.cid.check_map.values():
+            check.reset()
+        resume_position = self._resume_from_checkpoint(checkpoint_path) if resume else None
+        if resume_position is not None:
+            first_row, offset, line_offset = resume_position
+            _log.info('resume validation after row %d from checkpoint "%s"', first_row, checkpoint_path)
+            self._location.line = first_row
+        else:
+            first_row, offset, line_offset = 0, 0, 0
+
+        data_format = self.cid.data_format
+        field_names_and_lengths = interface.field_names_and_lengths(self.cid) \
+            if data_format.format == data.FORMAT_FIXED else None
+        positioned_rows = rowio.positioned_rows(
+            self._source_data_stream_or_path, data_format, field_names_and_lengths, offset,
+            checkpoint_interval if checkpoint_interval is not None else 1)
+        # Rows might be read ahead of validation, so remember the positions by row.
+        row_to_position_map = {}
+
+        def raw_rows():
+            try:
+                for row_count, (row, position) in enumerate(positioned_rows, first_row + 1):
+                    if (checkpoint_interval is not None) and (position is not None):
+                        row_offset, line = position
+                        row_to_position_map[row_count] = (row_offset, line_offset + line)
+                    yield row
+            except errors.DataFormatError as error:
+                _move_error_location(error, line_offset)
+                raise
+
+        def write_checkpoint_if_due(row_count):
+            position = row_to_position_map.pop(row_count, None)
+            if position is not None:
+                self._write_checkpoint(checkpoint_path, row_count, *position)
+
+        for _ in self._validated_rows(raw_rows(), first_row, write_checkpoint_if_due):
+            pass
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
 
-    def validate_rows(self):
+    def validate_rows(self, jobs=1, chunk_size=rowio.DEFAULT_CHUNK_SIZE, checkpoint_interval=None, resume=False,
+                      checkpoint_path=None):
         """
         Validate that the data read from
         :py:meth:`~cutplace.validio.Reader.rows()` conform to
@@ -271,10 +1210,43 @@ class Reader(BaseValidator):
         In order to check everything, :py:meth`~.close()` has to be
         called to also validate the checks at the end of the data.
 
+        :param jobs: number of processes to validate chunks of about \
+          ``chunk_size`` bytes in parallel; ``None`` means to use one \
+          process for each CPU; 1 validates all rows in the current process
+        :type: int or None
+        :param checkpoint_interval: approximate number of rows after which \
+          to store a checkpoint in ``checkpoint_path`` that allows to \
+          ``resume`` an interrupted validation; ``None`` means no \
+          checkpoints are written
+        :type: int or None
+        :param bool resume: if ``True`` and ``checkpoint_path`` contains a \
+          checkpoint for the current data and CID, continue from there \
+          instead of starting from the first row
+        :param checkpoint_path: path of the file storing the checkpoint; \
+          ``None`` means to use the data path with the suffix \
+          :py:const:`CHECKPOINT_SUFFIX` appended
+        :type: str or None
         :raises cutplace.errors.DataError: on broken data
         """
-        for _ in self.rows():
-            pass
+        assert (jobs is None) or (jobs >= 1)
+        assert chunk_size >= 1
+        assert (checkpoint_interval is None) or (checkpoint_interval >= 1)
+
+        source = self._source_data_stream_or_path
+        is_checkpointable = ((checkpoint_interval is not None) or resume) \
+            and isinstance(source, six.string_types) and rowio.is_positionable(source, self.cid.data_format) \
+            and all(check.is_mergeable for check in self.cid.check_map.values())
+        if is_checkpointable:
+            if checkpoint_path is None:
+                checkpoint_path = source + CHECKPOINT_SUFFIX
+            self._validate_rows_with_checkpoints(checkpoint_path, checkpoint_interval, resume)
+        else:
+            chunks = self._chunks(chunk_size) if jobs != 1 else None
+            if chunks is not None:
+                self._validate_chunks_in_parallel(chunks, jobs)
+            else:
+                for _ in self.row_batches():
+                    pass
 
 
 class Writer(BaseValidator):
@@ -337,6 +1309,33 @@ class Writer(BaseValidator):
         for row_to_write in rows_to_write:
             self.write_row(row_to_write)
 
+    def write_batch(self, rows_to_write):
+        """
+        Validate all rows in the list ``rows_to_write`` and then write them
+        at once. Unlike :py:meth:`~.write_rows`, no row of the batch is
+        written if any of them is broken.
+
+        :raises cutplace.errors.DataError: on broken data
+        """
+        assert rows_to_write is not None
+        assert self._delegated_writer is not None
+
+        location = self.location
+        first_line = location.line
+        try:
+            for row_to_write in rows_to_write:
+                if location.line >= self._header:
+                    self.validate_row(row_to_write)
+                location.advance_line()
+        finally:
+            # The delegated writer advances the location itself while writing.
+            location.line = first_line
+        if self.cid.data_format.format == data.FORMAT_FIXED:
+            actual_rows_to_write = [self._padded_fixed_row(row_to_write) for row_to_write in rows_to_write]
+        else:
+            actual_rows_to_write = rows_to_write
+        self._delegated_writer.write_rows(actual_rows_to_write)
+
     def close(self):
         try:
             super(Writer, self).close()
@@ -371,7 +1370,7 @@ def rows(cid_or_path, data_stream_or_path, on_error='raise', validate_until=None
             yield row
 
 
-def validate(cid_or_path, data_stream_or_path, validate_until=None):
+def validate(cid_or_path, data_stream_or_path, validate_until=None, jobs=1):
     """
     Validate that ``data_or_path`` conform to ``cid_or_path``.
 
@@ -379,16 +1378,61 @@ def validate(cid_or_path, data_stream_or_path, validate_until=None):
       describing a path pointing to a CID
     :param data_stream_or_path: filelike object or :py:class:`str` \
       describing a path pointing to the data to be read
+    :param jobs: same as ``jobs`` for \
+      :py:meth:`cutplace.validio.Reader.validate_rows`
     :raises cutplace.errors.DataError: on broken data
     :raises cutplace.errors.InterfaceError: on a broken CID
     """
     assert cid_or_path is not None
     assert data_stream_or_path is not None
     assert (validate_until is None) or (validate_until >= 0)
+    assert (jobs is None) or (jobs >= 1)
 
     with Reader(cid_or_path, data_stream_or_path, validate_until=validate_until) as reader:
-        rows_to_validate = reader.rows()
         if validate_until is not None:
-            rows_to_validate = itertools.islice(rows_to_validate, validate_until)
-        for _ in rows_to_validate:
-            pass
+            for _ in itertools.islice(reader.rows(), validate_until):
+                pass
+        else:
+            reader.validate_rows(jobs)
+
+
+def validate_archive(cid_or_path, archive_path, jobs=1):
+    """
+    Validate all members of the ZIP archive ``archive_path`` against
+    ``cid_or_path`` without extracting them. Unlike :py:func:`validate`,
+    broken members do not stop the validation; instead the result of each
+    member is yielded in the order of the archive as tuple
+    ``(member_path, accepted_rows_count, error)`` where ``member_path`` has
+    the form ``archive.zip!member.csv`` and ``error`` is ``None`` if the
+    member is valid.
+
+    :param cid_or_path: :py:class:`cutplace.Cid` or :py:class:`str` \
+      describing a path pointing to a CID
+    :param str archive_path: path to the ZIP archive
+    :param jobs: number of members to validate in parallel; ``None`` means \
+      one for each CPU
+    :type: int or None
+    :raises cutplace.errors.DataFormatError: if ``archive_path`` is not a \
+      ZIP archive
+    :raises cutplace.errors.InterfaceError: on a broken CID
+    """
+    assert cid_or_path is not None
+    assert archive_path is not None
+    assert (jobs is None) or (jobs >= 1)
+
+    if isinstance(cid_or_path, six.string_types):
+        cid = interface.Cid(cid_or_path)
+    else:
+        cid = cid_or_path
+    member_paths = rowio.archive_member_paths(archive_path)
+    if (jobs == 1) or (len(member_paths) < 2):
+        for member_path in member_paths:
+            yield _validated_member(cid, member_path)
+    else:
+        pool = multiprocessing.Pool(jobs, _initialize_chunk_worker, (cid,))
+        try:
+            for member_result in pool.imap(_validated_member_task, member_paths):
+                yield member_result
+        finally:
+            pool.terminate()
+            pool.join()
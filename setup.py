@@ -28,6 +28,7 @@ from distutils.cmd import Command
 
 import versioneer
 import setuptools
+from setuptools.command.build_py import build_py as BuildPyCommand
 from setuptools.command.test import test as TestCommand
 from setuptools import setup
 
@@ -77,6 +78,12 @@ versioneer.versionfile_build = os.path.join(MAIN_PACKAGE, '_version.py')
 versioneer.tag_prefix = 'v'  # tags are like v1.2.0
 versioneer.parentdir_prefix = MAIN_PACKAGE + '-'
 
+# Modules that use syntax of Python 3.6 or later and consequently must
+# neither be installed nor byte compiled for earlier versions.
+PYTHON_36_MODULES = [
+    'async_validio'
+]
+
 
 class PyTest(TestCommand):
     user_options = [("cov=", None, "Run coverage"),
@@ -118,6 +125,16 @@ class PyTest(TestCommand):
         sys.exit(errno)
 
 
+class BuildPy(BuildPyCommand):
+    def find_package_modules(self, package, package_dir):
+        result = BuildPyCommand.find_package_modules(self, package, package_dir)
+        if sys.version_info < (3, 6):
+            result = [
+                (module_package, module, module_path) for module_package, module, module_path in result
+                if not (module_package == MAIN_PACKAGE and module in PYTHON_36_MODULES)]
+        return result
+
+
 def sphinx_builder():
     try:
         from sphinx.setup_command import BuildDoc
@@ -182,6 +199,7 @@ def read(fname):
 def setup_package():
     # Assemble additional setup commands
     cmdclass = versioneer.get_cmdclass()
+    cmdclass['build_py'] = BuildPy
     cmdclass['docs'] = sphinx_builder()
     cmdclass['doctest'] = sphinx_builder()
     cmdclass['test'] = PyTest
@@ -22,7 +22,10 @@ from __future__ import unicode_literals
 
 import logging
 import os
+import shutil
 import unittest
+import zipfile
+from contextlib import closing
 
 import six
 
@@ -106,6 +109,43 @@ class CutplaceProcessTest(unittest.TestCase):
         exit_code = applications.process(['test_can_validate_proper_csv', cid_path, csv_path])
         self.assertEqual(0, exit_code)
 
+    def test_can_validate_proper_csv_with_checkpoints(self):
+        cid_path = dev_test.path_to_test_cid('customers.xls')
+        csv_path = dev_test.path_to_test_result('customers_to_validate_with_checkpoints.csv')
+        shutil.copyfile(dev_test.path_to_test_data('valid_customers.csv'), csv_path)
+        exit_code = applications.process(
+            ['test_can_validate_proper_csv_with_checkpoints', '--checkpoint', '1', '--resume', cid_path, csv_path])
+        self.assertEqual(0, exit_code)
+
+    def test_can_validate_proper_csv_with_pipeline(self):
+        cid_path = dev_test.path_to_test_cid('customers.xls')
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        exit_code = applications.process(['test_can_validate_proper_csv_with_pipeline', '--pipeline', '4', cid_path, csv_path])
+        self.assertEqual(0, exit_code)
+
+    def test_can_validate_archive(self):
+        cid_path = dev_test.path_to_test_cid('customers.xls')
+        archive_path = dev_test.path_to_test_result('customers_to_validate.zip')
+        # HACK: Use ``closing()`` because of Python 2.6.
+        with closing(zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED)) as zip_archive:
+            zip_archive.write(dev_test.path_to_test_data('valid_customers.csv'), 'valid_customers.csv')
+        for jobs in ('1', '2'):
+            exit_code = applications.process(['test_can_validate_archive', '--jobs', jobs, cid_path, archive_path])
+            self.assertEqual(0, exit_code)
+            exit_code = applications.process(
+                ['test_can_validate_archive', cid_path, archive_path + '!valid_customers.csv'])
+            self.assertEqual(0, exit_code)
+
+    def test_fails_on_archive_with_broken_member(self):
+        cid_path = dev_test.path_to_test_cid('customers.xls')
+        archive_path = dev_test.path_to_test_result('broken_customers_to_validate.zip')
+        # HACK: Use ``closing()`` because of Python 2.6.
+        with closing(zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED)) as zip_archive:
+            zip_archive.write(dev_test.path_to_test_data('valid_customers.csv'), 'valid_customers.csv')
+            zip_archive.write(dev_test.path_to_test_data('broken_customers.csv'), 'broken_customers.csv')
+        exit_code = applications.process(['test_fails_on_archive_with_broken_member', cid_path, archive_path])
+        self.assertEqual(1, exit_code)
+
     def test_can_read_cid_with_plugins(self):
         cid_path = dev_test.path_to_test_cid('customers_with_plugins.ods')
         exit_code = applications.process(['test_can_read_cid_with_plugins', '--plugins', dev_test.path_to_test_plugins(),
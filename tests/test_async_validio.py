@@ -0,0 +1,167 @@
+"""
+Tests for :py:mod:`cutplace.async_validio`.
+"""
+# Copyright (C) 2009-2015 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import sys
+import unittest
+
+if sys.version_info >= (3, 6):
+    import asyncio
+    from cutplace import async_validio
+else:  # pragma: no cover
+    # Python before 3.6 cannot read rows asynchronously.
+    async_validio = None
+
+from cutplace import errors
+from cutplace import interface
+from tests import dev_test
+
+_EURO_SIGN = '\u20ac'
+
+_DIGIT_CID = interface.create_cid_from_string('\n'.join([
+    'd,format,delimited',
+    'd,encoding,utf-8',
+    'd,header,1',
+    'f,digit,,,1,Integer',
+    'f,text',
+]))
+
+
+class _AsyncStream(object):
+    """
+    Asynchronous stream providing ``data`` in pieces of at most
+    ``piece_size`` bytes or characters.
+    """
+    def __init__(self, data, piece_size=3):
+        self.name = 'async.csv'
+        self._data = data
+        self._piece_size = piece_size
+
+    def read(self, size):
+        assert size >= 1
+        piece_size = min(size, self._piece_size)
+        result = self._data[:piece_size]
+        self._data = self._data[piece_size:]
+        return asyncio.sleep(0, result)
+
+
+def _run(awaitable):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
+def _async_rows(reader):
+    """
+    All rows of ``reader`` collected without the need for ``async for``.
+    """
+    result = []
+    loop = asyncio.new_event_loop()
+    try:
+        rows = reader.rows()
+        is_at_end = False
+        while not is_at_end:
+            try:
+                result.append(loop.run_until_complete(rows.__anext__()))
+            except StopAsyncIteration:
+                is_at_end = True
+    finally:
+        loop.close()
+    return result
+
+
+@unittest.skipIf(async_validio is None, 'AsyncReader requires Python 3.6 or later')
+class AsyncReaderTest(unittest.TestCase):
+    def test_can_read_rows_from_bytes(self):
+        source_stream = _AsyncStream(('digit,text\n1,"a\nb"\r\n2,"c ""d"""\r3,' + _EURO_SIGN + '\n').encode('utf-8'))
+        reader = async_validio.AsyncReader(_DIGIT_CID, source_stream, batch_size=1)
+        self.assertEqual(
+            [['digit', 'text'], ['1', 'a\nb'], ['2', 'c "d"'], ['3', _EURO_SIGN]], _async_rows(reader))
+        self.assertEqual(4, reader.accepted_rows_count)
+        reader.close()
+
+    def test_can_read_rows_from_text(self):
+        source_stream = _AsyncStream('digit,text\n1,a\n2,b', 100)
+        with async_validio.AsyncReader(_DIGIT_CID, source_stream) as reader:
+            self.assertEqual([['digit', 'text'], ['1', 'a'], ['2', 'b']], _async_rows(reader))
+
+    def test_can_read_fixed_rows(self):
+        fixed_cid = interface.create_cid_from_string('\n'.join([
+            'd,format,fixed',
+            'd,line delimiter,none',
+            'f,digit,,,1,Integer',
+            'f,text,,,2',
+        ]))
+        with async_validio.AsyncReader(fixed_cid, _AsyncStream(b'1ab2cd3ef', 2)) as reader:
+            self.assertEqual([['1', 'ab'], ['2', 'cd'], ['3', 'ef']], _async_rows(reader))
+
+    def test_can_validate_rows(self):
+        with io.open(dev_test.path_to_test_data('valid_customers.csv'), 'rb') as csv_file:
+            source_stream = _AsyncStream(csv_file.read(), 17)
+        cid = interface.Cid(dev_test.path_to_test_cid('customers.ods'))
+        with async_validio.AsyncReader(cid, source_stream, batch_size=2) as reader:
+            _run(reader.validate_rows())
+        self.assertEqual(3, reader.accepted_rows_count)
+
+    def test_can_validate_many_rows_in_batches(self):
+        digits_data = 'digit,text\n' + ''.join('%d,%d\n' % (row_number % 10, row_number) for row_number in range(1000))
+        for batch_size, read_size in ((1, 1), (7, 100), (2000, async_validio.DEFAULT_READ_SIZE)):
+            source_stream = _AsyncStream(digits_data, read_size)
+            with async_validio.AsyncReader(_DIGIT_CID, source_stream, batch_size=batch_size) as reader:
+                _run(reader.validate_rows())
+            self.assertEqual(1001, reader.accepted_rows_count)
+
+    def test_can_read_quoted_field_spanning_many_reads(self):
+        long_text = '\r\n'.join('line "%d"' % line_number for line_number in range(100))
+        quoted_long_text = '"' + long_text.replace('"', '""') + '"'
+        source_stream = _AsyncStream('digit,text\r\n1,' + quoted_long_text + '\r\n2,"a\rb"\r3,c', 5)
+        with async_validio.AsyncReader(_DIGIT_CID, source_stream) as reader:
+            self.assertEqual(
+                [['digit', 'text'], ['1', long_text], ['2', 'a\rb'], ['3', 'c']], _async_rows(reader))
+
+    def test_fails_on_broken_field_at_row(self):
+        source_stream = _AsyncStream(b'digit,text\n1,"a\nb"\n2,c\nx,d\n')
+        with async_validio.AsyncReader(_DIGIT_CID, source_stream) as reader:
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.FieldValueError, "async.csv (R4C1): cannot accept field 'digit': *'x'",
+                _async_rows, reader)
+
+    def test_fails_on_broken_delimited_data_at_line(self):
+        source_stream = _AsyncStream(b'digit,text\n1,"a\nb"\n2,"c"d\n', 1)
+        with async_validio.AsyncReader(_DIGIT_CID, source_stream) as reader:
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.DataFormatError, 'async.csv (5): cannot parse delimited file: *', _async_rows, reader)
+
+    def test_can_yield_errors(self):
+        source_stream = _AsyncStream(b'digit,text\n1,a\nx,b\n3,c\n')
+        with async_validio.AsyncReader(_DIGIT_CID, source_stream, on_error='yield') as reader:
+            rows = _async_rows(reader)
+        self.assertEqual(['1', 'a'], rows[1])
+        dev_test.assert_error_fnmatches(self, rows[2], "async.csv (R3C1): cannot accept field 'digit': *'x'")
+        self.assertEqual(['3', 'c'], rows[3])
+        self.assertEqual(1, reader.rejected_rows_count)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -69,6 +69,19 @@ class _AbstractCheckTest(unittest.TestCase):
         location = errors.Location(self.test_can_check_empty_row, has_cell=True)
         check.check_row([], location)
 
+    def test_can_merge_stateless_check(self):
+        check = checks.AbstractCheck("test check", "", _TEST_FIELD_NAMES)
+        self.assertTrue(check.is_mergeable)
+        self.assertEqual([], check.merge_state(check.state()))
+
+    def test_fails_on_merging_check_with_state_but_without_merge_state(self):
+        class _CountCheck(checks.AbstractCheck):
+            def reset(self):
+                self.count = 0
+
+        check = _CountCheck("test check", "", _TEST_FIELD_NAMES)
+        self.assertFalse(check.is_mergeable)
+
 
 class IsUniqueCheckTest(_AbstractCheckTest):
     def test_fails_on_duplicate(self):
@@ -92,6 +105,36 @@ class IsUniqueCheckTest(_AbstractCheckTest):
         check.check_at_end(location)
         check.cleanup()
 
+    def test_fails_on_duplicate_in_merged_state(self):
+        field_names = _TEST_FIELD_NAMES
+        first_check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names)
+        second_check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names)
+        location = errors.Location(self.test_fails_on_duplicate_in_merged_state, has_cell=True)
+        first_check.check_row(_create_field_map(field_names, [38000, 23, "John", "Doe", "male", "08.03.1957"]), location)
+        location = errors.Location(self.test_fails_on_duplicate_in_merged_state, has_cell=True)
+        second_check.check_row(_create_field_map(field_names, [38000, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        location.advance_line()
+        second_check.check_row(_create_field_map(field_names, [38000, 23, "John", "Doe", "male", "08.03.1957"]), location)
+        self.assertTrue(first_check.is_mergeable)
+
+        merge_errors = first_check.merge_state(second_check.state(), 1)
+        self.assertEqual(1, len(merge_errors))
+        merge_error = merge_errors[0]
+        self.assertEqual(2, merge_error.location.line)
+        self.assertEqual(0, merge_error.see_also_location.line)
+
+    def test_can_keep_state_unchanged_by_further_rows(self):
+        field_names = _TEST_FIELD_NAMES
+        check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names)
+        location = errors.Location(self.test_can_keep_state_unchanged_by_further_rows, has_cell=True)
+        check.check_row(_create_field_map(field_names, [38000, 23, "John", "Doe", "male", "08.03.1957"]), location)
+        state = check.state()
+        location.advance_line()
+        check.check_row(_create_field_map(field_names, [38000, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        self.assertEqual(1, len(state))
+        check.reset()
+        self.assertEqual(1, len(state))
+
     def test_fails_on_rule_without_fields(self):
         field_names = _TEST_FIELD_NAMES
         self.assertRaises(errors.InterfaceError, checks.IsUniqueCheck, "test check", "", field_names)
@@ -139,6 +182,31 @@ class DistinctCountCheckTest(unittest.TestCase):
         check.check_row(_create_field_map(field_names, [38003, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
         self.assertRaises(errors.CheckError, check.check_at_end, location)
 
+    def test_fails_on_too_many_distinct_values_in_merged_state(self):
+        field_names = _TEST_FIELD_NAMES
+        first_check = checks.DistinctCountCheck("test check", "branch_id < 3", field_names)
+        second_check = checks.DistinctCountCheck("test check", "branch_id < 3", field_names)
+        location = errors.Location(self.test_fails_on_too_many_distinct_values_in_merged_state, has_cell=True)
+        first_check.check_row(_create_field_map(field_names, [38000, 23, "John", "Doe", "male", "08.03.1957"]), location)
+        first_check.check_row(_create_field_map(field_names, [38001, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        second_check.check_row(_create_field_map(field_names, [38001, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        self.assertEqual([], first_check.merge_state(second_check.state(), 2))
+        first_check.check_at_end(location)
+        second_check.reset()
+        second_check.check_row(_create_field_map(field_names, [38003, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        first_check.merge_state(second_check.state(), 3)
+        self.assertRaises(errors.CheckError, first_check.check_at_end, location)
+
+    def test_can_keep_state_unchanged_by_further_rows(self):
+        field_names = _TEST_FIELD_NAMES
+        check = checks.DistinctCountCheck("test check", "branch_id < 3", field_names)
+        location = errors.Location(self.test_can_keep_state_unchanged_by_further_rows, has_cell=True)
+        check.check_row(_create_field_map(field_names, [38000, 23, "John", "Doe", "male", "08.03.1957"]), location)
+        state = check.state()
+        check.check_row(_create_field_map(field_names, [38000, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        check.check_row(_create_field_map(field_names, [38001, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        self.assertEqual({38000: 1}, state)
+
     def test_fails_on_broken_check_rule(self):
         field_names = _TEST_FIELD_NAMES
         self.assertRaises(errors.InterfaceError, checks.DistinctCountCheck, "broken", "", field_names)
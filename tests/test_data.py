@@ -141,6 +141,18 @@ class DataFormatTest(unittest.TestCase):
         delimited_format.allowed_characters.validate('x', ord('a'))
         self.assertRaises(errors.RangeValueError, delimited_format.allowed_characters.validate, 'x', ord('*'))
 
+    def test_can_search_disallowed_characters(self):
+        delimited_format = data.DataFormat(data.FORMAT_DELIMITED)
+        self.assertEqual(None, delimited_format.disallowed_characters_regex)
+        delimited_format.set_property(data.KEY_ALLOWED_CHARACTERS, '...9, "-", "]"..."^", "a"..."z", 128...')
+        disallowed_characters_regex = delimited_format.disallowed_characters_regex
+        for allowed_text in ('', '\t', '-', ']^', 'az', '\u00e4\u20ac'):
+            self.assertEqual(None, disallowed_characters_regex.search(allowed_text), 'text=%r' % allowed_text)
+        for disallowed_text, expected_index in (('\n', 0), ('a_', 1), ('az[', 2), ('-.', 1), ('\x7f', 0), ('\\', 0)):
+            self.assertEqual(expected_index, disallowed_characters_regex.search(disallowed_text).start())
+        delimited_format.allowed_characters = None
+        self.assertEqual(None, delimited_format.disallowed_characters_regex)
+
     def test_fails_on_invalid_allowed_characters(self):
         delimited_format = data.DataFormat(data.FORMAT_DELIMITED)
         self.assertRaises(errors.InterfaceError, delimited_format.set_property, data.KEY_ALLOWED_CHARACTERS, '3..5')
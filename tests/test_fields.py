@@ -23,13 +23,16 @@ from __future__ import unicode_literals
 
 import decimal
 import logging
+import time
 import unittest
 
 import six
 
+from cutplace import _compat
 from cutplace import data
 from cutplace import errors
 from cutplace import fields
+from cutplace import ranges
 
 from tests import dev_test
 
@@ -45,6 +48,18 @@ def _create_german_decimal_format():
     return result
 
 
+def _scalar_rejected_values(field_format, values):
+    """
+    Same as ``field_format.rejected_values(values)`` but without NumPy.
+    """
+    numpy = fields.numpy
+    fields.numpy = None
+    try:
+        return field_format.rejected_values(values)
+    finally:
+        fields.numpy = numpy
+
+
 class AbstractFieldFormatTest(unittest.TestCase):
     """
     Test for base validation in `AbstractFieldFormatTest`.
@@ -77,6 +92,25 @@ class AbstractFieldFormatTest(unittest.TestCase):
         field_format = fields.AbstractFieldFormat('x', False, '3...5', '', _ANY_FORMAT)
         field_format.example = None
 
+    def test_can_find_invalid_value_index(self):
+        field_format = fields.TextFieldFormat('x', False, '2...3', '', _ANY_FORMAT)
+        self.assertEqual(None, field_format.invalid_value_index(['ab', 'abc', 'ab']))
+        self.assertEqual(2, field_format.invalid_value_index(['ab', 'abc', 'a', 'abcd']))
+        self.assertEqual(1, field_format.invalid_value_index(['ab', '', 'ab']))
+
+    def test_can_find_invalid_value_index_with_allowed_characters(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.set_property(data.KEY_ALLOWED_CHARACTERS, '"a"..."z"')
+        field_format = fields.TextFieldFormat('x', True, '', '', data_format)
+        self.assertEqual(None, field_format.invalid_value_index(['abc', '', 'xyz']))
+        self.assertEqual(1, field_format.invalid_value_index(['abc', 'aBc', 'B']))
+
+    def test_can_find_invalid_value_index_in_fixed_format(self):
+        field_format = fields.IntegerFieldFormat('x', True, '3', '', _FIXED_FORMAT)
+        self.assertEqual(None, field_format.invalid_value_index(['1  ', '   ', '123']))
+        self.assertEqual(1, field_format.invalid_value_index(['1  ', '1234', '123']))
+        self.assertEqual(2, field_format.invalid_value_index(['1  ', '   ', 'a  ']))
+
     def test_fails_on_invalid_character(self):
         data_format = data.DataFormat(data.FORMAT_DELIMITED)
         data_format.set_property(data.KEY_ALLOWED_CHARACTERS, '"a"..."c"')
@@ -121,6 +155,33 @@ class DateTimeFieldFormatTest(unittest.TestCase):
         field_format = fields.DateTimeFieldFormat("x", False, None, "%YYYY-MM-DD", _ANY_FORMAT)
         field_format.validated("%2000-01-01")
 
+    def test_can_parse_same_as_strptime(self):
+        values = [
+            '2000-01-01', '2000-02-29', '1900-02-29', '2015-13-01', '2015-1-2', '2015-01- 2', '2015-01-02x',
+            '2015-01-02 03:04:05', '2015-01-02  3:4:5', '2015-01-02 23:59:61', '2015-01-02 24:00:00', '15-01-02',
+            '69-12-31', '68-12-31', '1.2.', '29.02.', '30.02.', '01:02', '12:60', 't10', 'T10', '0000-01-01', '',
+        ]
+        for rule in ('YYYY-MM-DD', 'YYYY-MM-DD hh:mm:ss', 'YY-MM-DD', 'DD.MM.', 'hh:mm', 'Thh', '(YYYY)'):
+            field_format = fields.DateTimeFieldFormat('x', False, None, rule, _ANY_FORMAT)
+            for value in values + ['(%s)' % value for value in values]:
+                try:
+                    expected_result = time.strptime(value, field_format.strptimeFormat)
+                except ValueError:
+                    expected_result = None
+                self.assertEqual(expected_result, field_format._parsed(value), 'rule=%r, value=%r' % (rule, value))
+                if value:
+                    if expected_result is None:
+                        self.assertRaises(errors.FieldValueError, field_format.validated_value, value)
+                    else:
+                        for _ in range(2):
+                            self.assertEqual(expected_result, field_format.validated_value(value))
+
+    def test_can_validate_with_full_cache(self):
+        field_format = fields.DateTimeFieldFormat("x", False, None, "YYYY-MM-DD", _ANY_FORMAT)
+        for day in range(fields.DATE_TIME_CACHE_SIZE + 10):
+            date_text = time.strftime('%Y-%m-%d', time.gmtime(day * 24 * 60 * 60))
+            self.assertEqual(time.strptime(date_text, '%Y-%m-%d'), field_format.validated(date_text))
+
 
 class DecimalFieldFormatTest(unittest.TestCase):
     """
@@ -180,11 +241,76 @@ class DecimalFieldFormatTest(unittest.TestCase):
         field_format.decimal_separator = ","
         self.assertRaises(errors.FieldValueError, field_format.validated, "3000,300.234")
 
+    def test_fails_on_first_misplaced_separator_after_decimal_separator(self):
+        field_format = _create_german_decimal_format()
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.FieldValueError, "decimal field must contain only one decimal separator (','): '1,2,3.4'",
+            field_format.validated, '1,2,3.4')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.FieldValueError,
+            "decimal field must contain thousands separator (%s) only before *" % _compat.text_repr('.'),
+            field_format.validated, '1,2.3,4')
+
+    def test_can_validate_with_changed_separators(self):
+        field_format = fields.DecimalFieldFormat("x", False, None, "", _ANY_FORMAT)
+        self.assertEqual(decimal.Decimal('1234.5'), field_format.validated('1234.5'))
+        field_format.decimal_separator = ","
+        field_format.thousands_separator = "."
+        self.assertEqual(decimal.Decimal('1234.5'), field_format.validated('1.234,5'))
+        self.assertRaises(errors.FieldValueError, field_format.validated, '1,234.5')
+
+    def test_can_validate_values_outside_of_scaled_range(self):
+        field_format = fields.DecimalFieldFormat("x", False, None, "-1.5...2.25", _ANY_FORMAT)
+        self.assertEqual(decimal.Decimal('2.25'), field_format.validated('2.25'))
+        self.assertEqual(decimal.Decimal('2.250'), field_format.validated('2.250'))
+        self.assertEqual(decimal.Decimal('-1.5'), field_format.validated('-1.50'))
+        self.assertEqual(decimal.Decimal('1E-1'), field_format.validated('1E-1'))
+        self.assertRaises(errors.FieldValueError, field_format.validated, '2.251')
+        self.assertRaises(errors.FieldValueError, field_format.validated, '-1.6')
+
     def test_can_use_default_rule(self):
         field_format = fields.DecimalFieldFormat("x", False, None, "", _ANY_FORMAT)
         self.assertEqual(field_format.valid_range.upper_limit, decimal.Decimal('9999999999999999999.999999999999'))
         self.assertEqual(field_format.valid_range.lower_limit, decimal.Decimal('-9999999999999999999.999999999999'))
 
+    def test_can_reject_many_values(self):
+        field_format = _create_german_decimal_format()
+        field_format.valid_range = ranges.DecimalRange('-1.5...1000.25, 5000...')
+        values = set('%d,%02d' % (number // 100, number % 100) for number in range(-200, 200000, 7))
+        values.update(['1.000,25', '1.000,26', '-1,50', '-1,51', '5.000', '4999,99', '0,001', '1,2,3', 'x', '1e3'])
+        rejected_values = field_format.rejected_values(values)
+        self.assertEqual(_scalar_rejected_values(field_format, values), rejected_values)
+        self.assertTrue(set(['1.000,26', '-1,51', '4999,99', '1,2,3', 'x']).issubset(rejected_values))
+        self.assertFalse(set(['1.000,25', '-1,50', '5.000', '0,001', '1e3']) & rejected_values)
+
+
+    def test_can_validate_like_validated(self):
+        field_format = _create_german_decimal_format()
+        field_format.valid_range = ranges.DecimalRange('-1.5...1000.25, 5000...')
+        values = ['1.000,25', '1.000,26', '-1,50', '-1,51', '5.000', '4999,99', '0,001', '1,2,3', 'x', '1e3', '7']
+        for value in values:
+            try:
+                field_format.validated(value)
+                is_valid = True
+            except errors.FieldValueError:
+                is_valid = False
+            if is_valid:
+                field_format.validate(value)
+            else:
+                self.assertRaises(errors.FieldValueError, field_format.validate, value)
+
+    def test_can_validate_with_overridden_validated_value(self):
+        class PositiveDecimalFieldFormat(fields.DecimalFieldFormat):
+            def validated_value(self, value):
+                result = super(PositiveDecimalFieldFormat, self).validated_value(value)
+                if result <= 0:
+                    raise errors.FieldValueError('value must be positive: %s' % value)
+                return result
+
+        field_format = PositiveDecimalFieldFormat("x", False, None, "-10...10", _ANY_FORMAT)
+        field_format.validate('1')
+        self.assertRaises(errors.FieldValueError, field_format.validate, '-1')
+
 
 class IntegerFieldFormatTest(unittest.TestCase):
     """
@@ -210,6 +336,20 @@ class IntegerFieldFormatTest(unittest.TestCase):
         field_format = fields.IntegerFieldFormat("x", False, "1...3", '', _ANY_FORMAT)
         self.assertEqual(field_format.valid_range.items, [(-99, 999)])
 
+    def test_can_reject_values_out_of_range(self):
+        field_format = fields.IntegerFieldFormat("x", False, None, "1...10", _ANY_FORMAT)
+        self.assertEqual(set(), field_format.rejected_values(set(['1', '7', '10'])))
+        self.assertEqual(set(['0', 'a', '11']), field_format.rejected_values(set(['1', '0', 'a', '10', '11'])))
+
+    def test_can_reject_many_values_out_of_range(self):
+        field_format = fields.IntegerFieldFormat("x", False, None, "...-5, 3...10, 100...", _ANY_FORMAT)
+        values = set(six.text_type(number) for number in range(-1000, 1000))
+        values.update(['a', six.text_type(2 ** 70), six.text_type(-2 ** 70)])
+        rejected_values = field_format.rejected_values(values)
+        self.assertEqual(_scalar_rejected_values(field_format, values), rejected_values)
+        self.assertEqual(set(['a'] + [six.text_type(number) for number in list(range(-4, 3)) + list(range(11, 100))]),
+                         rejected_values)
+
     def test_can_validate_field_with_range_from_length(self):
         field_format = fields.IntegerFieldFormat("x", False, "2...2", "", _ANY_FORMAT)
         self.assertEqual(field_format.validated("-9"), -9)
@@ -321,6 +461,10 @@ class RegExFieldFormatTest(unittest.TestCase):
         field_format = fields.RegExFieldFormat("x", False, None, r"a.*", _ANY_FORMAT)
         self.assertRaises(errors.FieldValueError, field_format.validated, "xyz")
 
+    def test_can_reject_unmatched_values(self):
+        field_format = fields.RegExFieldFormat("x", False, None, r"a.*", _ANY_FORMAT)
+        self.assertEqual(set(['xyz']), field_format.rejected_values(set(['abc', 'xyz', 'Abc'])))
+
     def test_fails_on_broken_regex(self):
         try:
             fields.RegExFieldFormat("x", False, None, "*", _ANY_FORMAT)
@@ -346,6 +490,16 @@ class ChoiceFieldFormatTest(unittest.TestCase):
         field_format = fields.ChoiceFieldFormat("color", False, None, "red,green,blue", _ANY_FORMAT)
         self.assertRaises(errors.FieldValueError, field_format.validated, '')
 
+    def test_can_reject_values_not_in_choices(self):
+        field_format = fields.ChoiceFieldFormat("color", False, None, "red,green,blue", _ANY_FORMAT)
+        self.assertEqual(set(['yellow', 'Red']), field_format.rejected_values(set(['red', 'yellow', 'blue', 'Red'])))
+
+    def test_can_encode_choices(self):
+        field_format = fields.ChoiceFieldFormat("color", False, None, "red,green,blue", _ANY_FORMAT)
+        self.assertEqual(('red', 'green', 'blue'), field_format.code_table)
+        self.assertEqual(1, field_format.code_for('green'))
+        self.assertEqual(None, field_format.code_for('yellow'))
+
     def test_can_match_rule_embedded_in_blanks(self):
         field_format = fields.ChoiceFieldFormat("color", False, None, "red, green ,blue ", _ANY_FORMAT)
         self.assertEqual(field_format.validated("green"), "green")
@@ -394,6 +548,11 @@ class ConstantFieldFormatTest(unittest.TestCase):
     def test_can_match_constant_name(self):
         self.assertEqual(self._constant_format.validated('some'), 'some')
 
+    def test_can_encode_constant(self):
+        self.assertEqual(('some',), self._constant_format.code_table)
+        self.assertEqual(0, self._constant_format.code_for('some'))
+        self.assertEqual(None, self._constant_format.code_for('other'))
+
     def test_can_match_constant_string(self):
         self._constant_format = fields.ConstantFieldFormat('constant', False, None, '"some"', _ANY_FORMAT)
         self.assertEqual(self._constant_format.validated('some'), 'some')
@@ -461,6 +620,50 @@ class PatternFieldFormatTest(unittest.TestCase):
         self.assertRaises(errors.FieldValueError, field_format.validated, "hang")
 
 
+class _UncacheableFieldFormat(fields.TextFieldFormat):
+    is_cacheable = False
+
+
+class ValidationCacheTest(unittest.TestCase):
+    """
+    Tests for `ValidationCache`.
+    """
+    def test_can_cache_validated_values_and_errors(self):
+        field_format = fields.IntegerFieldFormat("x", False, None, "1...10", _ANY_FORMAT)
+        self.assertTrue(field_format.enable_validation_cache())
+        validation_cache = field_format.validation_cache
+        for _ in range(3):
+            self.assertEqual(7, field_format.validated('7'))
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.FieldValueError, 'value is 11 but must be within range: 1...10', field_format.validated, '11')
+        self.assertEqual(2, validation_cache.miss_count)
+        self.assertEqual(4, validation_cache.hit_count)
+        self.assertAlmostEqual(4 / 6, validation_cache.hit_rate)
+
+    def test_can_discard_least_recently_used_values(self):
+        validation_cache = fields.ValidationCache(2)
+        for value in ('a', 'b', 'a', 'c', 'a', 'b'):
+            self.assertEqual(value.upper(), validation_cache.validated(value, six.text_type.upper))
+        self.assertEqual(2, validation_cache.hit_count)
+        self.assertEqual(4, validation_cache.miss_count)
+
+    def test_can_disable_cache_with_poor_hit_rate(self):
+        validation_cache = fields.ValidationCache(sample_size=10, min_hit_rate=0.3)
+        for value in ['a', 'a', 'a', 'a'] + list('bcdefg'):
+            validation_cache.validated(value, six.text_type.upper)
+        self.assertTrue(validation_cache.is_enabled)
+        for value in 'ijklmnopqr':
+            validation_cache.validated(value, six.text_type.upper)
+        self.assertFalse(validation_cache.is_enabled)
+        self.assertEqual('A', validation_cache.validated('a', six.text_type.upper))
+        self.assertEqual(3, validation_cache.hit_count)
+
+    def test_ignores_uncacheable_field_format(self):
+        field_format = _UncacheableFieldFormat("x", False, None, "", _ANY_FORMAT)
+        self.assertFalse(field_format.enable_validation_cache())
+        self.assertEqual(None, field_format.validation_cache)
+
+
 if __name__ == '__main__':  # pragma: no cover
     logging.basicConfig()
     logging.getLogger("cutplace").setLevel(logging.INFO)
@@ -180,6 +180,43 @@ class RangeTest(unittest.TestCase):
         self.assertRaises(errors.RangeValueError, multi_range.validate, "x", 10)
         self.assertRaises(errors.RangeValueError, multi_range.validate, "x", 723)
 
+    def test_can_validate_with_many_unsorted_items(self):
+        descriptions = ("20...29, 1, ...-5, 3...4, 12...14, 40...", "7, 1...10, 13...15", "...3, 5...", "5, ...10, 20, 15...")
+        for description in descriptions:
+            many_range = ranges.Range(description)
+            for value in range(-10, 50):
+                is_expected_valid = any(
+                    ((lower is None) or (value >= lower)) and ((upper is None) or (value <= upper))
+                    for lower, upper in many_range.items)
+                if is_expected_valid:
+                    many_range.validate("x", value)
+                else:
+                    dev_test.assert_raises_and_fnmatches(
+                        self, errors.RangeValueError, "x is %d but must be within range: %s" % (value, many_range),
+                        many_range.validate, "x", value)
+
+    def test_can_reuse_parsed_range(self):
+        some_range = ranges.Range("1...4, 7")
+        other_range = ranges.Range("1...4, 7")
+        self.assertEqual(some_range.items, other_range.items)
+        other_range.items.append((5, 5))
+        self.assertEqual([(1, 4), (7, 7)], ranges.Range("1...4, 7").items)
+        other_range.validate("x", 7)
+        self.assertRaises(errors.RangeValueError, other_range.validate, "x", 5)
+        self.assertEqual(ranges.DecimalRange("1...4, 7").items, some_range.items)
+        self.assertTrue(isinstance(ranges.DecimalRange("1...4, 7").items[0][0], decimal.Decimal))
+
+    def test_can_forget_least_recently_used_range(self):
+        ranges.Range("1...4, 7")
+        for upper_limit in range(ranges.RANGE_CACHE_SIZE):
+            ranges.Range("1...4, 7")
+            ranges.Range("0...%d" % upper_limit)
+        cache_keys = list(ranges._range_cache_key_to_attributes_map.keys())
+        self.assertEqual(ranges.RANGE_CACHE_SIZE, len(cache_keys))
+        self.assertTrue((ranges.Range, "1...4, 7", None) in cache_keys)
+        self.assertFalse((ranges.Range, "0...0", None) in cache_keys)
+        self.assertEqual([(1, 4), (7, 7)], ranges.Range("1...4, 7").items)
+
     def test_can_create_range_from_length(self):
         self.assertEqual(ranges.create_range_from_length(ranges.Range("1...")).items, None)
         self.assertEqual(ranges.create_range_from_length(ranges.Range("1...1")).items, [(0, 9)])
@@ -20,11 +20,24 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import bz2
+import codecs
+import datetime
+import gzip
 import io
 import os
 import unittest
+import zipfile
+from contextlib import closing
+
+try:
+    import lzma
+except ImportError:  # pragma: no cover
+    lzma = None
 
 import six
+import xlrd
+import xlsxwriter
 
 from cutplace import data
 from cutplace import interface
@@ -36,6 +49,34 @@ from tests import dev_test
 _EURO_SIGN = '\u20ac'
 
 
+_ODS_CONTENT_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<office:document-content xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+    ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"'
+    ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">'
+    '<office:body><office:spreadsheet>%s</office:spreadsheet></office:body></office:document-content>')
+
+
+def _ods_table_xml(rows):
+    """
+    XML for an ODS table containing ``rows``, which are lists of cell texts.
+    """
+    row_xmls = []
+    for row in rows:
+        cell_xmls = ['<table:table-cell><text:p>%s</text:p></table:table-cell>' % cell for cell in row]
+        row_xmls.append('<table:table-row>%s</table:table-row>' % ''.join(cell_xmls))
+    return '<table:table>%s</table:table>' % ''.join(row_xmls)
+
+
+def _write_ods(ods_path, tables_xml):
+    """
+    Write a minimal ODS document to ``ods_path`` with content.xml
+    containing ``tables_xml`` as spreadsheet.
+    """
+    with closing(zipfile.ZipFile(ods_path, 'w', zipfile.ZIP_DEFLATED)) as ods_archive:
+        ods_archive.writestr('content.xml', (_ODS_CONTENT_TEMPLATE % tables_xml).encode('utf-8'))
+
+
 class _BaseRowsTest(unittest.TestCase):
     def _assert_rows_contain_data(self, rows):
         self.assertTrue(rows is not None)
@@ -61,6 +102,88 @@ class ExcelRowsTest(_BaseRowsTest):
                 _, excel_value, cutplace_value = row
                 self.assertEqual(cutplace_value, excel_value)
 
+    def _write_xlsx_with_two_sheets(self, test_name):
+        result = dev_test.path_to_test_result(test_name + '.xlsx')
+        workbook = xlsxwriter.Workbook(result)
+        try:
+            date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+            first_sheet = workbook.add_worksheet()
+            first_sheet.write_row(0, 0, ['a', 1, 1.5, True, '  b  '])
+            first_sheet.write_datetime(2, 0, datetime.datetime(2015, 4, 1, 12, 30), date_format)
+            first_sheet.write_formula(2, 1, '=1/0', None, '#DIV/0!')
+            first_sheet.write_blank(2, 7, None, date_format)
+            second_sheet = workbook.add_worksheet()
+            second_sheet.write(0, 0, 'second')
+        finally:
+            workbook.close()
+        return result
+
+    def test_can_read_xlsx_rows_like_xlrd(self):
+        xlsx_path = self._write_xlsx_with_two_sheets('excel_rows_like_xlrd')
+        with xlrd.open_workbook(xlsx_path) as book:
+            for sheet_index in range(book.nsheets):
+                sheet = book.sheet_by_index(sheet_index)
+                expected_rows = [
+                    [rowio._excel_cell_value(sheet.cell(y, x), book.datemode) for x in range(sheet.ncols)]
+                    for y in range(sheet.nrows)
+                ]
+                actual_rows = list(rowio.excel_rows(xlsx_path, sheet_index + 1, sheet.ncols))
+                self.assertEqual(expected_rows, actual_rows)
+
+    def test_can_ignore_formatted_empty_cells_at_end_of_xlsx_row_like_xlrd(self):
+        # The first sheet has a formatted blank cell in column H.
+        xlsx_path = self._write_xlsx_with_two_sheets('excel_rows_with_formatted_empty_cells')
+        with xlrd.open_workbook(xlsx_path) as book:
+            self.assertEqual(5, book.sheet_by_index(0).ncols)
+        self.assertEqual([5, 5, 5], [len(row) for row in rowio.excel_rows(xlsx_path)])
+
+    def test_can_ignore_formatted_empty_cells_within_dimension_like_xlrd(self):
+        xlsx_path = self._write_xlsx_with_two_sheets('excel_rows_with_formatted_empty_cells_and_cell_count')
+        self.assertEqual([5, 5, 5], [len(row) for row in rowio.excel_rows(xlsx_path, 1, 8)])
+        self.assertEqual([5, 3, 3], [len(row) for row in rowio.excel_rows(xlsx_path, 1, 3)])
+
+    def test_can_read_xlsx_rows_before_end_of_sheet(self):
+        xlsx_path = dev_test.path_to_test_result('excel_rows_with_broken_end.xlsx')
+        workbook = xlsxwriter.Workbook(xlsx_path)
+        try:
+            sheet = workbook.add_worksheet()
+            for row_index in range(100):
+                sheet.write_row(row_index, 0, ['a', row_index])
+        finally:
+            workbook.close()
+        with closing(zipfile.ZipFile(xlsx_path, 'r')) as xlsx_archive:
+            name_to_content_map = dict((name, xlsx_archive.read(name)) for name in xlsx_archive.namelist())
+        sheet_name = 'xl/worksheets/sheet1.xml'
+        sheet_xml = name_to_content_map[sheet_name]
+        name_to_content_map[sheet_name] = sheet_xml[:sheet_xml.index(b'</sheetData>')]
+        with closing(zipfile.ZipFile(xlsx_path, 'w')) as xlsx_archive:
+            for name, content in name_to_content_map.items():
+                xlsx_archive.writestr(name, content)
+
+        rows = rowio.excel_rows(xlsx_path, 1, 2)
+        self.assertEqual(['a', '0'], next(rows))
+        dev_test.assert_raises_and_fnmatches(self, errors.DataFormatError, '*: cannot read Excel file: *', list, rows)
+
+    def test_fails_on_non_existent_excel_sheet(self):
+        for excel_path in (
+                dev_test.path_to_test_data('valid_customers.xls'),
+                self._write_xlsx_with_two_sheets('excel_rows_for_non_existent_sheet')):
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.DataFormatError, '*: Excel document must contain at least 3 sheet(s) instead of just 2',
+                list, rowio.excel_rows(excel_path, 3))
+
+    def test_can_convert_xls_row_like_excel_cell_values(self):
+        cell_types = [
+            xlrd.XL_CELL_TEXT, xlrd.XL_CELL_NUMBER, xlrd.XL_CELL_NUMBER, xlrd.XL_CELL_NUMBER, xlrd.XL_CELL_NUMBER,
+            xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_DATE, xlrd.XL_CELL_BOOLEAN, xlrd.XL_CELL_ERROR]
+        cell_values = ['a', 1.0, 1.5, 0.0, -0.0, '', '', 42000.5, 1, 0x07]
+        expected_row = [
+            rowio._excel_cell_value(xlrd.sheet.Cell(cell_type, cell_value), 0)
+            for cell_type, cell_value in zip(cell_types, cell_values)]
+        number_to_text_map = {}
+        for _ in range(2):
+            self.assertEqual(expected_row, rowio._xls_row(cell_types, cell_values, 0, number_to_text_map))
+
     def test_fails_on_excel_from_csv(self):
         csv_path = dev_test.path_to_test_data('valid_customers.csv')
         try:
@@ -123,6 +246,76 @@ class OdsRowsTest(_BaseRowsTest):
             self.assertTrue(
                 'ODS must contain at least' in error_message, 'error_message=%r' % error_message)
 
+    def test_can_read_large_ods_sheet(self):
+        ods_path = dev_test.path_to_test_result('large_sheets.ods')
+        first_rows = [['a', 'b']] * 3
+        second_rows = [['%d' % row_number, 'x'] for row_number in range(20000)]
+        _write_ods(ods_path, _ods_table_xml(first_rows) + _ods_table_xml(second_rows))
+        self.assertEqual(first_rows, list(rowio.ods_rows(ods_path)))
+        self.assertEqual(second_rows, list(rowio.ods_rows(ods_path, 2)))
+
+    def test_can_read_ods_rows_before_broken_content_xml(self):
+        ods_path = dev_test.path_to_test_result('ods_with_broken_end.ods')
+        tables_xml = _ods_table_xml([['a', 'b']] * 3)
+        _write_ods(ods_path, tables_xml[:-len('</table:table>')] + '<broken>')
+        rows = rowio.ods_rows(ods_path)
+        self.assertEqual(['a', 'b'], next(rows))
+        dev_test.assert_raises_and_fnmatches(self, errors.DataFormatError, '*: cannot parse content.xml: *', list, rows)
+
+    def _write_ods_with_repeated_rows_and_cells(self, test_name):
+        result = dev_test.path_to_test_result(test_name + '.ods')
+        _write_ods(result, (
+            '<table:table>'
+            '<table:table-row table:number-rows-repeated="2">'
+            '<table:table-cell><text:p>a</text:p></table:table-cell>'
+            '<table:table-cell table:number-columns-repeated="2"/>'
+            '<table:table-cell table:number-columns-repeated="2"><text:p>b</text:p></table:table-cell>'
+            '<table:table-cell table:number-columns-repeated="16379"/>'
+            '</table:table-row>'
+            '<table:table-row table:number-rows-repeated="2"><table:table-cell table:number-columns-repeated="16384"/>'
+            '</table:table-row>'
+            '<table:table-row><table:table-cell><text:p>c</text:p></table:table-cell></table:table-row>'
+            '<table:table-row table:number-rows-repeated="1048570">'
+            '<table:table-cell table:number-columns-repeated="16384"/></table:table-row>'
+            '</table:table>'))
+        return result
+
+    def test_can_read_repeated_ods_rows_and_cells(self):
+        ods_path = self._write_ods_with_repeated_rows_and_cells('repeated_rows_and_cells')
+        rows = list(rowio.ods_rows(ods_path, cell_count=7))
+        self.assertEqual([
+            ['a', '', '', 'b', 'b', '', ''],
+            ['a', '', '', 'b', 'b', '', ''],
+            ['', '', '', '', '', '', ''],
+            ['', '', '', '', '', '', ''],
+            ['c'],
+        ], rows)
+
+    def test_can_keep_trailing_empty_ods_cells(self):
+        ods_path = self._write_ods_with_repeated_rows_and_cells('repeated_rows_and_cells_with_trailing_empty_cells')
+        rows = list(rowio.ods_rows(ods_path))
+        self.assertEqual([16384, 16384, 16384, 16384, 1], [len(row) for row in rows])
+        self.assertEqual(['a', '', '', 'b', 'b', ''], rows[0][:6])
+
+    def test_can_drop_trailing_empty_ods_rows_without_cell_count(self):
+        ods_path = dev_test.path_to_test_result('trailing_empty_rows.ods')
+        _write_ods(ods_path, (
+            '<table:table>'
+            '<table:table-row><table:table-cell><text:p>a</text:p></table:table-cell></table:table-row>'
+            '<table:table-row><table:table-cell/></table:table-row>'
+            '<table:table-row><table:table-cell><text:p>b</text:p></table:table-cell></table:table-row>'
+            '<table:table-row><table:table-cell/></table:table-row>'
+            '<table:table-row table:number-rows-repeated="3"><table:table-cell/></table:table-row>'
+            '</table:table>'))
+        self.assertEqual([['a'], [''], ['b']], list(rowio.ods_rows(ods_path)))
+
+    def test_fails_on_broken_ods_rows_repeated(self):
+        ods_path = dev_test.path_to_test_result('broken_number_rows_repeated.ods')
+        _write_ods(ods_path, '<table:table><table:table-row table:number-rows-repeated="0"/></table:table>')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, "*: table:number-rows-repeated is '0' but must be at least 1",
+            list, rowio.ods_rows(ods_path))
+
     def test_fails_on_ods_from_excel(self):
         excel_path = dev_test.path_to_test_data('valid_customers.xls')
         try:
@@ -274,6 +467,34 @@ class FixedRowsTest(_BaseRowsTest):
         self._fails_on_fixed_rows_from_stringio(
             'john', "*after field 'name' 3 characters must follow for: 'size'", data_format)
 
+    def _write_fixed_test_data(self, name, data_text):
+        result = dev_test.path_to_test_result(name + '.txt')
+        with io.open(result, 'w', encoding='cp1252', newline='') as fixed_stream:
+            fixed_stream.write(data_text)
+        return result
+
+    def test_can_read_fixed_rows_from_path_in_blocks(self):
+        _, field_names_and_lengths = FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height()
+        fixed_path = self._write_fixed_test_data(
+            'fixed_rows_from_path_in_blocks', 'john172\rmary163\nbill167\r\nj\u00e4ne184\r\nsepp163')
+        original_read_block_size = rowio._READ_BLOCK_SIZE
+        try:
+            for read_block_size in (1, 3, 7, 8, original_read_block_size):
+                rowio._READ_BLOCK_SIZE = read_block_size
+                rows = list(rowio.fixed_rows(fixed_path, 'cp1252', field_names_and_lengths, 'any'))
+                self.assertEqual(
+                    [['john', '172'], ['mary', '163'], ['bill', '167'], ['j\u00e4ne', '184'], ['sepp', '163']], rows)
+        finally:
+            rowio._READ_BLOCK_SIZE = original_read_block_size
+
+    def test_fails_on_fixed_rows_from_path_with_broken_line_delimiter(self):
+        _, field_names_and_lengths = FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height()
+        fixed_path = self._write_fixed_test_data(
+            'fixed_rows_from_path_with_broken_line_delimiter', 'hugo172\nsepp163\tjane184\n')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, r"*.txt (2;8): line delimiter is '\t' but must be one of: *",
+            list, rowio.fixed_rows(fixed_path, 'cp1252', field_names_and_lengths, 'any'))
+
     def test_can_read_fixed_rows_without_line_delimiter(self):
         data_format = data.DataFormat(data.FORMAT_FIXED)
         data_format.set_property(data.KEY_LINE_DELIMITER, 'none')
@@ -290,6 +511,450 @@ class AutoRowsTest(_BaseRowsTest):
         ods_path = dev_test.path_to_test_data('valid_customers.ods')
         self._assert_rows_contain_data(rowio.auto_rows(ods_path))
 
+    def test_can_auto_read_semicolon_delimited_rows(self):
+        with io.StringIO('id;name\n1;"Doe; John"\n2;Miller\n') as delimited_stream:
+            self.assertEqual([['id', 'name'], ['1', 'Doe; John'], ['2', 'Miller']], list(rowio.auto_rows(delimited_stream)))
+
+
+class SniffDataFormatTest(unittest.TestCase):
+    def _sniffed_data_format(self, target_name, data_bytes, sample_size=rowio.DEFAULT_SNIFF_SIZE):
+        data_path = dev_test.path_to_test_result(target_name)
+        with io.open(data_path, 'wb') as data_file:
+            data_file.write(data_bytes)
+        result = rowio.sniff_data_format(data_path, sample_size)
+        self.assertTrue(result.is_valid)
+        return result
+
+    def test_can_sniff_spreadsheet_formats(self):
+        self.assertEqual(data.FORMAT_ODS, rowio.sniff_data_format(dev_test.path_to_test_data('valid_customers.ods')).format)
+        self.assertEqual(
+            data.FORMAT_EXCEL, rowio.sniff_data_format(dev_test.path_to_test_data('valid_customers.xls')).format)
+
+    def test_can_sniff_customers(self):
+        data_format = rowio.sniff_data_format(dev_test.path_to_test_data('valid_customers.csv'))
+        self.assertEqual(data.FORMAT_DELIMITED, data_format.format)
+        self.assertEqual('utf-8', data_format.encoding)
+        self.assertEqual(',', data_format.item_delimiter)
+        self.assertEqual('"', data_format.quote_character)
+        self.assertEqual('"', data_format.escape_character)
+        self.assertEqual(0, data_format.header)
+
+        data_format = rowio.sniff_data_format(dev_test.path_to_test_data('valid_customers_with_header_iso-8859-15.csv'))
+        self.assertEqual('cp1252', data_format.encoding)
+        self.assertEqual(1, data_format.header)
+
+    def test_can_sniff_item_delimiter_and_header(self):
+        for item_delimiter in (';', '\t', '|'):
+            data_text = '\n'.join(item_delimiter.join(row) for row in [
+                ['id', 'name', 'height'],
+                ['1', 'Doe, John', '172'],
+                ['2', 'Miller, Jane', '168'],
+            ]) + '\n'
+            data_format = self._sniffed_data_format('sniff_item_delimiter.txt', data_text.encode('ascii'))
+            self.assertEqual(item_delimiter, data_format.item_delimiter)
+            self.assertEqual(1, data_format.header)
+
+    def test_can_sniff_quote_and_escape_character(self):
+        data_format = self._sniffed_data_format('sniff_backslash.csv', b'"a\\"b",1\n"c\\"d",2\n')
+        self.assertEqual('"', data_format.quote_character)
+        self.assertEqual('\\', data_format.escape_character)
+
+        data_format = self._sniffed_data_format('sniff_single_quote.csv', b"'a,b',1\n'c',2\n")
+        self.assertEqual("'", data_format.quote_character)
+
+    def test_can_sniff_encoding(self):
+        data_format = self._sniffed_data_format('sniff_bom.csv', codecs.BOM_UTF8 + 'a,b\n'.encode('utf-8'))
+        self.assertEqual('utf-8-sig', data_format.encoding)
+        data_format = self._sniffed_data_format('sniff_utf_16.csv', 'a,b\n'.encode('utf-16'))
+        self.assertEqual('utf-16', data_format.encoding)
+        data_format = self._sniffed_data_format('sniff_cp1252.csv', ('a,' + _EURO_SIGN + '\n').encode('cp1252'))
+        self.assertEqual('cp1252', data_format.encoding)
+        data_format = self._sniffed_data_format('sniff_latin1.csv', b'a,\x81\n')
+        self.assertEqual('iso-8859-1', data_format.encoding)
+
+    def test_can_sniff_only_start_of_data(self):
+        # Cut the sample in the middle of the euro sign; the broken row after it must not matter.
+        data_bytes = ('a,b\nc,' + _EURO_SIGN + '\n').encode('utf-8') + b'\xff;;;;;;\n'
+        data_format = self._sniffed_data_format('sniff_truncated.csv', data_bytes, len('a,b\nc,') + 1)
+        self.assertEqual('utf-8', data_format.encoding)
+        self.assertEqual(',', data_format.item_delimiter)
+
+
+def _write_compressed(source_path, compression, target_name):
+    """
+    Compress the data in ``source_path`` using ``compression`` and store
+    the result in the test result file ``target_name``.
+    """
+    result = dev_test.path_to_test_result(target_name)
+    if compression == 'bz2':
+        compressed_file_class = bz2.BZ2File
+    elif compression == 'gzip':
+        compressed_file_class = gzip.GzipFile
+    else:
+        assert compression == 'xz'
+        assert lzma is not None
+        compressed_file_class = lzma.LZMAFile
+    with io.open(source_path, 'rb') as source_file:
+        with closing(compressed_file_class(result, 'wb')) as compressed_file:
+            compressed_file.write(source_file.read())
+    return result
+
+
+class CompressedRowsTest(unittest.TestCase):
+    def setUp(self):
+        self._compressions = ['bz2', 'gzip']
+        if lzma is not None:
+            self._compressions.append('xz')
+
+    def test_can_detect_compression(self):
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        self.assertEqual(None, rowio.compression_of(csv_path))
+        for compression in self._compressions:
+            compressed_path = _write_compressed(csv_path, compression, 'customers_to_detect.csv.' + compression)
+            self.assertEqual(compression, rowio.compression_of(compressed_path))
+
+    def test_can_read_compressed_delimited_rows(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('customers.ods'))
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        expected_rows = list(rowio.delimited_rows(csv_path, cid.data_format))
+        for compression in self._compressions:
+            compressed_path = _write_compressed(csv_path, compression, 'customers_to_read.csv.' + compression)
+            self.assertEqual(expected_rows, list(rowio.delimited_rows(compressed_path, cid.data_format)))
+            self.assertEqual(expected_rows, list(rowio.auto_rows(compressed_path)))
+            self.assertEqual([], rowio.delimited_chunks(compressed_path, cid.data_format, 1)[1:])
+            self.assertEqual(None, rowio.build_row_index(compressed_path, cid.data_format))
+
+    def test_can_read_compressed_fixed_rows(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('customers_fixed.ods'))
+        fixed_path = dev_test.path_to_test_data('valid_customers_fixed.txt')
+        field_names_and_lengths = interface.field_names_and_lengths(cid)
+        # Use UTF-8 too so the rows are read from text instead of blocks.
+        for encoding in (cid.data_format.encoding, 'utf-8'):
+            expected_rows = list(rowio.fixed_rows(fixed_path, encoding, field_names_and_lengths))
+            for compression in self._compressions:
+                compressed_path = _write_compressed(fixed_path, compression, 'customers_to_read.txt.' + compression)
+                self.assertEqual(
+                    expected_rows, list(rowio.fixed_rows(compressed_path, encoding, field_names_and_lengths)))
+
+    def test_fails_on_broken_compressed_data(self):
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.validate()
+        for compression in self._compressions:
+            compressed_path = _write_compressed(csv_path, compression, 'broken_customers.csv.' + compression)
+            with io.open(compressed_path, 'rb') as compressed_file:
+                compressed_data = compressed_file.read()
+            with io.open(compressed_path, 'wb') as compressed_file:
+                compressed_file.write(compressed_data[:len(compressed_data) // 2])
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.DataFormatError, '*: cannot decompress %s data: *' % compression,
+                list, rowio.delimited_rows(compressed_path, data_format))
+
+
+def _write_archive(target_name, source_paths):
+    """
+    Store the files in ``source_paths`` in the ZIP archive stored in the
+    test result file ``target_name``.
+    """
+    result = dev_test.path_to_test_result(target_name)
+    # HACK: Use ``closing()`` because of Python 2.6.
+    with closing(zipfile.ZipFile(result, 'w', zipfile.ZIP_DEFLATED)) as zip_archive:
+        for source_path in source_paths:
+            zip_archive.write(source_path, os.path.basename(source_path))
+    return result
+
+
+class ArchiveRowsTest(unittest.TestCase):
+    def setUp(self):
+        self._csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        self._fixed_path = dev_test.path_to_test_data('valid_customers_fixed.txt')
+        self._archive_path = _write_archive('customers.zip', [self._csv_path, self._fixed_path])
+
+    def test_can_split_archive_member_path(self):
+        self.assertEqual(('x.zip', 'y.csv'), rowio.split_archive_member_path('x.zip!y.csv'))
+        self.assertEqual(('x.ZIP', 'a/y!z.csv'), rowio.split_archive_member_path('x.ZIP!a/y!z.csv'))
+        self.assertEqual(('x!y.csv', None), rowio.split_archive_member_path('x!y.csv'))
+        self.assertEqual(('x.zip', None), rowio.split_archive_member_path('x.zip'))
+
+    def test_can_list_archive_member_paths(self):
+        self.assertEqual(
+            [self._archive_path + '!valid_customers.csv', self._archive_path + '!valid_customers_fixed.txt'],
+            rowio.archive_member_paths(self._archive_path))
+
+    def test_can_read_archive_members(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('customers.ods'))
+        csv_member_path = self._archive_path + '!valid_customers.csv'
+        self.assertEqual(None, rowio.compression_of(csv_member_path))
+        self.assertEqual(
+            list(rowio.delimited_rows(self._csv_path, cid.data_format)),
+            list(rowio.delimited_rows(csv_member_path, cid.data_format)))
+
+        cid = interface.Cid(dev_test.path_to_test_cid('customers_fixed.ods'))
+        fixed_member_path = self._archive_path + '!valid_customers_fixed.txt'
+        field_names_and_lengths = interface.field_names_and_lengths(cid)
+        for encoding in (cid.data_format.encoding, 'utf-8'):
+            self.assertEqual(
+                list(rowio.fixed_rows(self._fixed_path, encoding, field_names_and_lengths)),
+                list(rowio.fixed_rows(fixed_member_path, encoding, field_names_and_lengths)))
+
+    def test_can_read_spreadsheet_archive_members(self):
+        ods_path = dev_test.path_to_test_data('valid_customers.ods')
+        xls_path = dev_test.path_to_test_data('valid_customers.xls')
+        xlsx_path = dev_test.path_to_test_result('valid_customers_for_archive.xlsx')
+        workbook = xlsxwriter.Workbook(xlsx_path)
+        try:
+            worksheet = workbook.add_worksheet()
+            for row_index, row in enumerate(rowio.excel_rows(xls_path)):
+                worksheet.write_row(row_index, 0, row)
+        finally:
+            workbook.close()
+        archive_path = _write_archive('spreadsheets.zip', [ods_path, xls_path, xlsx_path])
+
+        expected_ods_rows = list(rowio.ods_rows(ods_path))
+        self.assertNotEqual([], expected_ods_rows)
+        self.assertEqual(expected_ods_rows, list(rowio.ods_rows(archive_path + '!valid_customers.ods')))
+        for excel_path in (xls_path, xlsx_path):
+            expected_excel_rows = list(rowio.excel_rows(excel_path))
+            self.assertNotEqual([], expected_excel_rows)
+            excel_member_path = archive_path + '!' + os.path.basename(excel_path)
+            self.assertEqual(expected_excel_rows, list(rowio.excel_rows(excel_member_path)))
+
+    def test_fails_on_broken_spreadsheet_archive_member(self):
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, 'customers.zip!valid_customers.csv (*): cannot uncompress ODS spreadsheet: *',
+            list, rowio.ods_rows(self._archive_path + '!valid_customers.csv'))
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, "customers.zip!missing.xlsx (*): ZIP archive must contain member 'missing.xlsx'",
+            list, rowio.excel_rows(self._archive_path + '!missing.xlsx'))
+
+    def test_fails_on_missing_archive_member(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.validate()
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, "customers.zip!missing.csv (*): ZIP archive must contain member 'missing.csv'",
+            list, rowio.delimited_rows(self._archive_path + '!missing.csv', data_format))
+
+    def test_fails_on_broken_archive(self):
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, '*: cannot read ZIP archive: *', rowio.archive_member_paths, csv_path)
+
+
+class ChunksTest(unittest.TestCase):
+    def _rows_in_chunks(self, path, encoding, chunks, rows_from_stream, newline):
+        self.assertEqual(0, chunks[0][0])
+        self.assertEqual(os.path.getsize(path), chunks[-1][1])
+        result = []
+        previous_end = 0
+        for start, end in chunks:
+            self.assertEqual(previous_end, start)
+            with rowio.open_chunk(path, encoding, start, end, newline) as chunk_stream:
+                result.extend(rows_from_stream(chunk_stream))
+            previous_end = end
+        return result
+
+    def test_can_split_delimited_data_at_record_boundaries(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.set_property(data.KEY_HEADER, '1')
+        data_format.validate()
+        delimited_path = dev_test.path_to_test_result('test_can_split_delimited_data_at_record_boundaries.csv')
+        with io.open(delimited_path, 'w', encoding=data_format.encoding, newline='') as delimited_stream:
+            delimited_stream.write('id,text\n')
+            for row_number in range(1, 200):
+                delimited_stream.write('%d,"quoted ""text""\n,with line delimiter and comma"\r\n' % row_number)
+        expected_rows = list(rowio.delimited_rows(delimited_path, data_format))
+        for chunk_size in (1, 17, 100, 1000):
+            chunks = rowio.delimited_chunks(delimited_path, data_format, chunk_size)
+            self.assertTrue(len(chunks) >= 2, 'chunks=%s' % chunks)
+            actual_rows = self._rows_in_chunks(
+                delimited_path, data_format.encoding, chunks,
+                lambda chunk_stream: rowio.delimited_rows(chunk_stream, data_format), '')
+            self.assertEqual(expected_rows, actual_rows)
+
+    def test_can_split_delimited_data_with_escape_character(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.set_property(data.KEY_ESCAPE_CHARACTER, '\\')
+        data_format.validate()
+        delimited_path = dev_test.path_to_test_result('test_can_split_delimited_data_with_escape_character.csv')
+        with io.open(delimited_path, 'w', encoding=data_format.encoding, newline='') as delimited_stream:
+            for row_number in range(1, 100):
+                delimited_stream.write('%d,"escaped \\"quote\\"\n",escaped \\\n line delimiter\n' % row_number)
+        expected_rows = list(rowio.delimited_rows(delimited_path, data_format))
+        chunks = rowio.delimited_chunks(delimited_path, data_format, 50)
+        self.assertTrue(len(chunks) >= 2, 'chunks=%s' % chunks)
+        actual_rows = self._rows_in_chunks(
+            delimited_path, data_format.encoding, chunks,
+            lambda chunk_stream: rowio.delimited_rows(chunk_stream, data_format), '')
+        self.assertEqual(expected_rows, actual_rows)
+
+    def test_can_keep_delimited_data_with_multi_byte_encoding_in_single_chunk(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.set_property(data.KEY_ENCODING, 'utf-16')
+        data_format.validate()
+        delimited_path = dev_test.path_to_test_result('test_can_keep_delimited_data_in_single_chunk.csv')
+        with io.open(delimited_path, 'w', encoding=data_format.encoding, newline='') as delimited_stream:
+            delimited_stream.write('a,b\n' * 100)
+        self.assertEqual(
+            [(0, os.path.getsize(delimited_path))], rowio.delimited_chunks(delimited_path, data_format, 10))
+
+    def test_can_split_fixed_data_at_record_boundaries(self):
+        field_names_and_lengths = (('name', 4), ('size', 3))
+        fixed_path = dev_test.path_to_test_result('fixed_data_to_split_at_record_boundaries.txt')
+        with io.open(fixed_path, 'w', encoding='ascii', newline='') as fixed_stream:
+            for row_number in range(100):
+                fixed_stream.write('n%03d%03d\r\n' % (row_number, row_number))
+        expected_rows = list(rowio.fixed_rows(fixed_path, 'ascii', field_names_and_lengths))
+        chunks = rowio.fixed_chunks(fixed_path, 'ascii', field_names_and_lengths, 'any', 50)
+        self.assertTrue(len(chunks) >= 2, 'chunks=%s' % chunks)
+        actual_rows = self._rows_in_chunks(
+            fixed_path, 'ascii', chunks,
+            lambda chunk_stream: rowio.fixed_rows(chunk_stream, 'ascii', field_names_and_lengths), None)
+        self.assertEqual(expected_rows, actual_rows)
+
+
+class RowIndexTest(unittest.TestCase):
+    def _write_delimited_test_data(self, name, data_format):
+        result = dev_test.path_to_test_result(name + '.csv')
+        with io.open(result, 'w', encoding=data_format.encoding, newline='') as delimited_stream:
+            for row_number in range(100):
+                delimited_stream.write('%d,"text with\nline delimiter and ""quote"""\n' % row_number)
+        return result
+
+    def test_can_build_delimited_row_index(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.validate()
+        delimited_path = self._write_delimited_test_data('delimited_to_build_row_index_for', data_format)
+        expected_rows = list(rowio.delimited_rows(delimited_path, data_format))
+        index = rowio.build_row_index(delimited_path, data_format, step=7)
+        self.assertEqual(15, len(index.entries))
+        for row, offset, _ in index.entries:
+            with io.open(delimited_path, 'rb') as delimited_binary_stream:
+                delimited_binary_stream.seek(offset)
+                delimited_stream = io.TextIOWrapper(delimited_binary_stream, encoding=data_format.encoding, newline='')
+                self.assertEqual(expected_rows[row], next(rowio.delimited_rows(delimited_stream, data_format)))
+            with rowio.open_chunk(
+                    delimited_path, data_format.encoding, offset, os.path.getsize(delimited_path), '') as data_stream:
+                self.assertEqual(expected_rows[row:], list(rowio.delimited_rows(data_stream, data_format)))
+        self.assertEqual(index.entries[2], index.entry_for_row(20))
+        self.assertEqual(index.entries[-1], index.entry_for_row(1000))
+
+    def test_can_build_fixed_row_index(self):
+        data_format = data.DataFormat(data.FORMAT_FIXED)
+        data_format.validate()
+        field_names_and_lengths = (('name', 4), ('size', 3))
+        fixed_path = dev_test.path_to_test_result('fixed_to_build_row_index_for.txt')
+        with io.open(fixed_path, 'w', encoding=data_format.encoding, newline='') as fixed_stream:
+            for row_number in range(10):
+                fixed_stream.write('n%03d%03d\r\n' % (row_number, row_number))
+        index = rowio.build_row_index(fixed_path, data_format, field_names_and_lengths, 3)
+        self.assertEqual([(0, 0, 0), (3, 27, 3), (6, 54, 6), (9, 81, 9)], index.entries)
+
+    def test_can_keep_row_index_in_sidecar_file(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.validate()
+        delimited_path = self._write_delimited_test_data('delimited_to_keep_row_index_for', data_format)
+        index_path = rowio.row_index_path(delimited_path)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        index = rowio.row_index(delimited_path, data_format, step=10)
+        self.assertTrue(os.path.exists(index_path))
+        index_from_sidecar = rowio.row_index(delimited_path, data_format)
+        self.assertEqual(index.entries, index_from_sidecar.entries)
+        self.assertEqual(10, index_from_sidecar.step)
+
+        with io.open(delimited_path, 'a', encoding=data_format.encoding, newline='') as delimited_stream:
+            delimited_stream.write('100,"changed"\n')
+        changed_index = rowio.row_index(delimited_path, data_format)
+        self.assertEqual(rowio.DEFAULT_ROW_INDEX_STEP, changed_index.step)
+
+    def test_can_read_delimited_positioned_rows(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.validate()
+        delimited_path = self._write_delimited_test_data('delimited_to_read_positioned_rows_from', data_format)
+        self.assertTrue(rowio.is_positionable(delimited_path, data_format))
+        index = rowio.build_row_index(delimited_path, data_format, step=7)
+        rows_and_positions = list(rowio.positioned_rows(delimited_path, data_format, step=7))
+        self.assertEqual(list(rowio.delimited_rows(delimited_path, data_format)), [row for row, _ in rows_and_positions])
+        positions = [(0, 0)] + [position for _, position in rows_and_positions if position is not None]
+        self.assertEqual([(offset, line) for _, offset, line in index.entries], positions[:len(index.entries)])
+
+        row, offset, line = index.entries[3]
+        rows_after_offset = [row for row, _ in rowio.positioned_rows(delimited_path, data_format, offset=offset)]
+        self.assertEqual([row for row, _ in rows_and_positions[row:]], rows_after_offset)
+
+    def test_can_read_fixed_positioned_rows(self):
+        data_format = data.DataFormat(data.FORMAT_FIXED)
+        data_format.validate()
+        field_names_and_lengths = (('name', 4), ('size', 3))
+        fixed_path = dev_test.path_to_test_result('fixed_to_read_positioned_rows_from.txt')
+        with io.open(fixed_path, 'w', encoding=data_format.encoding, newline='') as fixed_stream:
+            for row_number in range(10):
+                fixed_stream.write('n%03d%03d\r\n' % (row_number, row_number))
+        positions = [
+            position for _, position in rowio.positioned_rows(fixed_path, data_format, field_names_and_lengths, 27, 3)]
+        self.assertEqual([None, None, (54, 3), None, None, (81, 6), None], positions)
+
+    def test_cannot_position_compressed_rows(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.validate()
+        compressed_path = dev_test.path_to_test_result('delimited_to_position.csv.gz')
+        with closing(gzip.GzipFile(compressed_path, 'wb')) as compressed_stream:
+            compressed_stream.write(b'1\n2\n')
+        self.assertFalse(rowio.is_positionable(compressed_path, data_format))
+
+    def test_fails_on_broken_row_index(self):
+        broken_index_path = dev_test.path_to_test_result('broken' + rowio.ROW_INDEX_SUFFIX)
+        with io.open(broken_index_path, 'w', encoding='utf-8') as broken_index_file:
+            broken_index_file.write('{"step": 1}')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, '*: cannot read row index: *', rowio.read_row_index, broken_index_path)
+
+
+class PipelinedRowsTest(unittest.TestCase):
+    def test_can_read_pipelined_rows(self):
+        expected_rows = [[six.text_type(row_number)] for row_number in range(1000)]
+        for batch_size, queue_depth in ((1, 1), (7, 2), (rowio.DEFAULT_PIPELINE_BATCH_SIZE, 16), (2000, 1)):
+            self.assertEqual(expected_rows, list(rowio.pipelined_rows(iter(expected_rows), batch_size, queue_depth)))
+        self.assertEqual([], list(rowio.pipelined_rows(iter([]))))
+
+    def test_fails_on_error_at_same_row(self):
+        def broken_rows():
+            for row_number in range(10):
+                yield [six.text_type(row_number)]
+            raise errors.DataFormatError('broken data', errors.Location('broken.csv'))
+
+        rows_read = []
+        try:
+            for row in rowio.pipelined_rows(broken_rows(), 3, 1):
+                rows_read.append(row)
+            self.fail('DataFormatError expected')
+        except errors.DataFormatError as error:
+            dev_test.assert_error_fnmatches(self, error, 'broken.csv (1): broken data')
+        self.assertEqual(10, len(rows_read))
+
+    def test_can_stop_pipelined_rows_early(self):
+        rows_read = []
+
+        def endless_rows():
+            try:
+                while True:
+                    yield ['x']
+            finally:
+                rows_read.append('closed')
+
+        pipelined_rows = rowio.pipelined_rows(endless_rows(), 2, 1)
+        self.assertEqual(['x'], next(pipelined_rows))
+        pipelined_rows.close()
+        self.assertEqual(['closed'], rows_read)
+
+    def test_can_read_pipelined_delimited_rows(self):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.validate()
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        self.assertEqual(
+            list(rowio.delimited_rows(csv_path, data_format)),
+            list(rowio.pipelined_rows(rowio.delimited_rows(csv_path, data_format), 2, 1)))
+
 
 class DelimitedRowWriterTest(unittest.TestCase):
     def test_can_write_delimited_data_to_string_io(self):
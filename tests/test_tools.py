@@ -20,7 +20,10 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import io
 import os.path
+import token
+import tokenize
 import unittest
 
 from cutplace import _tools
@@ -54,6 +57,30 @@ class ToolsTest(unittest.TestCase):
         self.assertRaises(NameError, _tools.validated_python_name, 'x', ' ')
         self.assertRaises(NameError, _tools.validated_python_name, 'x', 'a.b')
 
+    def test_can_tokenize_rules_like_tokenize(self):
+        for rule in (
+                '', '1\u20264', '-3.5e2\u2026', 'red, "green" ,blue ', "r'\\t', 0x1F", 'tab, 1000 ? $', 'a # b',
+                'count >= 3 and count != 7', '1...40', "'a'...'z'", '1_000', '.5:1.e3', 'x"y"', "'''a'''"):
+            expected_tokens = [
+                (toky[0], toky[1]) for toky in tokenize.generate_tokens(io.StringIO(rule).readline)
+                if ((toky[0] != token.INDENT) and toky[1].strip()) or (toky[0] == token.ENDMARKER)]
+            actual_tokens = [(toky[0], toky[1]) for toky in _tools.tokenize_without_space(rule)]
+            self.assertEqual(expected_tokens, actual_tokens)
+
+    def test_can_obtain_token_location(self):
+        self.assertEqual(
+            [((1, 1), (1, 4)), ((1, 4), (1, 5)), ((2, 0), (2, 1)), ((3, 0), (3, 0))],
+            [toky[2:] for toky in _tools.tokenize_without_space(' abc,\n1')])
+        self.assertEqual(
+            [((1, 1), (1, 4)), ((1, 4), (1, 5)), ((1, 6), (1, 7)), ((2, 0), (2, 0))],
+            [toky[2:] for toky in _tools.tokenize_without_space(' abc, 1')])
+
+    def test_fails_on_rule_with_unterminated_bracket(self):
+        tokens = _tools.tokenize_without_space('(a')
+        self.assertEqual('(', next(tokens)[1])
+        self.assertEqual('a', next(tokens)[1])
+        self.assertRaises(tokenize.TokenError, next, tokens)
+
     def test_can_build_human_readable_list(self):
         self.assertEqual(_tools.human_readable_list([]), '')
         self.assertEqual(_tools.human_readable_list(['a']), "'a'")
@@ -20,11 +20,21 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import gzip
 import io
+import itertools
+import json
+import os
 import unittest
+import zipfile
+from contextlib import closing
+
+import six
 
 from cutplace import interface
 from cutplace import errors
+from cutplace import fields
+from cutplace import rowio
 from cutplace import validio
 from tests import dev_test
 
@@ -196,6 +206,547 @@ class ReaderTest(unittest.TestCase):
                         "* (R3C1): cannot accept field 'digit': value must be an integer number: 'a'")
 
 
+class ParallelValidationTest(unittest.TestCase):
+    def _write_digits(self, test_name, broken_row_number=None):
+        result = dev_test.path_to_test_result(test_name + '.csv')
+        with io.open(result, 'w', encoding='ascii', newline='') as digits_stream:
+            for row_number in range(1, 1000):
+                digits_stream.write('x\n' if row_number == broken_row_number else '%d\n' % (row_number % 10))
+        return result
+
+    def test_can_validate_in_parallel(self):
+        digits_path = self._write_digits('test_can_validate_in_parallel')
+        with validio.Reader(_DIGIT_CID, digits_path) as reader:
+            reader.validate_rows(jobs=2, chunk_size=100)
+        self.assertEqual(999, reader.accepted_rows_count)
+        self.assertEqual(999, reader.location.line)
+
+    def test_can_continue_after_errors_in_parallel(self):
+        digits_path = self._write_digits('test_can_continue_after_errors_in_parallel', 500)
+        with validio.Reader(_DIGIT_CID, digits_path, on_error='continue') as reader:
+            reader.validate_rows(jobs=2, chunk_size=100)
+        self.assertEqual(998, reader.accepted_rows_count)
+        self.assertEqual(1, reader.rejected_rows_count)
+
+    def test_fails_on_broken_data_at_same_location_in_parallel(self):
+        digits_path = self._write_digits('test_fails_on_broken_data_at_same_location_in_parallel', 777)
+        with validio.Reader(_DIGIT_CID, digits_path) as reader:
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.FieldValueError, "* (R777C1): cannot accept field 'digit': *'x'",
+                reader.validate_rows, 2, 100)
+
+    def test_fails_on_duplicate_in_other_chunk_at_same_location_in_parallel(self):
+        cid = interface.Cid(dev_test.path_to_test_cid("icd_customers.xls"))
+        customers_path = dev_test.path_to_test_data("broken_customers_with_duplicates.csv")
+        with validio.Reader(cid, customers_path) as reader:
+            try:
+                reader.validate_rows()
+                self.fail()
+            except errors.CheckError as anticipated_error:
+                expected_message = six.text_type(anticipated_error)
+        with validio.Reader(cid, customers_path) as reader:
+            try:
+                reader.validate_rows(jobs=2, chunk_size=50)
+                self.fail()
+            except errors.CheckError as anticipated_error:
+                self.assertEqual(expected_message, six.text_type(anticipated_error))
+
+    def test_can_validate_checks_in_parallel(self):
+        cid = interface.Cid(dev_test.path_to_test_cid("icd_customers.xls"))
+        with validio.Reader(cid, dev_test.path_to_test_data("valid_customers.csv")) as reader:
+            reader.validate_rows(jobs=2, chunk_size=50)
+        self.assertTrue(reader.accepted_rows_count > 0)
+
+    def test_fails_on_broken_delimited_format_at_same_location_in_parallel(self):
+        digits_path = dev_test.path_to_test_result('test_fails_on_broken_delimited_format_in_parallel.csv')
+        with io.open(digits_path, 'w', encoding='ascii', newline='') as digits_stream:
+            digits_stream.write('1\n' * 500 + '"\n2\n')
+        with validio.Reader(_DIGIT_CID, digits_path) as reader:
+            try:
+                reader.validate_rows()
+                self.fail()
+            except errors.DataFormatError as anticipated_error:
+                expected_message = six.text_type(anticipated_error)
+        with validio.Reader(_DIGIT_CID, digits_path) as reader:
+            try:
+                reader.validate_rows(jobs=2, chunk_size=100)
+                self.fail()
+            except errors.DataFormatError as anticipated_error:
+                self.assertEqual(expected_message, six.text_type(anticipated_error))
+
+
+class RowRangeTest(unittest.TestCase):
+    def setUp(self):
+        self._digits_path = dev_test.path_to_test_result('digits_to_read_in_range.csv')
+        with io.open(self._digits_path, 'w', encoding='ascii', newline='') as digits_stream:
+            for row_number in range(1, 100):
+                digits_stream.write('x\n' if row_number == 77 else '%d\n' % (row_number % 10))
+        with validio.Reader(_DIGIT_CID, self._digits_path, on_error='yield') as reader:
+            self._all_rows = list(reader.rows())
+        rowio.row_index(self._digits_path, _DIGIT_CID.data_format, step=10)
+
+    def test_can_read_rows_in_range(self):
+        for start, stop in ((0, 5), (5, 25), (31, 31), (70, 76), (98, None), (200, None)):
+            with validio.Reader(_DIGIT_CID, self._digits_path) as reader:
+                self.assertEqual(self._all_rows[start:stop], list(reader.rows(start, stop)))
+
+    def test_can_read_rows_in_range_from_stream(self):
+        with io.open(self._digits_path, 'r', encoding='ascii', newline='') as digits_stream:
+            with validio.Reader(_DIGIT_CID, digits_stream) as reader:
+                self.assertEqual(self._all_rows[20:30], list(reader.rows(20, 30)))
+
+    def test_fails_on_broken_data_in_range_at_same_location(self):
+        with validio.Reader(_DIGIT_CID, self._digits_path) as reader:
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.FieldValueError, "* (R77C1): cannot accept field 'digit': *'x'",
+                list, reader.rows(72, 80))
+
+
+class CheckpointTest(unittest.TestCase):
+    def setUp(self):
+        self._digits_path = dev_test.path_to_test_result('digits_to_checkpoint.csv')
+        with io.open(self._digits_path, 'w', encoding='ascii', newline='') as digits_stream:
+            for row_number in range(1, 100):
+                digits_stream.write('x\n' if row_number in (33, 77) else '%d\n' % (row_number % 10))
+        self._checkpoint_path = self._digits_path + validio.CHECKPOINT_SUFFIX
+        if os.path.exists(self._checkpoint_path):
+            os.remove(self._checkpoint_path)
+        index_path = rowio.row_index_path(self._digits_path)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+    def _interrupt_after_row(self, reader, row_to_interrupt_after):
+        original_validate_row = reader.validate_row
+
+        def interrupting_validate_row(row):
+            if reader.location.line > row_to_interrupt_after:
+                raise KeyboardInterrupt()
+            original_validate_row(row)
+
+        reader.validate_row = interrupting_validate_row
+
+    def test_can_resume_interrupted_validation(self):
+        with validio.Reader(_DIGIT_CID, self._digits_path, on_error='continue') as reader:
+            reader.validate_rows()
+        expected_counts = (reader.accepted_rows_count, reader.rejected_rows_count)
+
+        with validio.Reader(_DIGIT_CID, self._digits_path, on_error='continue') as reader:
+            self._interrupt_after_row(reader, 55)
+            self.assertRaises(KeyboardInterrupt, reader.validate_rows, checkpoint_interval=10)
+        self.assertTrue(os.path.exists(self._checkpoint_path))
+
+        with validio.Reader(_DIGIT_CID, self._digits_path, on_error='continue') as reader:
+            reader.validate_rows(checkpoint_interval=10, resume=True)
+        self.assertEqual(expected_counts, (reader.accepted_rows_count, reader.rejected_rows_count))
+        self.assertEqual(99, reader.location.line)
+        self.assertFalse(os.path.exists(self._checkpoint_path))
+
+    def test_fails_on_broken_data_at_same_location_after_resume(self):
+        for _ in range(2):
+            with validio.Reader(_DIGIT_CID, self._digits_path) as reader:
+                dev_test.assert_raises_and_fnmatches(
+                    self, errors.FieldValueError, "* (R33C1): cannot accept field 'digit': *'x'",
+                    reader.validate_rows, 1, rowio.DEFAULT_CHUNK_SIZE, 10, True)
+            self.assertTrue(os.path.exists(self._checkpoint_path))
+
+    def test_can_resume_with_duplicates_found_after_checkpoint(self):
+        cid = interface.Cid(dev_test.path_to_test_cid("icd_customers.xls"))
+        customers_path = dev_test.path_to_test_result('customers_to_checkpoint.csv')
+        with io.open(dev_test.path_to_test_data("broken_customers_with_duplicates.csv"), 'rb') as source_stream:
+            with io.open(customers_path, 'wb') as customers_stream:
+                customers_stream.write(source_stream.read())
+        checkpoint_path = customers_path + validio.CHECKPOINT_SUFFIX
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        with validio.Reader(cid, customers_path) as reader:
+            try:
+                reader.validate_rows()
+                self.fail()
+            except errors.CheckError as anticipated_error:
+                expected_message = six.text_type(anticipated_error)
+
+        with validio.Reader(cid, customers_path) as reader:
+            self._interrupt_after_row(reader, 3)
+            self.assertRaises(KeyboardInterrupt, reader.validate_rows, checkpoint_interval=1)
+        self.assertTrue(os.path.exists(checkpoint_path))
+        with validio.Reader(cid, customers_path) as reader:
+            try:
+                reader.validate_rows(checkpoint_interval=1, resume=True)
+                self.fail()
+            except errors.CheckError as anticipated_error:
+                self.assertEqual(expected_message, six.text_type(anticipated_error))
+
+    def test_can_write_checkpoint_as_json_without_row_index(self):
+        with validio.Reader(_DIGIT_CID, self._digits_path, on_error='continue') as reader:
+            self._interrupt_after_row(reader, 55)
+            self.assertRaises(KeyboardInterrupt, reader.validate_rows, checkpoint_interval=10)
+        with io.open(self._checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+            checkpoint = json.loads(checkpoint_file.read())
+        self.assertEqual(50, checkpoint['row'])
+        self.assertEqual(49, checkpoint['accepted_rows_count'])
+        self.assertEqual(1, checkpoint['rejected_rows_count'])
+        self.assertFalse(os.path.exists(rowio.row_index_path(self._digits_path)))
+
+    def test_can_resume_from_first_row_with_broken_checkpoint(self):
+        for broken_checkpoint in ('[]', '{"identity": ', '"x"'):
+            with io.open(self._checkpoint_path, 'w', encoding='utf-8') as checkpoint_file:
+                checkpoint_file.write(broken_checkpoint)
+            with validio.Reader(_DIGIT_CID, self._digits_path, on_error='continue') as reader:
+                reader.validate_rows(checkpoint_interval=10, resume=True)
+            self.assertEqual(97, reader.accepted_rows_count)
+            self.assertEqual(2, reader.rejected_rows_count)
+
+    def test_can_resume_from_first_row_with_broken_check_state(self):
+        cid = interface.Cid(dev_test.path_to_test_cid("icd_customers.xls"))
+        customers_path = dev_test.path_to_test_result('customers_to_checkpoint.csv')
+        with io.open(dev_test.path_to_test_data("valid_customers.csv"), 'rb') as source_stream:
+            with io.open(customers_path, 'wb') as customers_stream:
+                customers_stream.write(source_stream.read())
+        checkpoint_path = customers_path + validio.CHECKPOINT_SUFFIX
+        with validio.Reader(cid, customers_path) as reader:
+            reader.validate_rows()
+        expected_accepted_rows_count = reader.accepted_rows_count
+        with validio.Reader(cid, customers_path) as reader:
+            self._interrupt_after_row(reader, 1)
+            self.assertRaises(KeyboardInterrupt, reader.validate_rows, checkpoint_interval=1)
+        with io.open(checkpoint_path, 'r', encoding='utf-8') as checkpoint_file:
+            checkpoint = json.loads(checkpoint_file.read())
+        for check_name in checkpoint['check_name_to_state_map']:
+            checkpoint['check_name_to_state_map'][check_name] = {'dict': [[{'tuple': ['x']}, 'broken']]}
+        with io.open(checkpoint_path, 'w', encoding='utf-8') as checkpoint_file:
+            checkpoint_file.write(six.text_type(json.dumps(checkpoint)))
+        with validio.Reader(cid, customers_path) as reader:
+            reader.validate_rows(checkpoint_interval=1, resume=True)
+        self.assertEqual(expected_accepted_rows_count, reader.accepted_rows_count)
+        self.assertFalse(os.path.exists(checkpoint_path))
+
+    def test_can_resume_without_checkpoint(self):
+        with validio.Reader(_DIGIT_CID, self._digits_path, on_error='continue') as reader:
+            reader.validate_rows(resume=True)
+        self.assertEqual(97, reader.accepted_rows_count)
+        self.assertEqual(2, reader.rejected_rows_count)
+
+
+class CompressedValidationTest(unittest.TestCase):
+    def test_fails_on_broken_compressed_data_at_same_location(self):
+        digits_path = dev_test.path_to_test_result('broken_digits.csv.gz')
+        with closing(gzip.GzipFile(digits_path, 'wb')) as digits_stream:
+            for row_number in range(1, 1000):
+                digits_stream.write(b'x\n' if row_number == 777 else b'1\n')
+        for jobs in (1, 2):
+            with validio.Reader(_DIGIT_CID, digits_path) as reader:
+                dev_test.assert_raises_and_fnmatches(
+                    self, errors.FieldValueError, "* (R777C1): cannot accept field 'digit': *'x'",
+                    reader.validate_rows, jobs, 100, 10)
+
+
+class RowBatchesTest(unittest.TestCase):
+    def test_can_read_row_batches(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('customers.ods'))
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        with validio.Reader(cid, csv_path) as reader:
+            expected_rows = list(reader.rows())
+        for size in (1, 2, len(expected_rows), 1000):
+            with validio.Reader(cid, csv_path) as reader:
+                batches = list(reader.row_batches(size))
+                self.assertEqual(len(expected_rows), reader.accepted_rows_count)
+                self.assertEqual(0, reader.rejected_rows_count)
+            self.assertTrue(all(len(batch) <= size for batch in batches))
+            self.assertEqual(expected_rows, [row for batch in batches for row in batch])
+
+    def test_fails_on_broken_row_in_batch(self):
+        with io.StringIO('1\n2\n3\na\n5\n') as partially_broken_data:
+            with validio.Reader(_DIGIT_CID, partially_broken_data) as reader:
+                batches = reader.row_batches(2)
+                self.assertEqual([['1'], ['2']], next(batches))
+                dev_test.assert_raises_and_fnmatches(
+                    self, errors.FieldValueError, "<io> (R4C1): cannot accept field 'digit': *'a'", next, batches)
+                self.assertEqual(3, reader.accepted_rows_count)
+
+    def test_can_yield_errors_in_batches(self):
+        with io.StringIO('1\na\n3\nb\n5\n') as partially_broken_data:
+            with validio.Reader(_DIGIT_CID, partially_broken_data, on_error='yield') as reader:
+                batches = list(reader.row_batches(2))
+                self.assertEqual(3, reader.accepted_rows_count)
+                self.assertEqual(2, reader.rejected_rows_count)
+        self.assertEqual(3, len(batches))
+        self.assertEqual(['1'], batches[0][0])
+        dev_test.assert_error_fnmatches(self, batches[0][1], "<io> (R2C1): cannot accept field 'digit': *'a'")
+        self.assertEqual(['5'], batches[2][0])
+
+    def test_can_skip_broken_rows_in_batches(self):
+        with io.StringIO('1\na\n3\n') as partially_broken_data:
+            with validio.Reader(_DIGIT_CID, partially_broken_data, on_error='continue') as reader:
+                self.assertEqual([[['1']], [['3']]], list(reader.row_batches(2)))
+
+
+class IncreasingNumberForTestFieldFormat(fields.AbstractFieldFormat):
+    """
+    Field format that accepts only numbers greater than the previous one,
+    so its outcome depends on more than just the value.
+    """
+    is_cacheable = False
+
+    def __init__(self, field_name, is_allowed_to_be_empty, length, rule, data_format):
+        super(IncreasingNumberForTestFieldFormat, self).__init__(
+            field_name, is_allowed_to_be_empty, length, rule, data_format)
+        self._previous_number = None
+
+    def validated_value(self, value):
+        number = int(value)
+        if (self._previous_number is not None) and (number <= self._previous_number):
+            raise errors.FieldValueError('number must increase: %d' % number)
+        self._previous_number = number
+        return number
+
+
+class ColumnValidationTest(unittest.TestCase):
+    _MIXED_CID = interface.create_cid_from_string('\n'.join([
+        'd,format,delimited',
+        'd,header,1',
+        'f,id,,,,Integer,1...99',
+        'f,color,,X,,Choice,"red, green"',
+        'f,code,,,2...3,Pattern,A*',
+        'f,note,,X',
+        'c,id must be unique,IsUnique,id',
+    ]))
+
+    def _assert_same_as_rows(self, data_text, validate_until=None):
+        with io.StringIO(data_text) as data_stream:
+            with validio.Reader(self._MIXED_CID, data_stream, on_error='yield', validate_until=validate_until) \
+                    as reader:
+                expected_rows = [six.text_type(row) for row in reader.rows()]
+        for size in (1, 2, 3, 1000):
+            with io.StringIO(data_text) as data_stream:
+                with validio.Reader(
+                        self._MIXED_CID, data_stream, on_error='yield', validate_until=validate_until,
+                        validation_engine='columnar') as reader:
+                    actual_rows = [six.text_type(row) for batch in reader.row_batches(size) for row in batch]
+            self.assertEqual(expected_rows, actual_rows)
+
+    def test_can_validate_columns_of_valid_rows(self):
+        self._assert_same_as_rows('id,color,code,note\n1,red,AB,x\n2,,ABC,\n3,green,Ax,y\n')
+
+    def test_can_report_same_errors_as_row_validation(self):
+        self._assert_same_as_rows('\n'.join([
+            'id,color,code,note',
+            '1,red,AB,x',
+            '2,blue,AB,',
+            'x,blue,B,',
+            '1,green,AB,',
+            '4,red,ABCD,',
+            '5,red',
+            '6,red,A,,',
+            '100,,AB,',
+            '7,,BB,',
+            '8,green,AB,z',
+        ]))
+
+    def test_can_report_same_errors_until_validate_until(self):
+        self._assert_same_as_rows('id,color,code,note\n1,red,AB,x\nx,blue,AB,\nx,blue,AB,\n', 2)
+
+    def test_can_validate_stateful_fields_row_by_row(self):
+        for validation_engine in ('row', 'columnar'):
+            cid = interface.create_cid_from_string('\n'.join([
+                'd,format,delimited',
+                'f,number,,,,IncreasingNumberForTest',
+            ]))
+            with io.StringIO('1\n2\n3\n2\n4\n') as data_stream:
+                with validio.Reader(cid, data_stream, validation_engine=validation_engine) as reader:
+                    dev_test.assert_raises_and_fnmatches(
+                        self, errors.FieldValueError, "<io> (R4C1): cannot accept field 'number': *must increase: 2",
+                        reader.validate_rows)
+
+    def test_can_count_rows_with_valid_fields(self):
+        with validio.Reader(_DIGIT_CID, io.StringIO('')) as reader:
+            self.assertEqual(0, reader.valid_fields_row_count([]))
+            self.assertEqual(2, reader.valid_fields_row_count([['1'], ['2']]))
+            self.assertEqual(1, reader.valid_fields_row_count([['1'], ['a'], ['3']]))
+            self.assertEqual(1, reader.valid_fields_row_count([['1'], ['2', '3'], ['a']]))
+            self.assertEqual(0, reader.valid_fields_row_count([[b'1'], ['2']]))
+
+
+class CompiledFieldsValidatorTest(unittest.TestCase):
+    def _assert_same_as_generic_validation(self, cid_lines, rows):
+        cid = interface.create_cid_from_string('\n'.join(cid_lines))
+        first_invalid_field = validio._compiled_fields_validator(cid)
+        with validio.Reader(cid, io.StringIO('')) as reader:
+            for row in rows:
+                try:
+                    reader._validate_fields(row)
+                    expected_is_valid = True
+                except errors.DataError as error:
+                    expected_is_valid = False
+                    expected_message = six.text_type(error)
+                invalid_field = first_invalid_field(row)
+                self.assertEqual(expected_is_valid, invalid_field is None, 'row=%r' % row)
+                if invalid_field is not None:
+                    # Validating only the fields starting with the invalid one must result in the same error.
+                    try:
+                        reader._validate_fields(row, *invalid_field)
+                        self.fail('row=%r' % row)
+                    except errors.DataError as error:
+                        self.assertEqual(expected_message, six.text_type(error))
+
+    def test_can_validate_inlined_fields(self):
+        self._assert_same_as_generic_validation([
+            'd,format,delimited',
+            'f,id,,,,Integer,"...-5, 0, 3...10, 100..."',
+            'f,color,,X,,Choice,"red, green"',
+            'f,code,,,2...3,Pattern,A*',
+            'f,kind,,,,RegEx,[kx]+',
+            'f,unit,,,,Constant,kg',
+            'f,note,,X,...3',
+        ], [
+            ['0', 'red', 'AB', 'k', 'kg', ''],
+            ['-7', '', 'ABC', 'kx', 'kg', 'abc'],
+            ['100', 'green', 'Ax', 'xk', 'kg', 'a'],
+            ['1', 'red', 'AB', 'k', 'kg', ''],
+            [' 7', 'red', 'AB', 'k', 'kg', ''],
+            ['x', 'red', 'AB', 'k', 'kg', ''],
+            ['', 'red', 'AB', 'k', 'kg', ''],
+            ['3', 'blue', 'AB', 'k', 'kg', ''],
+            ['3', 'red', 'B', 'k', 'kg', ''],
+            ['3', 'red', 'ABCD', 'k', 'kg', ''],
+            ['3', 'red', 'AB', 'y', 'kg', ''],
+            ['3', 'red', 'AB', 'k', 'g', ''],
+            ['3', 'red', 'AB', 'k', 'kg', 'abcd'],
+            ['3', 'red', 'AB', 'k', 'kg'],
+            ['3', 'red', 'AB', 'k', 'kg', '', ''],
+            [b'3', 'red', 'AB', 'k', 'kg', ''],
+        ])
+
+    def test_can_validate_other_fields(self):
+        self._assert_same_as_generic_validation([
+            'd,format,fixed',
+            'd,allowed characters,32...126',
+            'f,amount,,,5,Decimal,0...99.9',
+            'f,date,,X,10,DateTime,YYYY-MM-DD',
+            'f,id,,,3,Integer',
+        ], [
+            ['1.5  ', '2015-03-09', '1  '],
+            ['99.9 ', '          ', '123'],
+            ['100  ', '2015-03-09', '1  '],
+            ['1.5  ', '2015-13-09', '1  '],
+            ['1.5  ', '2015-03-09', '1234'],
+            ['1.5  ', '2015-03-09', '1\t '],
+        ])
+
+    def test_can_validate_without_fields_to_inline(self):
+        self._assert_same_as_generic_validation(['d,format,delimited', 'f,note'], [['a'], [''], [], ['a', 'b']])
+
+
+class ValidationCacheReaderTest(unittest.TestCase):
+    def test_can_read_rows_with_validation_cache(self):
+        cid = interface.create_cid_from_string(_DIGIT_CID_TEXT)
+        field_format = cid.field_formats[0]
+        self.assertTrue(field_format.enable_validation_cache())
+        with io.StringIO('1\n2\n1\nx\n1\nx\n') as data_stream:
+            with validio.Reader(cid, data_stream, on_error='yield') as reader:
+                rows = list(reader.rows())
+        self.assertEqual([['1'], ['2'], ['1']], rows[:3])
+        dev_test.assert_error_fnmatches(self, rows[3], "<io> (R4C1): cannot accept field 'digit': *'x'")
+        dev_test.assert_error_fnmatches(self, rows[5], "<io> (R6C1): cannot accept field 'digit': *'x'")
+        # Broken values are looked up only once even though the error is described by the generic validation.
+        self.assertEqual(3, field_format.validation_cache.hit_count)
+        self.assertEqual(3, field_format.validation_cache.miss_count)
+
+
+class DictionaryEncodingTest(unittest.TestCase):
+    _COLOR_CID = interface.create_cid_from_string('\n'.join([
+        'd,format,delimited',
+        'd,header,1',
+        'f,color,,X,,Choice,"red, green, blue"',
+        'f,kind,,,,Constant,paint',
+        'f,amount,,,,Integer',
+    ]))
+    _COLOR_DATA = 'color,kind,amount\ngreen,paint,1\nred,paint,2\n,paint,3\nyellow,paint,4\n'
+
+    def _rows(self, dictionary_encoding):
+        with io.StringIO(self._COLOR_DATA) as color_stream:
+            with validio.Reader(
+                    self._COLOR_CID, color_stream, on_error='continue',
+                    dictionary_encoding=dictionary_encoding) as reader:
+                rows = list(reader.rows())
+        with io.StringIO(self._COLOR_DATA) as color_stream:
+            with validio.Reader(
+                    self._COLOR_CID, color_stream, on_error='continue',
+                    dictionary_encoding=dictionary_encoding) as reader:
+                batch_rows = list(itertools.chain(*reader.row_batches(2)))
+                code_tables = reader.code_tables
+        return rows, batch_rows, code_tables
+
+    def test_can_read_coded_rows(self):
+        rows, batch_rows, code_tables = self._rows('code')
+        expected_rows = [['color', 'kind', 'amount'], [1, 0, '1'], [0, 0, '2'], ['', 0, '3']]
+        self.assertEqual(expected_rows, rows)
+        self.assertEqual(expected_rows, batch_rows)
+        self.assertEqual({'color': ('red', 'green', 'blue'), 'kind': ('paint',)}, code_tables)
+        self.assertEqual('green', code_tables['color'][rows[1][0]])
+
+    def test_can_read_interned_rows(self):
+        rows, batch_rows, code_tables = self._rows('intern')
+        self.assertEqual([['color', 'kind', 'amount'], ['green', 'paint', '1'], ['red', 'paint', '2']], rows[:3])
+        self.assertEqual(rows, batch_rows)
+        self.assertTrue(rows[1][1] is rows[2][1])
+        self.assertTrue(rows[1][0] is code_tables['color'][1])
+
+
+class PipelinedReaderTest(unittest.TestCase):
+    def test_can_validate_pipelined_rows(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('customers.ods'))
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        with validio.Reader(cid, csv_path) as reader:
+            expected_rows = list(reader.rows())
+        with validio.Reader(cid, csv_path, pipeline_queue_depth=1, pipeline_batch_size=2) as reader:
+            self.assertEqual(expected_rows, list(reader.rows()))
+            self.assertEqual(len(expected_rows), reader.accepted_rows_count)
+
+    def test_fails_on_broken_pipelined_rows_at_same_location(self):
+        digits_path = dev_test.path_to_test_result('broken_pipelined_digits.csv')
+        with io.open(digits_path, 'w', encoding='ascii', newline='') as digits_stream:
+            for row_number in range(1, 1000):
+                digits_stream.write('x\n' if row_number == 777 else '1\n')
+        with validio.Reader(_DIGIT_CID, digits_path, pipeline_queue_depth=2, pipeline_batch_size=10) as reader:
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.FieldValueError, "* (R777C1): cannot accept field 'digit': *'x'", reader.validate_rows)
+            self.assertEqual(776, reader.accepted_rows_count)
+
+
+class ArchiveValidationTest(unittest.TestCase):
+    def setUp(self):
+        self._archive_path = dev_test.path_to_test_result('digits.zip')
+        # HACK: Use ``closing()`` because of Python 2.6.
+        with closing(zipfile.ZipFile(self._archive_path, 'w', zipfile.ZIP_DEFLATED)) as zip_archive:
+            zip_archive.writestr('valid_digits.csv', '1\n2\n3\n')
+            zip_archive.writestr('broken_digits.csv', '1\nx\n3\n')
+            zip_archive.writestr('more_valid_digits.csv', '4\n5\n')
+
+    def test_can_validate_archive_member(self):
+        with validio.Reader(_DIGIT_CID, self._archive_path + '!valid_digits.csv') as reader:
+            reader.validate_rows(2)
+        self.assertEqual(3, reader.accepted_rows_count)
+
+    def test_fails_on_broken_archive_member_with_member_location(self):
+        with validio.Reader(_DIGIT_CID, self._archive_path + '!broken_digits.csv') as reader:
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.FieldValueError, "digits.zip!broken_digits.csv (R2C1): cannot accept field 'digit': *'x'",
+                reader.validate_rows)
+
+    def test_can_validate_archive(self):
+        for jobs in (1, 2):
+            member_results = list(validio.validate_archive(_DIGIT_CID, self._archive_path, jobs))
+            self.assertEqual(
+                [self._archive_path + '!' + member_name
+                 for member_name in ('valid_digits.csv', 'broken_digits.csv', 'more_valid_digits.csv')],
+                [member_path for member_path, _, _ in member_results])
+            self.assertEqual([3, 1, 2], [accepted_rows_count for _, accepted_rows_count, _ in member_results])
+            self.assertEqual(None, member_results[0][2])
+            dev_test.assert_error_fnmatches(
+                self, member_results[1][2], "digits.zip!broken_digits.csv (R2C1): cannot accept field 'digit': *'x'")
+            self.assertEqual(None, member_results[2][2])
+
+
 class WriterTest(unittest.TestCase):
     def setUp(self):
         standard_delimited_cid_text = '\n'.join([
@@ -251,6 +802,37 @@ class WriterTest(unittest.TestCase):
                         self, str(anticipated_error),
                         "* (R2C2): cannot accept field 'height': value must be an integer number: *'not_a_number'")
 
+    def test_can_write_delimited_batches(self):
+        with io.StringIO() as delimited_stream:
+            with validio.Writer(self._standard_delimited_cid, delimited_stream) as delimited_writer:
+                delimited_writer.write_batch([['Miller', '173', '1967-05-23'], ['Webster', '167', '1983-11-02']])
+                delimited_writer.write_batch([])
+                delimited_writer.write_batch([['Doe', '181', '1971-03-12']])
+                self.assertEqual(3, delimited_writer.location.line)
+            data_written = dev_test.unified_newlines(delimited_stream.getvalue())
+        self.assertEqual(
+            '%r' % 'Miller,173,1967-05-23\nWebster,167,1983-11-02\nDoe,181,1971-03-12\n', '%r' % data_written)
+
+    def test_fails_on_writing_batch_with_broken_field(self):
+        with io.StringIO() as delimited_stream:
+            with validio.Writer(self._standard_delimited_cid, delimited_stream) as delimited_writer:
+                delimited_writer.write_batch([['Miller', '173', '1967-05-23']])
+                dev_test.assert_raises_and_fnmatches(
+                    self, errors.FieldValueError,
+                    "* (R3C2): cannot accept field 'height': value must be an integer number: *'not_a_number'",
+                    delimited_writer.write_batch,
+                    [['Doe', '181', '1971-03-12'], ['Webster', 'not_a_number', '1983-11-02']])
+                self.assertEqual(1, delimited_writer.location.line)
+            data_written = dev_test.unified_newlines(delimited_stream.getvalue())
+        self.assertEqual('%r' % 'Miller,173,1967-05-23\n', '%r' % data_written)
+
+    def test_can_write_fixed_batch(self):
+        with io.StringIO() as fixed_stream:
+            with validio.Writer(self._standard_fixed_cid, fixed_stream) as fixed_writer:
+                fixed_writer.write_batch([['Miller', '173', '1967-05-23'], ['Webster', '7', '1983-11-02']])
+            data_written = dev_test.unified_newlines(fixed_stream.getvalue())
+        self.assertEqual('%r' % 'Miller    1731967-05-23\nWebster   7  1983-11-02\n', '%r' % data_written)
+
     def test_fails_on_error_after_header(self):
         cid_with_header_text = '\n'.join([
             'd,format,delimited',